@@ -22,15 +22,19 @@ https://casework.github.io/case/case-v0.1.0-natural-language-glossary.html
 NOTES ON FUNCTION STRUCTURE
 
     CASE objects:         Search "CREATE A CASE OBJECT" in the API (case.py) to understand the high-level CASE objects.
-    Parameters:           All parameters use underscores coming in and are set by default to a Missing object.
+    Parameters:           All parameters use underscores coming in and are set by default to _MISSING, the shared Missing object.
     Required parameters:  The CASE Document class is passed in ('_sub' functions also require their superseding CASE class).
     Ontology parameters:  All other parameters are specified by the CASE ontology, and may be required or optional.
     Function docstrings:  'Any number of' = must be a list (otherwise pass in a single Python object)
                           'Exactly one' or 'At least one' = required parameter
                           'At most one' = optional parameter
-    Body asserts:         1) superseding CASE class/type (if applicable)
-                          2) required parameters
-                          3) optional parameters 
+    Body asserts:         1) required parameters
+                          2) superseding CASE class/type (if applicable)
+                          3) optional parameters
+    Type checking:        Checks 2) and 3) above can be switched off by setting the environment variable
+                          CASE_NLG_VALIDATE=0, e.g. for bulk ingest of input already validated upstream.
+                          Any other value leaves them on. They are also off under python -O.
+                          Required parameters are always enforced.
     Return:               The desired object is instantiated and parameters converted to CamelCase for JSON-LD output.
 
     See examples/NLG_template.txt for a list of all instances of function definitions, docstrings, and assert statements found in the NLG.
@@ -50,20 +54,104 @@ If you wish to contribute to improvement, follow these note-taking standards to
 
 
 import case
+import os
 import sys
-import unittest
 import datetime
 
+# Module-level aliases so the checks below resolve these with one global lookup instead of two.
+_CoreObject = case.CoreObject
+_DuckObject = case.DuckObject
+_PropertyBundle = case.PropertyBundle
+_datetime = datetime.datetime
+
+try:
+    _intern = sys.intern
+except AttributeError:
+    _intern = intern  # Python 2
+
+try:
+    _INTEGER_TYPES = (int, long)  # Python 2
+except NameError:
+    _INTEGER_TYPES = (int,)
+
 class Missing(object):
-    def __init__(self):
-        self.is_missing = True
+    __slots__ = ()
+    is_missing = True
+    _instance = None
+
+    def __new__(cls):
+        # Every Missing() is the same object, so an explicit Missing() passed by a caller is still
+        # recognised by the identity tests against _MISSING.
+        if Missing._instance is None:
+            Missing._instance = super(Missing, cls).__new__(cls)
+        return Missing._instance
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__  # Python 2
+
+    def __repr__(self):
+        return '<MISSING>'
+
+# The single default shared by every optional parameter; test for it by identity ("is _MISSING").
+_MISSING = Missing()
+
+# CASE types that checks compare .type against. case.py interns .type, so a match is found by identity.
+_TAG_ACTION = _intern('Action')
+_TAG_ALTERNATE_DATA_STREAM = _intern('AlternateDataStream')
+_TAG_ARRAY_OF_OBJECT = _intern('ArrayOfObject')
+_TAG_BUILD_CONFIGURATION_TYPE = _intern('BuildConfigurationType')
+_TAG_BUILD_INFORMATION_TYPE = _intern('BuildInformationType')
+_TAG_BUILD_UTILITY_TYPE = _intern('BuildUtilityType')
+_TAG_COMPILER_TYPE = _intern('CompilerType')
+_TAG_CONFIGURATION_SETTING_TYPE = _intern('ConfigurationSettingType')
+_TAG_CONTROLLED_DICTIONARY = _intern('ControlledDictionary')
+_TAG_CONTROLLED_DICTIONARY_ENTRY = _intern('ControlledDictionaryEntry')
+_TAG_CONTROLLED_VOCABULARY = _intern('ControlledVocabulary')
+_TAG_DEPENDENCY_TYPE = _intern('DependencyType')
+_TAG_DICTIONARY = _intern('Dictionary')
+_TAG_DICTIONARY_ENTRY = _intern('DictionaryEntry')
+_TAG_GLOBAL_FLAG_TYPE = _intern('GlobalFlagType')
+_TAG_HASH = _intern('Hash')
+_TAG_IDENTITY = _intern('Identity')
+_TAG_I_COM_HANDLER_ACTION_TYPE = _intern('IComHandlerActionType')
+_TAG_I_EXEC_ACTION_TYPE = _intern('IExecActionType')
+_TAG_I_SHOW_MESSAGE_ACTION_TYPE = _intern('IShowMessageActionType')
+_TAG_LIBRARY_TYPE = _intern('LibraryType')
+_TAG_LOCATION = _intern('Location')
+_TAG_MARKING_DEFINITION = _intern('MarkingDefinition')
+_TAG_MARKING_MODEL = _intern('MarkingModel')
+_TAG_MIME_PART_TYPE = _intern('MIMEPartType')
+_TAG_TASK_ACTION_TYPE = _intern('TaskActionType')
+_TAG_TRACE = _intern('Trace')
+_TAG_TRIGGER_TYPE = _intern('TriggerType')
+_TAG_WHO_IS_CONTACT_TYPE = _intern('WhoIsContactType')
+_TAG_WHO_IS_REGISTRAR_INFO_TYPE = _intern('WhoIsRegistrarInfoType')
+_TAG_WINDOWS_PE_OPTIONAL_HEADER = _intern('WindowsPEOptionalHeader')
+_TAG_WINDOWS_PE_SECTION = _intern('WindowsPESection')
+_TAG_WINDOWS_REGISTRY_HIVE = _intern('WindowsRegistryHive')
+_TAG_X509_V3_EXTENSIONS = _intern('X509V3Extensions')
+
+# Whether type checks run; see "Type checking" in the notes above. Only an explicit '0' turns them off.
+_VALIDATE = __debug__ and os.environ.get('CASE_NLG_VALIDATE', '1') != '0'
+
+
+def _present(**properties):
+    # type: (**object) -> dict
+    '''
+    Drops the properties left as _MISSING so only supplied values are passed on to the graph.
+    :return: A dict of the supplied properties.
+    '''
+
+    return {key: value for key, value in properties.items() if value is not _MISSING}
 
 
 #====================================================
 #-- CORE IN ALPHABETICAL ORDER
 
-def core_Action(uco_document, action_status=Missing(), start_time=Missing(), end_time=Missing(), errors=Missing(),
-                action_count=Missing(), subaction_refs=Missing(), **kwargs):
+def core_Action(uco_document, action_status=_MISSING, start_time=_MISSING, end_time=_MISSING, errors=_MISSING,
+                action_count=_MISSING, subaction_refs=_MISSING, **kwargs):
     '''
     :param ActionStatus: At most one occurrence of type ControlledVocabulary.
     :param StartTime: At most one value of type Datetime.
@@ -74,27 +162,27 @@ def core_Action(uco_document, action_status=Missing(), start_time=Missing(), end
     :return: A CoreObject object.
     '''
 
-    if not isinstance(action_status, Missing):
-        assert (isinstance(action_status, case.CoreObject) and (action_status.type=='ControlledVocabulary')),\
-        "[core_Action] action_status must be of type ControlledVocab."
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[core_Action] start_time must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[core_Action] end_time must be of type Datetime."
-    #NOCHECK:errors
-    if not isinstance(action_count, Missing):
-        assert (isinstance(action_count, int) and (action_count > 0)),\
-        "[core_Action] action_count must be of type Int and positive."
-    if not isinstance(subaction_refs, Missing):
-        assert isinstance(subaction_refs, list),\
-        "[core_Action] subaction_refs must be of type List of Action."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Action') for i in subaction_refs),\
-        "[core_Action] subaction_refs must be of type List of Action."
-
-    return uco_document.create_CoreObject('Action', ActionStatus=action_status, StartTime=start_time, EndTime=end_time,
-                                          Errors=errors, ActionCount=action_count, SubactionRefs=subaction_refs)
+    if _VALIDATE:
+        if action_status is not _MISSING:
+            _check_instance_of(action_status, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[core_Action] action_status must be of type ControlledVocab.")
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[core_Action] start_time must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[core_Action] end_time must be of type Datetime."
+        #NOCHECK:errors
+        if action_count is not _MISSING:
+            assert _is_positive_integer(action_count),\
+            "[core_Action] action_count must be of type Int and positive."
+        if subaction_refs is not _MISSING:
+            _check_list_of(subaction_refs, _CoreObject, _TAG_ACTION,
+                           "[core_Action] subaction_refs must be of type List of Action.")
+
+    properties = _present(ActionStatus=action_status, StartTime=start_time, EndTime=end_time, Errors=errors,
+                          ActionCount=action_count, SubactionRefs=subaction_refs)
+    return uco_document.create_CoreObject('Action', **properties)
 
 
 def core_Assertion(uco_document):
@@ -117,8 +205,8 @@ def core_Bundle(uco_document):
     return uco_document.create_CoreObject('Bundle')
 
 
-def core_ControlledVocabulary(uco_document, value=Missing(), constraining_vocabulary_name=Missing(),
-                              constraining_vocabulary_ref=Missing(), **kwargs):
+def core_ControlledVocabulary(uco_document, value=_MISSING, constraining_vocabulary_name=_MISSING,
+                              constraining_vocabulary_ref=_MISSING, **kwargs):
     '''
     :param Value: Exactly one value of type String.
     :param ConstrainingVocabularyName: At most one value of type String.
@@ -126,20 +214,21 @@ def core_ControlledVocabulary(uco_document, value=Missing(), constraining_vocabu
     :return: A CoreObject object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[core_ControlledVocabulary] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(value, "[core_ControlledVocabulary] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
         "[core_ControlledVocabulary] value must be of type String."
 
-    if not isinstance(constraining_vocabulary_name, Missing):
-        assert isinstance(constraining_vocabulary_name, str),\
-        "[core_ControlledVocabulary] constraining_vocabulary_name must be of type URI."
+        if constraining_vocabulary_name is not _MISSING:
+            assert (type(constraining_vocabulary_name) is str or isinstance(constraining_vocabulary_name, str)),\
+            "[core_ControlledVocabulary] constraining_vocabulary_name must be of type URI."
+
     #TODO:URI
 
-    return uco_document.create_CoreObject('ControlledVocabulary', Value=value,
-                                          ConstrainingVocabularyName=constraining_vocabulary_name,
-                                          ConstrainingVocabularyRef=constraining_vocabulary_ref)
+    properties = _present(Value=value, ConstrainingVocabularyName=constraining_vocabulary_name,
+                          ConstrainingVocabularyRef=constraining_vocabulary_ref)
+    return uco_document.create_CoreObject('ControlledVocabulary', **properties)
 
 
 def core_Identity(uco_document):
@@ -162,30 +251,29 @@ def core_Location(uco_document):
     return uco_document.create_CoreObject('Location')
 
 
-def core_MarkingDefinition(uco_document, definition_type=Missing(), definition=Missing()):
+def core_MarkingDefinition(uco_document, definition_type=_MISSING, definition=_MISSING):
     '''
     :param DefinitionType: Exactly one value of type String.
     :param Definition: Any number of occurrences of type MarkingModel.
     :return: A CoreObject object.
     '''
 
-    assert not isinstance(definition_type, Missing),\
-    "[core_MarkingDefinition] defintion_type is required."
-    if not isinstance(definition_type, Missing):
-        assert isinstance(definition_type, str),\
+    _require(definition_type, "[core_MarkingDefinition] defintion_type is required.")
+
+    if _VALIDATE:
+        assert (type(definition_type) is str or isinstance(definition_type, str)),\
         "[core_MarkingDefinition] definition_type must be of type String."
 
-    if not isinstance(definition, Missing):
-        assert isinstance(definition, list),\
-        "[core_MarkingDefinition] definition must be of type List of MarkingModel."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='MarkingModel') for i in definition),\
-        "[core_MarkingDefinition] definition must be of type List of MarkingModel."
+        if definition is not _MISSING:
+            _check_list_of(definition, _DuckObject, _TAG_MARKING_MODEL,
+                           "[core_MarkingDefinition] definition must be of type List of MarkingModel.")
 
-    return uco_document.create_CoreObject('MarkingDefinition', DefinitionType=definition_type, Definition=definition)
+    properties = _present(DefinitionType=definition_type, Definition=definition)
+    return uco_document.create_CoreObject('MarkingDefinition', **properties)
 
 
-def core_Relationship(uco_document, is_directional=Missing(), target_ref=Missing(), source_ref=Missing(),
-                      start_time=Missing(), end_time=Missing(), kind_of_relationship=Missing()):
+def core_Relationship(uco_document, is_directional=_MISSING, target_ref=_MISSING, source_ref=_MISSING,
+                      start_time=_MISSING, end_time=_MISSING, kind_of_relationship=_MISSING):
     '''
     :param IsDirectional: Exactly one value of type Bool.
     :param TargetRef: Exactly one ocurrence of type CoreObject.
@@ -196,41 +284,31 @@ def core_Relationship(uco_document, is_directional=Missing(), target_ref=Missing
     :return: A CoreObject object.
     '''
 
-    assert not isinstance(is_directional, Missing),\
-    "[core_Relationship] is_directional is required."
-    if not isinstance(is_directional, Missing):
-        assert isinstance(is_directional, bool),\
+    _require(is_directional, "[core_Relationship] is_directional is required.")
+    _require(target_ref, "[core_Relationship] target_ref is required.")
+    _require(source_ref, "[core_Relationship] source_ref is required.")
+
+    if _VALIDATE:
+        assert type(is_directional) is bool,\
         "[core_Relationship] is_directional must be of type Bool."
-    assert not isinstance(target_ref, Missing),\
-    "[core_Relationship] target_ref is required."
-    if not isinstance(target_ref, Missing):
-        assert isinstance(target_ref, case.CoreObject),\
+        assert isinstance(target_ref, _CoreObject),\
         "[core_Relationship] target_ref must be of type CoreObject."
-    assert not isinstance(source_ref, Missing),\
-    "[core_Relationship] source_ref is required."
-    if not isinstance(source_ref, Missing):
-        assert isinstance(source_ref, list),\
-        "[core_Relationship] source_ref must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in source_ref),\
-        "[core_Relationship] source_ref must be of type List of CoreObject."
-
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, list),\
-        "[core_Relationship] start_time must be of type List of Datetime."
-        assert all(isinstance(i, datetime.datetime) for i in start_time),\
-        "[core_Relationship] start_time must be of type List of Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, list),\
-        "[core_Relationship] end_time must be of type List of Datetime."
-        assert all(isinstance(i, datetime.datetime) for i in end_time),\
-        "[core_Relationship] end_time must be of type List of Datetime."
-    if not isinstance(kind_of_relationship, Missing):
-        assert (isinstance(kind_of_relationship, case.CoreObject) and (kind_of_relationship.type=='ControlledVocabulary')),\
-        "[core_Relationship] kind_of_relationship must be of type ControlledVocabulary."
-
-    return uco_document.create_CoreObject('Relationship', IsDirectional=is_directional, TargetRef=target_ref,
-                                          SourceRef=source_ref, StartTime=start_time, EndTime=end_time,
-                                          KindOfRelationship=kind_of_relationship)
+        _check_list_of(source_ref, _CoreObject, None,
+                       "[core_Relationship] source_ref must be of type List of CoreObject.")
+
+        if start_time is not _MISSING:
+            _check_list_of(start_time, _datetime, None,
+                           "[core_Relationship] start_time must be of type List of Datetime.")
+        if end_time is not _MISSING:
+            _check_list_of(end_time, _datetime, None,
+                           "[core_Relationship] end_time must be of type List of Datetime.")
+        if kind_of_relationship is not _MISSING:
+            _check_instance_of(kind_of_relationship, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[core_Relationship] kind_of_relationship must be of type ControlledVocabulary.")
+
+    properties = _present(IsDirectional=is_directional, TargetRef=target_ref, SourceRef=source_ref,
+                          StartTime=start_time, EndTime=end_time, KindOfRelationship=kind_of_relationship)
+    return uco_document.create_CoreObject('Relationship', **properties)
 
 
 def core_Role(uco_document):
@@ -243,8 +321,8 @@ def core_Role(uco_document):
     return uco_document.create_CoreObject('Role')
 
 
-def core_Tool(uco_document, name=Missing(), version=Missing(), tool_type=Missing(), service_pack=Missing(),
-              creator=Missing(), references=Missing(), **kwargs):
+def core_Tool(uco_document, name=_MISSING, version=_MISSING, tool_type=_MISSING, service_pack=_MISSING,
+              creator=_MISSING, references=_MISSING, **kwargs):
     '''
     :param Name: At most one value of type String.
     :param Version: At most one value of type String.
@@ -255,46 +333,50 @@ def core_Tool(uco_document, name=Missing(), version=Missing(), tool_type=Missing
     :return: A CoreObject object.
     '''
 
-    if not isinstance(name, Missing):
-        assert isinstance(name, str),\
-        "[core_Tool] name must be of type String."
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[core_Tool] version must be of type String."
-    if not isinstance(tool_type, Missing):
-        assert isinstance(tool_type, str),\
-        "[core_Tool] tool_type must be of type String."
-    if not isinstance(service_pack, Missing):
-        assert isinstance(service_pack, str),\
-        "[core_Tool] service_pack must be of type String."
-    if not isinstance(creator, Missing):
-        assert isinstance(creator, str),\
-        "[core_Tool] creator must be of type String."
+    if _VALIDATE:
+        if name is not _MISSING:
+            assert (type(name) is str or isinstance(name, str)),\
+            "[core_Tool] name must be of type String."
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[core_Tool] version must be of type String."
+        if tool_type is not _MISSING:
+            assert (type(tool_type) is str or isinstance(tool_type, str)),\
+            "[core_Tool] tool_type must be of type String."
+        if service_pack is not _MISSING:
+            assert (type(service_pack) is str or isinstance(service_pack, str)),\
+            "[core_Tool] service_pack must be of type String."
+        if creator is not _MISSING:
+            assert (type(creator) is str or isinstance(creator, str)),\
+            "[core_Tool] creator must be of type String."
+
     #TODO:URI
     #check for list and then URI type
 
-    return uco_document.create_CoreObject('Tool', Name=name, Version=version, ToolType=tool_type,
-                                          ServicePack=service_pack, Creator=creator, References=references)
+    properties = _present(Name=name, Version=version, ToolType=tool_type, ServicePack=service_pack, Creator=creator,
+                          References=references)
+    return uco_document.create_CoreObject('Tool', **properties)
 
 
-def core_Trace(uco_document, has_changed=Missing(), state=Missing(), **kwargs):
+def core_Trace(uco_document, has_changed=_MISSING, state=_MISSING, **kwargs):
     '''
     :param HasChanged: Exactly one value of type Bool.
     :param State: At most one occurrence of type ControlledVocabulary.
     :return: A CoreObject object.
     '''
 
-    assert not isinstance(has_changed, Missing),\
-    "[core_Trace] has_changed is required."
-    if not isinstance(has_changed, Missing):
-        assert isinstance(has_changed, bool),\
+    _require(has_changed, "[core_Trace] has_changed is required.")
+
+    if _VALIDATE:
+        assert type(has_changed) is bool,\
         "[core_Trace] has_changed must be of type Bool."
 
-    if not isinstance(state, Missing):
-        assert (isinstance(state, case.CoreObject) and (state.type=='ControlledVocabulary')),\
-        "[core_Trace] state must be of type ControlledVocabulary."
+        if state is not _MISSING:
+            _check_instance_of(state, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[core_Trace] state must be of type ControlledVocabulary.")
 
-    return uco_document.create_CoreObject('Trace', HasChanged=has_changed, State=state)
+    properties = _present(HasChanged=has_changed, State=state)
+    return uco_document.create_CoreObject('Trace', **properties)
 
 
 #====================================================
@@ -311,8 +393,9 @@ def core_sub_ActionLifecycle(uco_document, uco_object):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object, case.CoreObject) and (uco_object.type=='Action')),\
-    "[core_sub_ActionLifecycle] uco_object must be of type Action."
+    if _VALIDATE:
+        _check_instance_of(uco_object, _CoreObject, _TAG_ACTION,
+                           "[core_sub_ActionLifecycle] uco_object must be of type Action.")
 
     # TODO:This class checks if the fields for core_Action are not present.
     # If they are this object cannot be used and an error should be thrown. Is this a correct interpretation?
@@ -325,8 +408,9 @@ def core_sub_ForensicAction(uco_document, uco_object):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object, case.CoreObject) and (uco_object.type=='Action')),\
-    "[core_sub_ForensicAction] uco_object must be of type Action."
+    if _VALIDATE:
+        _check_instance_of(uco_object, _CoreObject, _TAG_ACTION,
+                           "[core_sub_ForensicAction] uco_object must be of type Action.")
 
     #TODO:NothingElseToCheck
 
@@ -336,25 +420,24 @@ def core_sub_ForensicAction(uco_document, uco_object):
 #====================================================
 #-- CONTEXT IN ALPHABETICAL ORDER
 
-def context_Grouping(uco_document, context_strings=Missing()):
+def context_Grouping(uco_document, context_strings=_MISSING):
     '''
     :param Context: At least one value of type String.
     :return: A ContextObject object.
     '''
 
-    assert not isinstance(context_strings, Missing),\
-    "[context_Grouping] context_strings is required."
-    if not isinstance(context_strings, Missing):
-        assert isinstance(context_strings, list),\
-        "[context_Grouping] context_strings must be of type List of String."
-        assert all(isinstance(i, str) for i in context_strings),\
-        "[context_Grouping] context_strings must be of type List of String."
+    _require(context_strings, "[context_Grouping] context_strings is required.")
 
-    return uco_document.create_ContextObject('Grouping', ContextStrings=context_strings)
+    if _VALIDATE:
+        _check_list_of(context_strings, str, None,
+                       "[context_Grouping] context_strings must be of type List of String.")
 
+    properties = _present(ContextStrings=context_strings)
+    return uco_document.create_ContextObject('Grouping', **properties)
 
-def context_Investigation(uco_document, investigation_form=Missing(), investigation_status=Missing(),
-                          start_time=Missing(), end_time=Missing, focus=Missing(), object_refs=Missing()):
+
+def context_Investigation(uco_document, investigation_form=_MISSING, investigation_status=_MISSING,
+                          start_time=_MISSING, end_time=_MISSING, focus=_MISSING, object_refs=_MISSING):
     '''
     :param InvestigationForm: Exactly one occurrence of type ControlledVocabulary.
     :param InvestigationStatus: At most one occurrence of type ControlledVocabulary.
@@ -365,54 +448,50 @@ def context_Investigation(uco_document, investigation_form=Missing(), investigat
     :return: A ContextObject object.
     '''
 
-    assert not isinstance(investigation_form, Missing),\
-    "[context_Investigation] investigation_form is required."
-    if not isinstance(investigation_form, Missing):
-        assert (isinstance(investigation_form, case.CoreObject) and (investigation_form.type=='ControlledVocabulary')),\
-        "[context_Investigation] investigation_form must be of type ControlledVocabulary."
-
-    if not isinstance(investigation_status, Missing):
-        assert (isinstance(investigation_status, case.CoreObject) and (investigation_status.type=='ControlledVocabulary')),\
-        "[context_Investigation] investigation_status must be of type ControlledVocabulary."
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[context_Investigation] start_time must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[context_Investigation] end_time must be of type Datetime."
-    if not isinstance(focus, Missing):
-        assert isinstance(focus, list),\
-        "[context_Investigation] focus must be of type List of Strings."
-        assert all(isinstance(i, str) for i in focus),\
-        "[context_Investigation] focus must be of type List of Strings."
-    if not isinstance(object_refs, Missing):
-        assert isinstance(object_refs, list),\
-        "[context_Investigation] object_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in object_refs),\
-        "[context_Investigation] object_refs must be of type List of CoreObject."
-
-    return uco_document.create_ContextObject('Investigation', InvestigationForm=investigation_form,
-                                             InvestigationStatus=investigation_status, StartTime=start_time,
-                                             EndTime=end_time, Focus=focus, ObjectRefs=object_refs)
-
-
-def context_ProvenanceRecord(uco_document, exhibit_number=Missing(), object_refs=Missing(), **kwargs):
+    _require(investigation_form, "[context_Investigation] investigation_form is required.")
+
+    if _VALIDATE:
+        _check_instance_of(investigation_form, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[context_Investigation] investigation_form must be of type ControlledVocabulary.")
+
+        if investigation_status is not _MISSING:
+            _check_instance_of(investigation_status, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[context_Investigation] investigation_status must be of type ControlledVocabulary.")
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[context_Investigation] start_time must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[context_Investigation] end_time must be of type Datetime."
+        if focus is not _MISSING:
+            _check_list_of(focus, str, None,
+                           "[context_Investigation] focus must be of type List of Strings.")
+        if object_refs is not _MISSING:
+            _check_list_of(object_refs, _CoreObject, None,
+                           "[context_Investigation] object_refs must be of type List of CoreObject.")
+
+    properties = _present(InvestigationForm=investigation_form, InvestigationStatus=investigation_status,
+                          StartTime=start_time, EndTime=end_time, Focus=focus, ObjectRefs=object_refs)
+    return uco_document.create_ContextObject('Investigation', **properties)
+
+
+def context_ProvenanceRecord(uco_document, exhibit_number=_MISSING, object_refs=_MISSING, **kwargs):
     '''
     :param ExhibitNumber: At most one value of type String.
     :param ObjectRefs: Any number of occurrences of type CoreObject.
     :return: A ContextObject object.
     '''
 
-    if not isinstance(exhibit_number, Missing):
-        assert isinstance(exhibit_number, str),\
-        "[context_ProvenanceRecord] exhibit_number must be of type String."
-    if not isinstance(object_refs, Missing):
-        assert isinstance(object_refs, list),\
-        "[context_ProvenanceRecord] object_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in object_refs),\
-        "[context_ProvenanceRecord] object_refs must be of type List of CoreObject."
+    if _VALIDATE:
+        if exhibit_number is not _MISSING:
+            assert (type(exhibit_number) is str or isinstance(exhibit_number, str)),\
+            "[context_ProvenanceRecord] exhibit_number must be of type String."
+        if object_refs is not _MISSING:
+            _check_list_of(object_refs, _CoreObject, None,
+                           "[context_ProvenanceRecord] object_refs must be of type List of CoreObject.")
 
-    return uco_document.create_ContextObject('ProvenanceRecord', ExhibitNumber=exhibit_number, ObjectRefs=object_refs)
+    properties = _present(ExhibitNumber=exhibit_number, ObjectRefs=object_refs)
+    return uco_document.create_ContextObject('ProvenanceRecord', **properties)
 
 
 #====================================================
@@ -424,9 +503,9 @@ def context_ProvenanceRecord(uco_document, exhibit_number=Missing(), object_refs
 #====================================================
 #-- PROPERTYBUNDLES IN ALPHABETICAL ORDER
 
-def propbundle_Account(uco_object, account_id=Missing(), expiration_time=Missing(), created_time=Missing(),
-                       account_type=Missing(), account_issuer_ref=Missing(), is_active=Missing(),
-                       modified_time=Missing(), owner_ref=Missing()):
+def propbundle_Account(uco_object, account_id=_MISSING, expiration_time=_MISSING, created_time=_MISSING,
+                       account_type=_MISSING, account_issuer_ref=_MISSING, is_active=_MISSING,
+                       modified_time=_MISSING, owner_ref=_MISSING):
     '''
     :param AccoundID: Exactly one value of type String.
     :param ExprationTime: At most one value of type Datetime.
@@ -438,43 +517,43 @@ def propbundle_Account(uco_object, account_id=Missing(), expiration_time=Missing
     :param OwnerRef: At most one occurrence of type CoreObject.
     :return: A PropertyBundle object.
     '''
-    
-    assert not isinstance(account_id, Missing),\
-    "[propbundle_Account] account_id is required."
-    if not isinstance(account_id, Missing):
-        assert isinstance(account_id, str),\
+
+    _require(account_id, "[propbundle_Account] account_id is required.")
+
+    if _VALIDATE:
+        assert (type(account_id) is str or isinstance(account_id, str)),\
         "[propbundle_Account] account_id must be of type String."
 
-    if not isinstance(expiration_time, Missing):
-        assert isinstance(expiration_time, datetime.datetime),\
-        "[propbundle_Account] expiration_time must be of type Datetime."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_Account] created_time must be of type TimeStamp."
-    if not isinstance(account_type, Missing):
-        assert (isinstance(account_type, case.CoreObject) and (account_type.type=='ControlledVocabulary')),\
-        "[propbundle_Account] account_type must be of type ControlledVocabulary."
-    if not isinstance(account_issuer_ref, Missing):
-        assert isinstance(account_issuer_ref, case.CoreObject),\
-        "[propbundle_Account] account_issuer_ref must be of type CoreObject."
-    if not isinstance(is_active, Missing):
-        assert isinstance(is_active, bool),\
-        "[propbundle_Account] is_active must be of type Bool."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_Account] modified_time must be of type Datetime."
-    if not isinstance(owner_ref, Missing):
-        assert isinstance(owner_ref, case.CoreObject),\
-        "[propbundle_Account] owner_ref must be of type CoreObject."
-
-    return uco_object.create_PropertyBundle('Account', AccoundID=account_id, ExpirationTime=expiration_time,
-                                            CreatedTime=created_time,  AccountType=account_type,
-                                            AccountIssuerRef=account_issuer_ref, IsActive=is_active,
-                                            ModifiedTime=modified_time, OwnerRef=owner_ref)
-
-
-def propbundle_AccountAuthentication(uco_object, password=Missing(), password_type=Missing(),
-                                     password_last_changed=Missing()):
+        if expiration_time is not _MISSING:
+            assert (type(expiration_time) is _datetime or isinstance(expiration_time, _datetime)),\
+            "[propbundle_Account] expiration_time must be of type Datetime."
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_Account] created_time must be of type TimeStamp."
+        if account_type is not _MISSING:
+            _check_instance_of(account_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_Account] account_type must be of type ControlledVocabulary.")
+        if account_issuer_ref is not _MISSING:
+            assert isinstance(account_issuer_ref, _CoreObject),\
+            "[propbundle_Account] account_issuer_ref must be of type CoreObject."
+        if is_active is not _MISSING:
+            assert type(is_active) is bool,\
+            "[propbundle_Account] is_active must be of type Bool."
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_Account] modified_time must be of type Datetime."
+        if owner_ref is not _MISSING:
+            assert isinstance(owner_ref, _CoreObject),\
+            "[propbundle_Account] owner_ref must be of type CoreObject."
+
+    properties = _present(AccoundID=account_id, ExpirationTime=expiration_time, CreatedTime=created_time,
+                          AccountType=account_type, AccountIssuerRef=account_issuer_ref, IsActive=is_active,
+                          ModifiedTime=modified_time, OwnerRef=owner_ref)
+    return uco_object.create_PropertyBundle('Account', **properties)
+
+
+def propbundle_AccountAuthentication(uco_object, password=_MISSING, password_type=_MISSING,
+                                     password_last_changed=_MISSING):
     '''
     :param Password: At most one value of type String.
     :param PasswordType: At most one value of type String.
@@ -482,24 +561,24 @@ def propbundle_AccountAuthentication(uco_object, password=Missing(), password_ty
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(password, Missing):
-        assert isinstance(password, str),\
-        "[propbundle_AccountAuthentication] password must be of type String."
-    if not isinstance(password_type, Missing):
-        assert isinstance(password_type, str),\
-        "[propbundle_AccountAuthentication] password_type must be of type String."
-    if not isinstance(password_last_changed, Missing):
-        assert isinstance(password_last_changed, datetime.datetime),\
-        "[propbundle_AccountAuthentication] password_last_changed must be of type Datetime."
+    if _VALIDATE:
+        if password is not _MISSING:
+            assert (type(password) is str or isinstance(password, str)),\
+            "[propbundle_AccountAuthentication] password must be of type String."
+        if password_type is not _MISSING:
+            assert (type(password_type) is str or isinstance(password_type, str)),\
+            "[propbundle_AccountAuthentication] password_type must be of type String."
+        if password_last_changed is not _MISSING:
+            assert (type(password_last_changed) is _datetime or isinstance(password_last_changed, _datetime)),\
+            "[propbundle_AccountAuthentication] password_last_changed must be of type Datetime."
 
-    return uco_object.create_PropertyBundle('AccountAuthentication', Password=password,
-                                            PasswordType=password_type,
-                                            PasswordLastChanged = password_last_changed)
+    properties = _present(Password=password, PasswordType=password_type, PasswordLastChanged=password_last_changed)
+    return uco_object.create_PropertyBundle('AccountAuthentication', **properties)
 
 
-def propbundle_ActionReferences(uco_object, environment_ref=Missing(), result_refs=Missing(),
-                                performer_refs=Missing(), participant_refs=Missing(),
-                                object_refs=Missing(), location_refs=Missing(), instrument_refs=Missing(), **kwargs):
+def propbundle_ActionReferences(uco_object, environment_ref=_MISSING, result_refs=_MISSING,
+                                performer_refs=_MISSING, participant_refs=_MISSING,
+                                object_refs=_MISSING, location_refs=_MISSING, instrument_refs=_MISSING, **kwargs):
     '''
     :param EnvironmentRef: At most one occurrence of type CoreObject.
     :param ResultRefs: Any number of occurrences of type CoreObject.
@@ -511,46 +590,37 @@ def propbundle_ActionReferences(uco_object, environment_ref=Missing(), result_re
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(environment_ref, Missing):
-        assert isinstance(environment_ref, case.CoreObject),\
-        "[propbundles_ActionReferences] environment_ref must be of type CoreObject."
-    if not isinstance(result_refs, Missing):
-        assert isinstance(result_refs, list),\
-        "[propbundles_ActionReferences] result_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in result_refs),\
-        "[propbundles_ActionReferences] result_refs must be of type List of CoreObject."
-    if not isinstance(performer_refs, Missing):
-        assert isinstance(performer_refs, case.CoreObject),\
-        "[propbundles_ActionReferences] performer_refs must be of type CoreObject."
-    if not isinstance(participant_refs, Missing):
-        assert isinstance(participant_refs, list),\
-        "[propbundles_ActionReferences] participant_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in participant_refs),\
-        "[propbundles_ActionReferences] participant_refs must be of type List of CoreObject."
-    if not isinstance(object_refs, Missing):
-        assert isinstance(object_refs, list),\
-        "[propbundles_ActionReferences] object_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in object_refs),\
-        "[propbundles_ActionReferences] object_refs must be of type List of CoreObject."
-    if not isinstance(location_refs, Missing):
-        assert isinstance(location_refs, list),\
-        "[propbundles_ActionReferences] location_refs must be of type List of Location."
-        assert all( (isinstance(i, case.CoreObject)) and (i.type=='Location') for i in location_refs),\
-        "[propbundles_ActionReferences] location_refs must be of type List of Location."
-    if not isinstance(instrument_refs, Missing):
-        assert isinstance(instrument_refs, list),\
-        "[propbundles_ActionReferences] instrument_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in instrument_refs),\
-        "[propbundles_ActionReferences] instrument_refs must be of type List of CoreObject."
-
-    return uco_object.create_PropertyBundle('ActionReferences', EnvironmentRef=environment_ref,
-                                            ResultRefs=result_refs, PerformerRefs=performer_refs,
-                                            ParticipantRefs=participant_refs, ObjectRefs=object_refs,
-                                            LocationRefs=location_refs, InstrumentRefs=instrument_refs)
-
-
-def propbundle_Application(uco_object, application_identifier=Missing(), version=Missing(),
-                           operating_system_ref=Missing(), number_of_launches=Missing()):
+    if _VALIDATE:
+        if environment_ref is not _MISSING:
+            assert isinstance(environment_ref, _CoreObject),\
+            "[propbundles_ActionReferences] environment_ref must be of type CoreObject."
+        if result_refs is not _MISSING:
+            _check_list_of(result_refs, _CoreObject, None,
+                           "[propbundles_ActionReferences] result_refs must be of type List of CoreObject.")
+        if performer_refs is not _MISSING:
+            assert isinstance(performer_refs, _CoreObject),\
+            "[propbundles_ActionReferences] performer_refs must be of type CoreObject."
+        if participant_refs is not _MISSING:
+            _check_list_of(participant_refs, _CoreObject, None,
+                           "[propbundles_ActionReferences] participant_refs must be of type List of CoreObject.")
+        if object_refs is not _MISSING:
+            _check_list_of(object_refs, _CoreObject, None,
+                           "[propbundles_ActionReferences] object_refs must be of type List of CoreObject.")
+        if location_refs is not _MISSING:
+            _check_list_of(location_refs, _CoreObject, _TAG_LOCATION,
+                           "[propbundles_ActionReferences] location_refs must be of type List of Location.")
+        if instrument_refs is not _MISSING:
+            _check_list_of(instrument_refs, _CoreObject, None,
+                           "[propbundles_ActionReferences] instrument_refs must be of type List of CoreObject.")
+
+    properties = _present(EnvironmentRef=environment_ref, ResultRefs=result_refs, PerformerRefs=performer_refs,
+                          ParticipantRefs=participant_refs, ObjectRefs=object_refs, LocationRefs=location_refs,
+                          InstrumentRefs=instrument_refs)
+    return uco_object.create_PropertyBundle('ActionReferences', **properties)
+
+
+def propbundle_Application(uco_object, application_identifier=_MISSING, version=_MISSING,
+                           operating_system_ref=_MISSING, number_of_launches=_MISSING):
     '''
     :param ApplicationIdentifier: At most one value of type String.
     :param Version: At most one value of type String.
@@ -559,40 +629,42 @@ def propbundle_Application(uco_object, application_identifier=Missing(), version
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_identifier, Missing):
-        assert isinstance(application_identifier, str),\
-        "[propbundle_Application] application_identifier must be of type String."
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_Application] version must be of type String."
-    if not isinstance(operating_system_ref, Missing):
-        assert (isinstance(operating_system_ref, case.CoreObject) and (operating_system_ref.type=='Trace')),\
-        "[propbundle_Application] operating_system_ref must be of type Trace."
-    if not isinstance(number_of_launches, Missing):
-        assert (isinstance(number_of_launches, int) and (number_of_launches > 0)),\
-        "[propbundle_Application] number_of_launches must be of type PositiveInteger."
+    if _VALIDATE:
+        if application_identifier is not _MISSING:
+            assert (type(application_identifier) is str or isinstance(application_identifier, str)),\
+            "[propbundle_Application] application_identifier must be of type String."
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_Application] version must be of type String."
+        if operating_system_ref is not _MISSING:
+            _check_instance_of(operating_system_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Application] operating_system_ref must be of type Trace.")
+        if number_of_launches is not _MISSING:
+            assert _is_positive_integer(number_of_launches),\
+            "[propbundle_Application] number_of_launches must be of type PositiveInteger."
 
-    return uco_object.create_PropertyBundle('Application', ApplicationIdentifier=application_identifier,
-                                            Version=version, OperatingSystemRef=operating_system_ref,
-                                            NumberOfLaunches=number_of_launches)
+    properties = _present(ApplicationIdentifier=application_identifier, Version=version,
+                          OperatingSystemRef=operating_system_ref, NumberOfLaunches=number_of_launches)
+    return uco_object.create_PropertyBundle('Application', **properties)
 
 
-def propbundle_ApplicationAccount(uco_object, application_ref=Missing()):
+def propbundle_ApplicationAccount(uco_object, application_ref=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_ApplicationAccount] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_ApplicationAccount] application_ref must be of type Trace."
+    _require(application_ref, "[propbundle_ApplicationAccount] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_ApplicationAccount] application_ref must be of type Trace.")
 
-    return uco_object.create_PropertyBundle('ApplicationAccount', ApplicationRef=application_ref)
+    properties = _present(ApplicationRef=application_ref)
+    return uco_object.create_PropertyBundle('ApplicationAccount', **properties)
 
 
-def propbundle_ArchiveFile(uco_object, version=Missing(), comment=Missing(), archive_type=Missing()):
+def propbundle_ArchiveFile(uco_object, version=_MISSING, comment=_MISSING, archive_type=_MISSING):
     '''
     :param Version: At most one value of type String.
     :param Comment: At most one value of type String.
@@ -600,17 +672,19 @@ def propbundle_ArchiveFile(uco_object, version=Missing(), comment=Missing(), arc
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_ArchiveFile] version must be of type String."
-    if not isinstance(comment, Missing):
-        assert isinstance(comment, str),\
-        "[propbundle_ArchiveFile] comment must be of type String."
-    if not isinstance(archive_type, Missing):
-        assert isinstance(archive_type, str),\
-        "[propbundle_ArchiveFile] archive_type must be of type String."
+    if _VALIDATE:
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_ArchiveFile] version must be of type String."
+        if comment is not _MISSING:
+            assert (type(comment) is str or isinstance(comment, str)),\
+            "[propbundle_ArchiveFile] comment must be of type String."
+        if archive_type is not _MISSING:
+            assert (type(archive_type) is str or isinstance(archive_type, str)),\
+            "[propbundle_ArchiveFile] archive_type must be of type String."
 
-    return uco_object.create_PropertyBundle('ArchiveFile', Version=version, Comment=comment, ArchiveType=archive_type)
+    properties = _present(Version=version, Comment=comment, ArchiveType=archive_type)
+    return uco_object.create_PropertyBundle('ArchiveFile', **properties)
 
 
 def propbundle_Attachment(uco_object, url):
@@ -621,10 +695,11 @@ def propbundle_Attachment(uco_object, url):
 
     #TODO:URL
 
-    return uco_object.create_PropertyBundle('Attachment', URL=url)
+    properties = _present(URL=url)
+    return uco_object.create_PropertyBundle('Attachment', **properties)
 
 
-def propbundle_Audio(uco_object, audio_format=Missing(), audio_type=Missing(), bit_rate=Missing(), duration=Missing()):
+def propbundle_Audio(uco_object, audio_format=_MISSING, audio_type=_MISSING, bit_rate=_MISSING, duration=_MISSING):
     '''
     :param AudioFormat: At most one value of type String.
     :param AudioType: At most one value of type String.
@@ -633,46 +708,47 @@ def propbundle_Audio(uco_object, audio_format=Missing(), audio_type=Missing(), b
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(audio_format, Missing):
-        assert isinstance(audio_format, str),\
-        "[propbundle_Audio] audio_format must be of type String."
-    if not isinstance(audio_type, Missing):
-        assert isinstance(audio_type, str),\
-        "[propbundle_Audio] audio_type must be of type String."
-    if not isinstance(bit_rate, Missing):
-        assert isinstance(bit_rate, long),\
-        "[propbundle_Audio] bit_rate must be of type Long."
-    if not isinstance(duration, Missing):
-        assert isinstance(duration, long),\
-        "[propbundle_Audio] duration must be of type Long."
+    if _VALIDATE:
+        if audio_format is not _MISSING:
+            assert (type(audio_format) is str or isinstance(audio_format, str)),\
+            "[propbundle_Audio] audio_format must be of type String."
+        if audio_type is not _MISSING:
+            assert (type(audio_type) is str or isinstance(audio_type, str)),\
+            "[propbundle_Audio] audio_type must be of type String."
+        if bit_rate is not _MISSING:
+            assert _is_integer(bit_rate),\
+            "[propbundle_Audio] bit_rate must be of type Long."
+        if duration is not _MISSING:
+            assert _is_integer(duration),\
+            "[propbundle_Audio] duration must be of type Long."
 
-    return uco_object.create_PropertyBundle('Audio', AudioFormat=audio_format, AudioType=audio_type,
-                                            BitRate=bit_rate, Duration=duration)
+    properties = _present(AudioFormat=audio_format, AudioType=audio_type, BitRate=bit_rate, Duration=duration)
+    return uco_object.create_PropertyBundle('Audio', **properties)
 
 
-def propbundle_Authorization(uco_object, authorization_type=Missing(), authorization_identifier=Missing()):
+def propbundle_Authorization(uco_object, authorization_type=_MISSING, authorization_identifier=_MISSING):
     '''
     :param AuthorizationType: Exactly one occurrence of type ControlledVocabulary.
     :param AuthorizationIdentifier: At least one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(authorization_type, Missing),\
-    "[propbundle_Authorization] authorization_type is required."
-    if not isinstance(authorization_type, Missing):
-        assert (isinstance(authorization_type, case.CoreObject) and (authorization_type.type=='ControlledVocabulary')),\
-        "[propbundle_Authorization] authorization_type must be of type ControlledVocabulary."
+    _require(authorization_type, "[propbundle_Authorization] authorization_type is required.")
 
-    if not isinstance(authorization_identifier, Missing):
-        assert isinstance(authorization_identifier, str),\
-        "[propbundle_Authorization] authorization_identifier must be of type String."
+    if _VALIDATE:
+        _check_instance_of(authorization_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[propbundle_Authorization] authorization_type must be of type ControlledVocabulary.")
 
-    return uco_object.create_PropertyBundle('Authorization', AuthorizationType=authorization_type,
-                                            AuthorizationIdentifier=authorization_identifier)
+        if authorization_identifier is not _MISSING:
+            assert (type(authorization_identifier) is str or isinstance(authorization_identifier, str)),\
+            "[propbundle_Authorization] authorization_identifier must be of type String."
 
+    properties = _present(AuthorizationType=authorization_type, AuthorizationIdentifier=authorization_identifier)
+    return uco_object.create_PropertyBundle('Authorization', **properties)
 
-def propbundle_AutonomousSystem(uco_object, number=Missing(), as_handle=Missing(),
-                                regional_internet_registry=Missing()):
+
+def propbundle_AutonomousSystem(uco_object, number=_MISSING, as_handle=_MISSING,
+                                regional_internet_registry=_MISSING):
     '''
     :param Number: Exactly one value of type Integer.
     :param AsHandle: At most one value of type String.
@@ -680,27 +756,26 @@ def propbundle_AutonomousSystem(uco_object, number=Missing(), as_handle=Missing(
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(number, Missing),\
-    "[propbundle_AutonomousSystem] number is required."
-    if not isinstance(number, Missing):
-        assert isinstance(number, int),\
+    _require(number, "[propbundle_AutonomousSystem] number is required.")
+
+    if _VALIDATE:
+        assert _is_integer(number),\
         "[propbundle_AutonomousSystem] number must be of type Integer."
 
-    if not isinstance(as_handle, Missing):
-        assert isinstance(as_handle, str),\
-        "[propbundle_AutonomousSystem] as_handle must be of type String."
-    if not isinstance(regional_internet_registry, Missing):
-        assert (isinstance(regional_internet_registry, case.CoreObject) and
-                (regional_internet_registry.type=='ControlledVocabulary')),\
-        "[propbundle_AutonomousSystem] regional_internet_registry must be of type ControlledVocabulary."
+        if as_handle is not _MISSING:
+            assert (type(as_handle) is str or isinstance(as_handle, str)),\
+            "[propbundle_AutonomousSystem] as_handle must be of type String."
+        if regional_internet_registry is not _MISSING:
+            _check_instance_of(regional_internet_registry, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_AutonomousSystem] regional_internet_registry must be of type ControlledVocabulary.")
 
-    return uco_object.create_PropertyBundle('AutonomousSystem', Number=number, AsHandle=as_handle,
-                                            RegionalInternetRegistry=regional_internet_registry)
+    properties = _present(Number=number, AsHandle=as_handle, RegionalInternetRegistry=regional_internet_registry)
+    return uco_object.create_PropertyBundle('AutonomousSystem', **properties)
 
 
-def propbundle_BrowserBookmark(uco_object, accessed_time=Missing(), application_ref=Missing(),
-                               created_time=Missing(), modified_time=Missing(), bookmark_path=Missing(),
-                               url_targeted=Missing(), visit_count=Missing()):
+def propbundle_BrowserBookmark(uco_object, accessed_time=_MISSING, application_ref=_MISSING,
+                               created_time=_MISSING, modified_time=_MISSING, bookmark_path=_MISSING,
+                               url_targeted=_MISSING, visit_count=_MISSING):
     '''
     :param AccessedTime: At most one value of type Datetime.
     :param ApplicationRef: At most one occurrence of type Trace.
@@ -712,35 +787,36 @@ def propbundle_BrowserBookmark(uco_object, accessed_time=Missing(), application_
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(accessed_time, Missing):
-        assert isinstance(accessed_time, datetime.datetime),\
-        "[propbundle_BrowserBookmark] accessed_time must be of type Datetime."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_BrowserBookmark] application_ref must be of type Trace."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_BrowserBookmark] created_time must be of type Datetime."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_BrowserBookmark] modified_time must be of type Datetime."
-    if not isinstance(bookmark_path, Missing):
-        assert isinstance(bookmark_path, str),\
-        "[propbundle_BrowserBookmark] bookmark_path must be of type String."
-    #TODO:URL
-    if not isinstance(visit_count, Missing):
-        assert isinstance(visit_count, int),\
-        "[propbundle_BrowserBookmark] visit_count must be of type Integer."
-
-    return uco_object.create_PropertyBundle('BrowserBookmark', AccessedTime=accessed_time,
-                                            ApplicationRef=application_ref, CreatedTime=created_time,
-                                            ModifiedTime=modified_time, BookmarkPath=bookmark_path,
-                                            URLTargeted=url_targeted, VisitCount=visit_count)
-
-
-def propbundle_BrowserCookie(uco_object, accessed_time=Missing(), application_ref=Missing(),
-                             created_time=Missing(), expiration_time=Missing(), domain_ref=Missing(),
-                             cookie_name=Missing(), cookie_path=Missing(), is_secure=Missing()):
+    if _VALIDATE:
+        if accessed_time is not _MISSING:
+            assert (type(accessed_time) is _datetime or isinstance(accessed_time, _datetime)),\
+            "[propbundle_BrowserBookmark] accessed_time must be of type Datetime."
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_BrowserBookmark] application_ref must be of type Trace.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_BrowserBookmark] created_time must be of type Datetime."
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_BrowserBookmark] modified_time must be of type Datetime."
+        if bookmark_path is not _MISSING:
+            assert (type(bookmark_path) is str or isinstance(bookmark_path, str)),\
+            "[propbundle_BrowserBookmark] bookmark_path must be of type String."
+        #TODO:URL
+        if visit_count is not _MISSING:
+            assert _is_integer(visit_count),\
+            "[propbundle_BrowserBookmark] visit_count must be of type Integer."
+
+    properties = _present(AccessedTime=accessed_time, ApplicationRef=application_ref, CreatedTime=created_time,
+                          ModifiedTime=modified_time, BookmarkPath=bookmark_path, URLTargeted=url_targeted,
+                          VisitCount=visit_count)
+    return uco_object.create_PropertyBundle('BrowserBookmark', **properties)
+
+
+def propbundle_BrowserCookie(uco_object, accessed_time=_MISSING, application_ref=_MISSING,
+                             created_time=_MISSING, expiration_time=_MISSING, domain_ref=_MISSING,
+                             cookie_name=_MISSING, cookie_path=_MISSING, is_secure=_MISSING):
     '''
     :param AccessedTime: At most one value of type Datetime.
     :param ApplicationRef: At most one occurrence of type Trace.
@@ -753,74 +829,78 @@ def propbundle_BrowserCookie(uco_object, accessed_time=Missing(), application_re
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(accessed_time, Missing):
-        assert isinstance(accessed_time, datetime.datetime),\
-        "[propbundle_BrowserCookie] accessed_time must be of type Datetime."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_BrowserCookie] application_ref must be of type Trace."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_BrowserCookie] created_time must be of type Datetime."
-    if not isinstance(expiration_time, Missing):
-        assert isinstance(expiration_time, datetime.datetime),\
-        "[propbundle_BrowserCookie] expiration_time must be of type Datetime."
-    if not isinstance(domain_ref, Missing):
-        assert (isinstance(domain_ref, case.CoreObject) and (domain_ref.type=='Trace')),\
-        "[propbundle_BrowserCookie] domain_ref must be of type Trace."
-    if not isinstance(cookie_name, Missing):
-        assert isinstance(cookie_name, str),\
-        "[propbundle_BrowserCookie] cookie_name must be of type String."
-    if not isinstance(cookie_path, Missing):
-        assert isinstance(cookie_path, str),\
-        "[propbundle_BrowserCookie] cookie_path must be of type String."
-    if not isinstance(is_secure, Missing):
-        assert isinstance(is_secure, bool),\
-        "[propbundle_BrowserCookie] is_secure must be of type Bool."
-
-    return uco_object.create_PropertyBundle('BrowserCookie', AccessedTime=accessed_time,
-                                            ApplicationRef=application_ref, CreatedTime=created_time,
-                                            ExpirationTime=expiration_time, DomainRef=domain_ref,
-                                            CookieName=cookie_name, CookiePath=cookie_path, IsSecure=is_secure)
-
-
-def propbundle_Build(uco_object, build_information=Missing()):
+    if _VALIDATE:
+        if accessed_time is not _MISSING:
+            assert (type(accessed_time) is _datetime or isinstance(accessed_time, _datetime)),\
+            "[propbundle_BrowserCookie] accessed_time must be of type Datetime."
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_BrowserCookie] application_ref must be of type Trace.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_BrowserCookie] created_time must be of type Datetime."
+        if expiration_time is not _MISSING:
+            assert (type(expiration_time) is _datetime or isinstance(expiration_time, _datetime)),\
+            "[propbundle_BrowserCookie] expiration_time must be of type Datetime."
+        if domain_ref is not _MISSING:
+            _check_instance_of(domain_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_BrowserCookie] domain_ref must be of type Trace.")
+        if cookie_name is not _MISSING:
+            assert (type(cookie_name) is str or isinstance(cookie_name, str)),\
+            "[propbundle_BrowserCookie] cookie_name must be of type String."
+        if cookie_path is not _MISSING:
+            assert (type(cookie_path) is str or isinstance(cookie_path, str)),\
+            "[propbundle_BrowserCookie] cookie_path must be of type String."
+        if is_secure is not _MISSING:
+            assert type(is_secure) is bool,\
+            "[propbundle_BrowserCookie] is_secure must be of type Bool."
+
+    properties = _present(AccessedTime=accessed_time, ApplicationRef=application_ref, CreatedTime=created_time,
+                          ExpirationTime=expiration_time, DomainRef=domain_ref, CookieName=cookie_name,
+                          CookiePath=cookie_path, IsSecure=is_secure)
+    return uco_object.create_PropertyBundle('BrowserCookie', **properties)
+
+
+def propbundle_Build(uco_object, build_information=_MISSING):
     '''
     :param BuildInformation: Exactly one occurrence of type BuildInformationType.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(build_information, Missing),\
-    "[propbundle_Build] build_information is required."
-    if not isinstance(build_information, Missing):
-        assert (isinstance(build_information, case.DuckObject) and (build_information.type=='BuildInformationType')),\
-        "[propbundle_Build] build_information must be of type BuildInformationType."
+    _require(build_information, "[propbundle_Build] build_information is required.")
 
-    return uco_object.create_PropertyBundle('Build', BuildInformation=build_information)
+    if _VALIDATE:
+        _check_instance_of(build_information, _DuckObject, _TAG_BUILD_INFORMATION_TYPE,
+                           "[propbundle_Build] build_information must be of type BuildInformationType.")
 
+    properties = _present(BuildInformation=build_information)
+    return uco_object.create_PropertyBundle('Build', **properties)
 
-def propbundle_Calendar(uco_object, application_ref=Missing(), owner=Missing()):
+
+def propbundle_Calendar(uco_object, application_ref=_MISSING, owner=_MISSING):
     '''
     :param ApplicationRef: At most one occurrence of type Trace.
     :param Owner: At most one occurrence of type Trace.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_Calendar] application_ref must be of type Trace."
-    if not isinstance(owner, Missing):
-        assert (isinstance(owner, case.CoreObject) and (owner.type=='Trace')),\
-        "[propbundle_Calendar] owner must be of type Trace."
+    if _VALIDATE:
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Calendar] application_ref must be of type Trace.")
+        if owner is not _MISSING:
+            _check_instance_of(owner, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Calendar] owner must be of type Trace.")
 
-    return uco_object.create_PropertyBundle('Calendar', ApplicationRef=application_ref, Owner=owner)
+    properties = _present(ApplicationRef=application_ref, Owner=owner)
+    return uco_object.create_PropertyBundle('Calendar', **properties)
 
 
-def propbundle_CalendarEntry(uco_object, application_ref=Missing(), attendant_refs=Missing(),
-                             categories=Missing(), created_time=Missing(), modified_time=Missing(), duration=Missing(),
-                             end_time=Missing(), start_time=Missing(), labels=Missing(), location_ref=Missing(),
-                             owner_ref=Missing(), is_private=Missing(), recurrence=Missing(), remind_time=Missing(),
-                             event_status=Missing(), subject=Missing(), event_type=Missing()):
+def propbundle_CalendarEntry(uco_object, application_ref=_MISSING, attendant_refs=_MISSING,
+                             categories=_MISSING, created_time=_MISSING, modified_time=_MISSING, duration=_MISSING,
+                             end_time=_MISSING, start_time=_MISSING, labels=_MISSING, location_ref=_MISSING,
+                             owner_ref=_MISSING, is_private=_MISSING, recurrence=_MISSING, remind_time=_MISSING,
+                             event_status=_MISSING, subject=_MISSING, event_type=_MISSING):
     '''
     :param ApplicationRef: At most one occurrence of type Trace.
     :param AttendantRefs: Any number of occurrences of type CoreObject.
@@ -842,100 +922,95 @@ def propbundle_CalendarEntry(uco_object, application_ref=Missing(), attendant_re
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_CalendarEntry] application_ref must be of type Trace."
-    if not isinstance(attendant_refs, Missing):
-        assert isinstance(attendant_refs, list),\
-        "[propbundle_CalendarEntry] attendant_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in attendant_refs),\
-        "[propbundle_CalendarEntry] attendant_refs must be of type List of CoreObject."
-    if not isinstance(categories, Missing):
-        assert isinstance(categories, list),\
-        "[propbundle_CalendarEntry] categories must be of type List of String."
-        assert all(isinstance(i, str) for i in categories),\
-        "[propbundle_CalendarEntry] categories must be of type List of String."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_CalendarEntry] created_time must be of type Datetime."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_CalendarEntry] modified_time must be of type Datetime."
-    if not isinstance(duration, Missing):
-        assert isinstance(duration, datetime.datetime),\
-        "[propbundle_CalendarEntry] duration must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[propbundle_CalendarEntry] end_time must be of type Datetime."
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[propbundle_CalendarEntry] start_time must be of type Datetime."
-    if not isinstance(labels, Missing):
-        assert isinstance(labels, list),\
-        "[propbundle_CalendarEntry] labels must be of type List of String."
-        assert all(isinstance(i, str) for i in labels),\
-        "[propbundle_CalendarEntry] labels must be of type List of String."
-    if not isinstance(location_ref, Missing):
-        assert (isinstance(location_ref, case.CoreObject) and (location_ref.type=='Location')),\
-        "[propbundle_CalendarEntry] location_ref must be of type Location."
-    if not isinstance(owner_ref, Missing):
-        assert (isinstance(owner_ref, case.CoreObject) and (owner_ref.type=='Identity')),\
-        "[propbundle_CalendarEntry] owner_ref must be of type Identity."
-    if not isinstance(is_private, Missing):
-        assert isinstance(is_private, bool),\
-        "[propbundle_CalendarEntry] is_private must be of type Bool."
-    if not isinstance(recurrence, Missing):
-        assert isinstance(recurrence, str),\
-        "[propbundle_CalendarEntry] recurrence must be of type String."
-    if not isinstance(remind_time, Missing):
-        assert isinstance(remind_time, datetime.datetime),\
-        "[propbundle_CalendarEntry] remind_time must be of type Datetime."
-    if not isinstance(event_status, Missing):
-        assert isinstance(event_status, str),\
-        "[propbundle_CalendarEntry] event_status must be of type String."
-    if not isinstance(subject, Missing):
-        assert isinstance(subject, str),\
-        "[propbundle_CalendarEntry] subject must be of type String."
-    if not isinstance(event_type, Missing):
-        assert isinstance(event_type, str),\
-        "[propbundle_CalendarEntry] event_type must be of type String."
-
-    return uco_object.create_PropertyBundle('CalendarEntry', ApplicationRef=application_ref,
-                                            AttendantRefs=attendant_refs, Categories=categories,
-                                            CreatedTime=created_time, ModifiedTime=modified_time,
-                                            Duration=duration, EndTime=end_time, StartTime=start_time,
-                                            Labels=labels, LocationRef=location_ref, OwnerRef=owner_ref,
-                                            IsPrivate=is_private, Recurrence=recurrence, RemindTime=remind_time,
-                                            EventStatus=event_status, Subject=subject, EventType=event_type )
-
-
-def propbundle_CompressedStream(uco_object, compression_method=Missing(), compression_ratio=Missing()):
+    if _VALIDATE:
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_CalendarEntry] application_ref must be of type Trace.")
+        if attendant_refs is not _MISSING:
+            _check_list_of(attendant_refs, _CoreObject, None,
+                           "[propbundle_CalendarEntry] attendant_refs must be of type List of CoreObject.")
+        if categories is not _MISSING:
+            _check_list_of(categories, str, None,
+                           "[propbundle_CalendarEntry] categories must be of type List of String.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_CalendarEntry] created_time must be of type Datetime."
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_CalendarEntry] modified_time must be of type Datetime."
+        if duration is not _MISSING:
+            assert (type(duration) is _datetime or isinstance(duration, _datetime)),\
+            "[propbundle_CalendarEntry] duration must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[propbundle_CalendarEntry] end_time must be of type Datetime."
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[propbundle_CalendarEntry] start_time must be of type Datetime."
+        if labels is not _MISSING:
+            _check_list_of(labels, str, None,
+                           "[propbundle_CalendarEntry] labels must be of type List of String.")
+        if location_ref is not _MISSING:
+            _check_instance_of(location_ref, _CoreObject, _TAG_LOCATION,
+                               "[propbundle_CalendarEntry] location_ref must be of type Location.")
+        if owner_ref is not _MISSING:
+            _check_instance_of(owner_ref, _CoreObject, _TAG_IDENTITY,
+                               "[propbundle_CalendarEntry] owner_ref must be of type Identity.")
+        if is_private is not _MISSING:
+            assert type(is_private) is bool,\
+            "[propbundle_CalendarEntry] is_private must be of type Bool."
+        if recurrence is not _MISSING:
+            assert (type(recurrence) is str or isinstance(recurrence, str)),\
+            "[propbundle_CalendarEntry] recurrence must be of type String."
+        if remind_time is not _MISSING:
+            assert (type(remind_time) is _datetime or isinstance(remind_time, _datetime)),\
+            "[propbundle_CalendarEntry] remind_time must be of type Datetime."
+        if event_status is not _MISSING:
+            assert (type(event_status) is str or isinstance(event_status, str)),\
+            "[propbundle_CalendarEntry] event_status must be of type String."
+        if subject is not _MISSING:
+            assert (type(subject) is str or isinstance(subject, str)),\
+            "[propbundle_CalendarEntry] subject must be of type String."
+        if event_type is not _MISSING:
+            assert (type(event_type) is str or isinstance(event_type, str)),\
+            "[propbundle_CalendarEntry] event_type must be of type String."
+
+    properties = _present(ApplicationRef=application_ref, AttendantRefs=attendant_refs, Categories=categories,
+                          CreatedTime=created_time, ModifiedTime=modified_time, Duration=duration, EndTime=end_time,
+                          StartTime=start_time, Labels=labels, LocationRef=location_ref, OwnerRef=owner_ref,
+                          IsPrivate=is_private, Recurrence=recurrence, RemindTime=remind_time,
+                          EventStatus=event_status, Subject=subject, EventType=event_type)
+    return uco_object.create_PropertyBundle('CalendarEntry', **properties)
+
+
+def propbundle_CompressedStream(uco_object, compression_method=_MISSING, compression_ratio=_MISSING):
     '''
     :param CompressionMethod: At most one value of type String.
     :param CompressionRatio: At most one value of type Float.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(compression_method, Missing):
-        assert isinstance(compression_method, str),\
-        "[propbundle_CompressedStream] compression_method must be of type String."
-    if not isinstance(compression_ratio, Missing):
-        assert isinstance(compression_ratio, float),\
-        "[propbundle_CompressedStream] compression_ratio must be of type Float."
+    if _VALIDATE:
+        if compression_method is not _MISSING:
+            assert (type(compression_method) is str or isinstance(compression_method, str)),\
+            "[propbundle_CompressedStream] compression_method must be of type String."
+        if compression_ratio is not _MISSING:
+            assert (type(compression_ratio) is float or isinstance(compression_ratio, float)),\
+            "[propbundle_CompressedStream] compression_ratio must be of type Float."
 
-    return uco_object.create_PropertyBundle('CompressedStream', CompressionMethod=compression_method,
-                                            CompressionRatio=compression_ratio)
+    properties = _present(CompressionMethod=compression_method, CompressionRatio=compression_ratio)
+    return uco_object.create_PropertyBundle('CompressedStream', **properties)
 
 
-def propbundle_ComputerSpecification(uco_object, available_ram=Missing(), bios_date=Missing(),
-                                     bios_manufacturer=Missing(), bios_release_date=Missing(),
-                                     bios_serial_number=Missing(), bios_version=Missing(),
-                                     current_system_date=Missing(), hostname=Missing(),
-                                     local_time=Missing(), network_interface_refs=Missing(),
-                                     processor_architecture=Missing(), cpu_family=Missing(),
-                                     cpu=Missing(), gpu_family=Missing(), gpu=Missing(), system_time=Missing(),
-                                     timezone_dst=Missing(), timezone_standard=Missing(), total_ram=Missing(),
-                                     uptime=Missing()):
+def propbundle_ComputerSpecification(uco_object, available_ram=_MISSING, bios_date=_MISSING,
+                                     bios_manufacturer=_MISSING, bios_release_date=_MISSING,
+                                     bios_serial_number=_MISSING, bios_version=_MISSING,
+                                     current_system_date=_MISSING, hostname=_MISSING,
+                                     local_time=_MISSING, network_interface_refs=_MISSING,
+                                     processor_architecture=_MISSING, cpu_family=_MISSING,
+                                     cpu=_MISSING, gpu_family=_MISSING, gpu=_MISSING, system_time=_MISSING,
+                                     timezone_dst=_MISSING, timezone_standard=_MISSING, total_ram=_MISSING,
+                                     uptime=_MISSING):
     '''
     :param AvailableRAM: At most one value of type Long.
     :param BIOSDate: At most one value of type Datetime.
@@ -958,93 +1033,92 @@ def propbundle_ComputerSpecification(uco_object, available_ram=Missing(), bios_d
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(available_ram, Missing):
-        assert isinstance(available_ram, long),\
-        "[propbundle_ComputerSpecification] available_ram must be of type Long."
-    if not isinstance(bios_date, Missing):
-        assert isinstance(bios_date, datetime.datetime),\
-        "[propbundle_ComputerSpecification] bios_date must be of type Datetime."
-    if not isinstance(bios_manufacturer, Missing):
-        assert isinstance(bios_manufacturer, str),\
-        "[propbundle_ComputerSpecification] bios_manufacturer must be of type String."
-    if not isinstance(bios_release_date, Missing):
-        assert isinstance(bios_release_date, datetime.datetime),\
-        "[propbundle_ComputerSpecification] bios_release_date must be of type Datetime."
-    if not isinstance(bios_serial_number, Missing):
-        assert isinstance(bios_serial_number, str),\
-        "[propbundle_ComputerSpecification] bios_serial_number must be of type String."
-    if not isinstance(bios_version, Missing):
-        assert isinstance(bios_version, str),\
-        "[propbundle_ComputerSpecification] bios_version must be of type String."
-    if not isinstance(local_time, Missing):
-        assert isinstance(local_time, datetime.datetime),\
-        "[propbundle_ComputerSpecification] local_time must be of type Datetime."
-    if not isinstance(network_interface_refs, Missing):
-        assert isinstance(network_interface_refs, list),\
-        "[propbundle_ComputerSpecification] network_interface_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in network_interface_refs),\
-        "[propbundle_ComputerSpecification] network_interface_refs must be of type List of Trace."
-    if not isinstance(processor_architecture, Missing):
-        assert isinstance(processor_architecture, str),\
-        "[propbundle_ComputerSpecification] processor_architecture must be of type String."
-    if not isinstance(cpu_family, Missing):
-        assert isinstance(cpu_family, str),\
-        "[propbundle_ComputerSpecification] cpu_family must be of type String."
-    if not isinstance(cpu, Missing):
-        assert isinstance(cpu, str),\
-        "[propbundle_ComputerSpecification] cpu must be of type String."
-    if not isinstance(gpu_family, Missing):
-        assert isinstance(gpu_family, str),\
-        "[propbundle_ComputerSpecification] gpu_family must be of type String."
-    if not isinstance(gpu, Missing):
-        assert isinstance(gpu, str),\
-        "[propbundle_ComputerSpecification] gpu must be of type String."
-    if not isinstance(system_time, Missing):
-        assert isinstance(system_time, datetime.datetime),\
-        "[propbundle_ComputerSpecification] system_time must be of type Datetime."
-    if not isinstance(timezone_dst, Missing):
-        assert isinstance(timezone_dst, str),\
-        "[propbundle_ComputerSpecification] timezone_dst must be of type String."
-    if not isinstance(timezone_standard, Missing):
-        assert isinstance(timezone_standard, str),\
-        "[propbundle_ComputerSpecification] timezone_standard must be of type String."
-    if not isinstance(total_ram, Missing):
-        assert isinstance(total_ram, long),\
-        "[propbundle_ComputerSpecification] total_ram must be of type Long."
-    #TODO:Why is uptime a string? This needs further clarification. Startup time? Or total time to boot?
-    if not isinstance(uptime, Missing):
-        assert isinstance(uptime, str),\
-        "[propbundle_ComputerSpecification] uptime must be of type String."
-
-    return uco_object.create_PropertyBundle('ComputerSpecification', AvailableRAM=available_ram, BIOSDate=bios_date,
-                                            BIOSManufacturer=bios_manufacturer, BIOSReleaseDate=bios_release_date,
-                                            BIOSSerialNumber=bios_serial_number, BIOSVersion=bios_version,
-                                            CurrentSystemDate=current_system_date, Hostname=hostname,
-                                            LocalTime=local_time, NetworkInterfaceRefs=network_interface_refs,
-                                            ProcessorArchitecture=processor_architecture, CPUFamily=cpu_family,
-                                            CPU=cpu, GPUFamily=gpu_family, SystemTime=system_time,
-                                            TimezoneDST=timezone_dst, TimezoneStandard=timezone_standard,
-                                            TotalRAM=total_ram, Uptime=uptime)
-
-
-def propbundle_Confidence(uco_object, value=Missing()):
+    if _VALIDATE:
+        if available_ram is not _MISSING:
+            assert _is_integer(available_ram),\
+            "[propbundle_ComputerSpecification] available_ram must be of type Long."
+        if bios_date is not _MISSING:
+            assert (type(bios_date) is _datetime or isinstance(bios_date, _datetime)),\
+            "[propbundle_ComputerSpecification] bios_date must be of type Datetime."
+        if bios_manufacturer is not _MISSING:
+            assert (type(bios_manufacturer) is str or isinstance(bios_manufacturer, str)),\
+            "[propbundle_ComputerSpecification] bios_manufacturer must be of type String."
+        if bios_release_date is not _MISSING:
+            assert (type(bios_release_date) is _datetime or isinstance(bios_release_date, _datetime)),\
+            "[propbundle_ComputerSpecification] bios_release_date must be of type Datetime."
+        if bios_serial_number is not _MISSING:
+            assert (type(bios_serial_number) is str or isinstance(bios_serial_number, str)),\
+            "[propbundle_ComputerSpecification] bios_serial_number must be of type String."
+        if bios_version is not _MISSING:
+            assert (type(bios_version) is str or isinstance(bios_version, str)),\
+            "[propbundle_ComputerSpecification] bios_version must be of type String."
+        if local_time is not _MISSING:
+            assert (type(local_time) is _datetime or isinstance(local_time, _datetime)),\
+            "[propbundle_ComputerSpecification] local_time must be of type Datetime."
+        if network_interface_refs is not _MISSING:
+            _check_list_of(network_interface_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_ComputerSpecification] network_interface_refs must be of type List of Trace.")
+        if processor_architecture is not _MISSING:
+            assert (type(processor_architecture) is str or isinstance(processor_architecture, str)),\
+            "[propbundle_ComputerSpecification] processor_architecture must be of type String."
+        if cpu_family is not _MISSING:
+            assert (type(cpu_family) is str or isinstance(cpu_family, str)),\
+            "[propbundle_ComputerSpecification] cpu_family must be of type String."
+        if cpu is not _MISSING:
+            assert (type(cpu) is str or isinstance(cpu, str)),\
+            "[propbundle_ComputerSpecification] cpu must be of type String."
+        if gpu_family is not _MISSING:
+            assert (type(gpu_family) is str or isinstance(gpu_family, str)),\
+            "[propbundle_ComputerSpecification] gpu_family must be of type String."
+        if gpu is not _MISSING:
+            assert (type(gpu) is str or isinstance(gpu, str)),\
+            "[propbundle_ComputerSpecification] gpu must be of type String."
+        if system_time is not _MISSING:
+            assert (type(system_time) is _datetime or isinstance(system_time, _datetime)),\
+            "[propbundle_ComputerSpecification] system_time must be of type Datetime."
+        if timezone_dst is not _MISSING:
+            assert (type(timezone_dst) is str or isinstance(timezone_dst, str)),\
+            "[propbundle_ComputerSpecification] timezone_dst must be of type String."
+        if timezone_standard is not _MISSING:
+            assert (type(timezone_standard) is str or isinstance(timezone_standard, str)),\
+            "[propbundle_ComputerSpecification] timezone_standard must be of type String."
+        if total_ram is not _MISSING:
+            assert _is_integer(total_ram),\
+            "[propbundle_ComputerSpecification] total_ram must be of type Long."
+        #TODO:Why is uptime a string? This needs further clarification. Startup time? Or total time to boot?
+        if uptime is not _MISSING:
+            assert (type(uptime) is str or isinstance(uptime, str)),\
+            "[propbundle_ComputerSpecification] uptime must be of type String."
+
+    properties = _present(AvailableRAM=available_ram, BIOSDate=bios_date, BIOSManufacturer=bios_manufacturer,
+                          BIOSReleaseDate=bios_release_date, BIOSSerialNumber=bios_serial_number,
+                          BIOSVersion=bios_version, CurrentSystemDate=current_system_date, Hostname=hostname,
+                          LocalTime=local_time, NetworkInterfaceRefs=network_interface_refs,
+                          ProcessorArchitecture=processor_architecture, CPUFamily=cpu_family, CPU=cpu,
+                          GPUFamily=gpu_family, SystemTime=system_time, TimezoneDST=timezone_dst,
+                          TimezoneStandard=timezone_standard, TotalRAM=total_ram, Uptime=uptime)
+    return uco_object.create_PropertyBundle('ComputerSpecification', **properties)
+
+
+def propbundle_Confidence(uco_object, value=_MISSING):
     '''
     :param Value: Exactly one occurrence of type ControlledVocabulary.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_Confidence] value is required."
-    if not isinstance(value, Missing):
-        assert (isinstance(value, case.CoreObject) and (value.type=='ControlledVocabulary')),\
-        "[propbundle_Confidence] value must be of type ControlledVocabulary."
+    _require(value, "[propbundle_Confidence] value is required.")
+
+    if _VALIDATE:
+        _check_instance_of(value, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[propbundle_Confidence] value must be of type ControlledVocabulary.")
 
-    return uco_object.create_PropertyBundle('Confidence', Value=value)
+    properties = _present(Value=value)
+    return uco_object.create_PropertyBundle('Confidence', **properties)
 
 
-def propbundle_Contact(uco_object, application_ref=Missing(), contact_id=Missing(), email_address_refs=Missing(),
-                       first_name=Missing(), last_name=Missing(), middle_name=Missing(), contact_name=Missing(),
-                       phone_numbers=Missing(), contact_type=Missing(), screen_name=Missing()):
+def propbundle_Contact(uco_object, application_ref=_MISSING, contact_id=_MISSING, email_address_refs=_MISSING,
+                       first_name=_MISSING, last_name=_MISSING, middle_name=_MISSING, contact_name=_MISSING,
+                       phone_numbers=_MISSING, contact_type=_MISSING, screen_name=_MISSING):
     '''
     :param ApplicationRef: At most one occurrence of type Trace.
     :param ContactID: At most one value of type String.
@@ -1059,52 +1133,48 @@ def propbundle_Contact(uco_object, application_ref=Missing(), contact_id=Missing
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_Contact] application_ref must be of type Trace."
-    if not isinstance(contact_id, Missing):
-        assert isinstance(contact_id, str),\
-        "[propbundle_Contact] contact_id must be of type String."
-    if not isinstance(email_address_refs, Missing):
-        assert isinstance(email_address_refs, list),\
-        "[propbundle_Contact] email_address_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in email_address_refs),\
-        "[propbundle_Contact] email_address_refs must be of type List of Trace."
-    if not isinstance(first_name, Missing):
-        assert isinstance(first_name, str),\
-        "[propbundle_Contact] first_name must be of type String."
-    if not isinstance(last_name, Missing):
-        assert isinstance(last_name, str),\
-        "[propbundle_Contact] last_name must be of type String."
-    if not isinstance(middle_name, Missing):
-        assert isinstance(middle_name, str),\
-        "[propbundle_Contact] middle_name must be of type String."
-    if not isinstance(contact_name, Missing):
-        assert isinstance(contact_name, str),\
-        "[propbundle_Contact] contact_name must be of type String."
-    if not isinstance(phone_numbers, Missing):
-        assert isinstance(phone_numbers, list),\
-        "[propbundle_Contact] phone_numbers must be of type List of String."
-        assert all(isinstance(i, str) for i in phone_numbers),\
-        "[propbundle_Contact] phone_numbers must be of type List of String."
-    if not isinstance(contact_type, Missing):
-        assert isinstance(contact_type, str),\
-        "[propbundle_Contact] contact_type must be of type String."
-    if not isinstance(screen_name, Missing):
-        assert isinstance(screen_name, str),\
-        "[propbundle_Contact] screen_name must be of type String."
-
-    return uco_object.create_PropertyBundle('Contact', ApplicationRef=application_ref, ContactID=contact_id,
-                                            EmailAddressRefs=email_address_refs, FirstName=first_name,
-                                            LastName=last_name, MiddleName=middle_name, ContactName=contact_name,
-                                            PhoneNumbers=phone_numbers, ContactType=contact_type,
-                                            ScreenName=screen_name)
-
-
-def propbundle_ContentData(uco_object, byte_order=Missing(), mime_class=Missing(), mime_type=Missing(),
-                           magic_number=Missing(), size_in_bytes=Missing(), data_payload=Missing(),
-                           data_payload_ref_url=Missing(), entropy=Missing(), hashes=Missing(),
-                           is_encrypted=Missing()):
+    if _VALIDATE:
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Contact] application_ref must be of type Trace.")
+        if contact_id is not _MISSING:
+            assert (type(contact_id) is str or isinstance(contact_id, str)),\
+            "[propbundle_Contact] contact_id must be of type String."
+        if email_address_refs is not _MISSING:
+            _check_list_of(email_address_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_Contact] email_address_refs must be of type List of Trace.")
+        if first_name is not _MISSING:
+            assert (type(first_name) is str or isinstance(first_name, str)),\
+            "[propbundle_Contact] first_name must be of type String."
+        if last_name is not _MISSING:
+            assert (type(last_name) is str or isinstance(last_name, str)),\
+            "[propbundle_Contact] last_name must be of type String."
+        if middle_name is not _MISSING:
+            assert (type(middle_name) is str or isinstance(middle_name, str)),\
+            "[propbundle_Contact] middle_name must be of type String."
+        if contact_name is not _MISSING:
+            assert (type(contact_name) is str or isinstance(contact_name, str)),\
+            "[propbundle_Contact] contact_name must be of type String."
+        if phone_numbers is not _MISSING:
+            _check_list_of(phone_numbers, str, None,
+                           "[propbundle_Contact] phone_numbers must be of type List of String.")
+        if contact_type is not _MISSING:
+            assert (type(contact_type) is str or isinstance(contact_type, str)),\
+            "[propbundle_Contact] contact_type must be of type String."
+        if screen_name is not _MISSING:
+            assert (type(screen_name) is str or isinstance(screen_name, str)),\
+            "[propbundle_Contact] screen_name must be of type String."
+
+    properties = _present(ApplicationRef=application_ref, ContactID=contact_id, EmailAddressRefs=email_address_refs,
+                          FirstName=first_name, LastName=last_name, MiddleName=middle_name, ContactName=contact_name,
+                          PhoneNumbers=phone_numbers, ContactType=contact_type, ScreenName=screen_name)
+    return uco_object.create_PropertyBundle('Contact', **properties)
+
+
+def propbundle_ContentData(uco_object, byte_order=_MISSING, mime_class=_MISSING, mime_type=_MISSING,
+                           magic_number=_MISSING, size_in_bytes=_MISSING, data_payload=_MISSING,
+                           data_payload_ref_url=_MISSING, entropy=_MISSING, hashes=_MISSING,
+                           is_encrypted=_MISSING):
     '''
     :param ByteOrder: At most one occurrence of type ControlledVocabulary.
     :param MIMEClass: At most one value of type String.
@@ -1119,47 +1189,46 @@ def propbundle_ContentData(uco_object, byte_order=Missing(), mime_class=Missing(
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(byte_order, Missing):
-        assert (isinstance(byte_order, case.CoreObject) and (byte_order.type=='ControlledVocabulary')),\
-        "[propbundle_ContentData] byte_order must be of type ControlledVocabulary."
-    if not isinstance(mime_class, Missing):
-        assert isinstance(mime_class, str),\
-        "[propbundle_ContentData] mime_class must be of type String."
-    if not isinstance(mime_type, Missing):
-        assert isinstance(mime_type, str),\
-        "[propbundle_ContentData] mime_type must be of type String."
-    if not isinstance(magic_number, Missing):
-        assert isinstance(magic_number, str),\
-        "[propbundle_ContentData] magic_number must be of type String."
-    if not isinstance(size_in_bytes, Missing):
-        assert isinstance(size_in_bytes, long),\
-        "[propbundle_ContentData] size_in_bytes must be of type Long."
-    if not isinstance(data_payload, Missing):
-        assert isinstance(data_payload, str),\
-        "[propbundle_ContentData] data_payload must be of type String."
-    if not isinstance(data_payload_ref_url, Missing):
-        assert (isinstance(data_payload_ref_url, case.CoreObject) and (data_payload_ref_url.type=='Trace')),\
-        "[propbundle_ContentData] data_payload_ref_url must be of type Trace."
-    if not isinstance(entropy, Missing):
-        assert isinstance(entropy, float),\
-        "[propbundle_ContentData] entropy must be of type Float."
-    if not isinstance(hashes, Missing):
-        assert isinstance(hashes, list),\
-        "[propbundle_ContentData] hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in hashes),\
-        "[propbundle_ContentData] hashes must be of type List of Hash."
-    if not isinstance(is_encrypted, Missing):
-        assert isinstance(is_encrypted, bool),\
-        "[propbundle_ContentData] is_encrypted must be of type Bool."
-
-    return uco_object.create_PropertyBundle('ContentData', ByteOrder=byte_order, MIMEClass=mime_class,
-                                            MIMEType=mime_type, MagicNumber=magic_number, SizeInBytes=size_in_bytes,
-                                            DataPayload=data_payload, DataPayloadRefURL=data_payload_ref_url,
-                                            Entropy=entropy, Hashes=hashes, IsEncrypted=is_encrypted)
-
-
-def propbundle_Device(uco_object, device_type=Missing(), manufacturer=Missing(), model=Missing(),
-                      serial_number=Missing(), **kwargs):
+    if _VALIDATE:
+        if byte_order is not _MISSING:
+            _check_instance_of(byte_order, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_ContentData] byte_order must be of type ControlledVocabulary.")
+        if mime_class is not _MISSING:
+            assert (type(mime_class) is str or isinstance(mime_class, str)),\
+            "[propbundle_ContentData] mime_class must be of type String."
+        if mime_type is not _MISSING:
+            assert (type(mime_type) is str or isinstance(mime_type, str)),\
+            "[propbundle_ContentData] mime_type must be of type String."
+        if magic_number is not _MISSING:
+            assert (type(magic_number) is str or isinstance(magic_number, str)),\
+            "[propbundle_ContentData] magic_number must be of type String."
+        if size_in_bytes is not _MISSING:
+            assert _is_integer(size_in_bytes),\
+            "[propbundle_ContentData] size_in_bytes must be of type Long."
+        if data_payload is not _MISSING:
+            assert (type(data_payload) is str or isinstance(data_payload, str)),\
+            "[propbundle_ContentData] data_payload must be of type String."
+        if data_payload_ref_url is not _MISSING:
+            _check_instance_of(data_payload_ref_url, _CoreObject, _TAG_TRACE,
+                               "[propbundle_ContentData] data_payload_ref_url must be of type Trace.")
+        if entropy is not _MISSING:
+            assert (type(entropy) is float or isinstance(entropy, float)),\
+            "[propbundle_ContentData] entropy must be of type Float."
+        if hashes is not _MISSING:
+            _check_list_of(hashes, _DuckObject, _TAG_HASH,
+                           "[propbundle_ContentData] hashes must be of type List of Hash.")
+        if is_encrypted is not _MISSING:
+            assert type(is_encrypted) is bool,\
+            "[propbundle_ContentData] is_encrypted must be of type Bool."
+
+    properties = _present(ByteOrder=byte_order, MIMEClass=mime_class, MIMEType=mime_type, MagicNumber=magic_number,
+                          SizeInBytes=size_in_bytes, DataPayload=data_payload, DataPayloadRefURL=data_payload_ref_url,
+                          Entropy=entropy, Hashes=hashes, IsEncrypted=is_encrypted)
+    return uco_object.create_PropertyBundle('ContentData', **properties)
+
+
+def propbundle_Device(uco_object, device_type=_MISSING, manufacturer=_MISSING, model=_MISSING,
+                      serial_number=_MISSING, **kwargs):
     '''
     :param DeviceType: At most one occurrence of type ControlledVocabulary.
     :param Manufacturer: At most one value of type String.
@@ -1168,25 +1237,26 @@ def propbundle_Device(uco_object, device_type=Missing(), manufacturer=Missing(),
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(device_type, Missing):
-        assert (isinstance(device_type, case.CoreObject) and (device_type.type=='ControlledVocabulary')),\
-        "[propbundle_Device] device_type must be of type ControlledVocabulary."
-    if not isinstance(manufacturer, Missing):
-        assert isinstance(manufacturer, str),\
-        "[propbundle_Device] manufacturer must be of type String."
-    if not isinstance(model, Missing):
-        assert isinstance(model, str),\
-        "[propbundle_Device] model must be of type String."
-    if not isinstance(serial_number, Missing):
-        assert isinstance(serial_number, str),\
-        "[propbundle_Device] serial_number must be of type String."
+    if _VALIDATE:
+        if device_type is not _MISSING:
+            _check_instance_of(device_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_Device] device_type must be of type ControlledVocabulary.")
+        if manufacturer is not _MISSING:
+            assert (type(manufacturer) is str or isinstance(manufacturer, str)),\
+            "[propbundle_Device] manufacturer must be of type String."
+        if model is not _MISSING:
+            assert (type(model) is str or isinstance(model, str)),\
+            "[propbundle_Device] model must be of type String."
+        if serial_number is not _MISSING:
+            assert (type(serial_number) is str or isinstance(serial_number, str)),\
+            "[propbundle_Device] serial_number must be of type String."
 
-    return uco_object.create_PropertyBundle('Device', DeviceType=device_type, Manufacturer=manufacturer, Model=model,
-                                            SerialNumber=serial_number)
+    properties = _present(DeviceType=device_type, Manufacturer=manufacturer, Model=model, SerialNumber=serial_number)
+    return uco_object.create_PropertyBundle('Device', **properties)
 
 
-def propbundle_DigitalAccount(uco_object, account_login=Missing(), first_login_time=Missing(),
-                              last_login_time=Missing(), is_disabled=Missing(), display_name=Missing()):
+def propbundle_DigitalAccount(uco_object, account_login=_MISSING, first_login_time=_MISSING,
+                              last_login_time=_MISSING, is_disabled=_MISSING, display_name=_MISSING):
     '''
     :param AccountLogin: Any number of values of type String.
     :param FirstLoginTime: At most one value of type Datetime.
@@ -1196,32 +1266,31 @@ def propbundle_DigitalAccount(uco_object, account_login=Missing(), first_login_t
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(account_login, Missing):
-        assert isinstance(account_login, list),\
-        "[propbundle_DigitalAccount] account_login must be of type List of String."
-        assert all(isinstance(i, str) for i in account_login),\
-        "[propbundle_DigitalAccount] account_login must be of type List of String."
-    if not isinstance(first_login_time, Missing):
-        assert isinstance(first_login_time, datetime.datetime),\
-        "[propbundle_DigitalAccount] first_login_time must be of type Datetime."
-    if not isinstance(last_login_time, Missing):
-        assert isinstance(last_login_time, datetime.datetime),\
-        "[propbundle_DigitalAccount] last_login_time must be of type Datetime."
-    if not isinstance(is_disabled, Missing):
-        assert isinstance(is_disabled, bool),\
-        "[propbundle_DigitalAccount] is_disabled must be of type Bool."
-    if not isinstance(display_name, Missing):
-        assert isinstance(display_name, str),\
-        "[propbundle_DigitalAccount] display_name must be of type String."
-
-    return uco_object.create_PropertyBundle('DigitalAccount', AccountLogin=account_login,
-                                            FirstLoginTime=first_login_time, LastLoginTime=last_login_time,
-                                            IsDisabled=is_disabled, DisplayName=display_name)
-
-
-def propbundle_DigitalSignatureInfo(uco_object, signature_exists=Missing(), signature_verified=Missing(),
-                                    certificate_issuer=Missing(), certificate_subject=Missing(),
-                                    signature_description=Missing()):
+    if _VALIDATE:
+        if account_login is not _MISSING:
+            _check_list_of(account_login, str, None,
+                           "[propbundle_DigitalAccount] account_login must be of type List of String.")
+        if first_login_time is not _MISSING:
+            assert (type(first_login_time) is _datetime or isinstance(first_login_time, _datetime)),\
+            "[propbundle_DigitalAccount] first_login_time must be of type Datetime."
+        if last_login_time is not _MISSING:
+            assert (type(last_login_time) is _datetime or isinstance(last_login_time, _datetime)),\
+            "[propbundle_DigitalAccount] last_login_time must be of type Datetime."
+        if is_disabled is not _MISSING:
+            assert type(is_disabled) is bool,\
+            "[propbundle_DigitalAccount] is_disabled must be of type Bool."
+        if display_name is not _MISSING:
+            assert (type(display_name) is str or isinstance(display_name, str)),\
+            "[propbundle_DigitalAccount] display_name must be of type String."
+
+    properties = _present(AccountLogin=account_login, FirstLoginTime=first_login_time, LastLoginTime=last_login_time,
+                          IsDisabled=is_disabled, DisplayName=display_name)
+    return uco_object.create_PropertyBundle('DigitalAccount', **properties)
+
+
+def propbundle_DigitalSignatureInfo(uco_object, signature_exists=_MISSING, signature_verified=_MISSING,
+                                    certificate_issuer=_MISSING, certificate_subject=_MISSING,
+                                    signature_description=_MISSING):
     '''
     :param SignatureExists: Exactly one value of type Bool.
     :param SignatureVerified: Exactly one value of type Bool.
@@ -1231,33 +1300,33 @@ def propbundle_DigitalSignatureInfo(uco_object, signature_exists=Missing(), sign
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(signature_exists, Missing),\
-    "[propbundle_DigitalSignature] signature_exists is required."
-    if not isinstance(signature_exists, Missing):
-        assert isinstance(signature_exists, bool),\
+    _require(signature_exists, "[propbundle_DigitalSignature] signature_exists is required.")
+
+    if _VALIDATE:
+        assert type(signature_exists) is bool,\
         "[propbundle_DigitalSignature] signature_exists must be of type Bool."
 
-    if not isinstance(signature_verified, Missing):
-        assert isinstance(signature_verified, bool),\
-        "[propbundle_DigitalSignature] signature_verified must be of type Bool."
-    if not isinstance(certificate_issuer, Missing):
-        assert (isinstance(certificate_issuer, case.CoreObject) and (certificate_issuer.type=='Identity')),\
-        "[propbundle_DigitalSignature] certificate_issuer must be of type Identity."
-    if not isinstance(certificate_subject, Missing):
-        assert (isinstance(certificate_subject, case.CoreObject) and (certificate_subject.type=='Identity')),\
-        "[propbundle_DigitalSignature] certificate_subject must be of type Identity."
-    if not isinstance(signature_description, Missing):
-        assert isinstance(signature_description, str),\
-        "[propbundle_DigitalSignature] signature_description must be of type String."
+        if signature_verified is not _MISSING:
+            assert type(signature_verified) is bool,\
+            "[propbundle_DigitalSignature] signature_verified must be of type Bool."
+        if certificate_issuer is not _MISSING:
+            _check_instance_of(certificate_issuer, _CoreObject, _TAG_IDENTITY,
+                               "[propbundle_DigitalSignature] certificate_issuer must be of type Identity.")
+        if certificate_subject is not _MISSING:
+            _check_instance_of(certificate_subject, _CoreObject, _TAG_IDENTITY,
+                               "[propbundle_DigitalSignature] certificate_subject must be of type Identity.")
+        if signature_description is not _MISSING:
+            assert (type(signature_description) is str or isinstance(signature_description, str)),\
+            "[propbundle_DigitalSignature] signature_description must be of type String."
 
-    return uco_object.create_PropertyBundle('DigitalSignatureInfo', SignatureExists=signature_exists,
-                                            SignatureVerified=signature_verified, CertificateIssuer=certificate_issuer,
-                                            CertificateSubject=certificate_subject,
-                                            SignatureDescription=signature_description)
+    properties = _present(SignatureExists=signature_exists, SignatureVerified=signature_verified,
+                          CertificateIssuer=certificate_issuer, CertificateSubject=certificate_subject,
+                          SignatureDescription=signature_description)
+    return uco_object.create_PropertyBundle('DigitalSignatureInfo', **properties)
 
 
-def propbundle_Disk(uco_object, disk_size=Missing(), disk_type=Missing(), free_space=Missing(),
-                    partition_refs=Missing()):
+def propbundle_Disk(uco_object, disk_size=_MISSING, disk_type=_MISSING, free_space=_MISSING,
+                    partition_refs=_MISSING):
     '''
     :param DiskSize: At most one value of type Long.
     :param DiskType: At most one occurrence of type ControlledVocabulary.
@@ -1266,26 +1335,27 @@ def propbundle_Disk(uco_object, disk_size=Missing(), disk_type=Missing(), free_s
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(disk_size, Missing):
-        assert isinstance(disk_size, long),\
-        "[propbundle_Disk] disk_size must be of type Long."
-    if not isinstance(disk_type, Missing):
-        assert (isinstance(disk_type, case.DuckObject) and (disk_type.type=='ControlledDictionary')),\
-        "[propbundle_Disk] disk_type must be of type ControlledDictionary."
-    if not isinstance(free_space, Missing):
-        assert isinstance(free_space, long),\
-        "[propbundle_Disk] free_space must be of type Long."
-    if not isinstance(partition_refs, Missing):
-        assert (isinstance(partition_refs, case.CoreObject) and (partition_refs.type=='Trace')),\
-        "[propbundle_Disk] partition_refs must be of type Trace."
+    if _VALIDATE:
+        if disk_size is not _MISSING:
+            assert _is_integer(disk_size),\
+            "[propbundle_Disk] disk_size must be of type Long."
+        if disk_type is not _MISSING:
+            _check_instance_of(disk_type, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                               "[propbundle_Disk] disk_type must be of type ControlledDictionary.")
+        if free_space is not _MISSING:
+            assert _is_integer(free_space),\
+            "[propbundle_Disk] free_space must be of type Long."
+        if partition_refs is not _MISSING:
+            _check_instance_of(partition_refs, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Disk] partition_refs must be of type Trace.")
 
-    return uco_object.create_PropertyBundle('Disk', DiskSize=disk_size, DiskType=disk_type,
-                                            FreeSpace=free_space, PartitionRefs=partition_refs)
+    properties = _present(DiskSize=disk_size, DiskType=disk_type, FreeSpace=free_space, PartitionRefs=partition_refs)
+    return uco_object.create_PropertyBundle('Disk', **properties)
 
 
-def propbundle_DiskPartition(uco_object, mount_point=Missing(), partition_id=Missing(), partition_length=Missing(),
-                             partition_offset=Missing(), space_left=Missing(), space_used=Missing(),
-                             total_space=Missing(), disk_partition_type=Missing(), created_time=Missing()):
+def propbundle_DiskPartition(uco_object, mount_point=_MISSING, partition_id=_MISSING, partition_length=_MISSING,
+                             partition_offset=_MISSING, space_left=_MISSING, space_used=_MISSING,
+                             total_space=_MISSING, disk_partition_type=_MISSING, created_time=_MISSING):
     '''
     :param MountPoint: At most one value of type String.
     :param PartitionID: At most one value of type Integer.
@@ -1299,105 +1369,108 @@ def propbundle_DiskPartition(uco_object, mount_point=Missing(), partition_id=Mis
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(mount_point, Missing):
-        assert isinstance(mount_point, str),\
-        "[propbundle_DiskPartition] mount_point must be of type String."
-    if not isinstance(partition_id, Missing):
-        assert isinstance(partition_id, int),\
-        "[propbundle_DiskPartition] partition_id must be of type Integer."
-    if not isinstance(partition_length, Missing):
-        assert isinstance(partition_length, long),\
-        "[propbundle_DiskPartition] partition_length must be of type Long."
-    if not isinstance(partition_offset, Missing):
-        assert isinstance(partition_offset, long),\
-        "[propbundle_DiskPartition] partition_offset must be of type Long."
-    if not isinstance(space_left, Missing):
-        assert isinstance(space_left, long),\
-        "[propbundle_DiskPartition] space_left must be of type Long."
-    if not isinstance(space_used, Missing):
-        assert isinstance(space_used, long),\
-        "[propbundle_DiskPartition] space_used must be of type Long."
-    if not isinstance(total_space, Missing):
-        assert isinstance(total_space, long),\
-        "[propbundle_DiskPartition] total_space must be of type Long."
-    if not isinstance(disk_partition_type, Missing):
-        assert (isinstance(disk_partition_type, case.DuckObject) and
-                (disk_partition_type.type=='ControlledDictionary')),\
-                "[propbundle_DiskPartition] email_address_ref must be of type ControlledDictionary."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_DiskPartition] created_time must be of type Datetime."
-
-    return uco_object.create_PropertyBundle('DiskPartition', MountPoint=mount_point, PartitionID=partition_id,
-                                            PartitionLength=partition_length, PartitionOffset=partition_offset,
-                                            SpaceLeft=space_left, SpaceUsed=space_used, TotalSpace=total_space,
-                                            DiskPartitionType=disk_partition_type, CreatedTime=created_time)
-
-
-def propbundle_DomainName(uco_object, value=Missing(), is_tld=Missing()):
+    if _VALIDATE:
+        if mount_point is not _MISSING:
+            assert (type(mount_point) is str or isinstance(mount_point, str)),\
+            "[propbundle_DiskPartition] mount_point must be of type String."
+        if partition_id is not _MISSING:
+            assert _is_integer(partition_id),\
+            "[propbundle_DiskPartition] partition_id must be of type Integer."
+        if partition_length is not _MISSING:
+            assert _is_integer(partition_length),\
+            "[propbundle_DiskPartition] partition_length must be of type Long."
+        if partition_offset is not _MISSING:
+            assert _is_integer(partition_offset),\
+            "[propbundle_DiskPartition] partition_offset must be of type Long."
+        if space_left is not _MISSING:
+            assert _is_integer(space_left),\
+            "[propbundle_DiskPartition] space_left must be of type Long."
+        if space_used is not _MISSING:
+            assert _is_integer(space_used),\
+            "[propbundle_DiskPartition] space_used must be of type Long."
+        if total_space is not _MISSING:
+            assert _is_integer(total_space),\
+            "[propbundle_DiskPartition] total_space must be of type Long."
+        if disk_partition_type is not _MISSING:
+            _check_instance_of(disk_partition_type, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                               "[propbundle_DiskPartition] email_address_ref must be of type ControlledDictionary.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_DiskPartition] created_time must be of type Datetime."
+
+    properties = _present(MountPoint=mount_point, PartitionID=partition_id, PartitionLength=partition_length,
+                          PartitionOffset=partition_offset, SpaceLeft=space_left, SpaceUsed=space_used,
+                          TotalSpace=total_space, DiskPartitionType=disk_partition_type, CreatedTime=created_time)
+    return uco_object.create_PropertyBundle('DiskPartition', **properties)
+
+
+def propbundle_DomainName(uco_object, value=_MISSING, is_tld=_MISSING):
     '''
     :param Value: Exactly one value of type String.
     :param IsTLD: At most one value of type Bool.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_DomainName] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(value, "[propbundle_DomainName] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
         "[propbundle_DomainName] value must be of type String."
 
-    if not isinstance(is_tld, Missing):
-        assert isinstance(is_tld, bool),\
-        "[propbundle_DomainName] is_tld must be of type Bool."
+        if is_tld is not _MISSING:
+            assert type(is_tld) is bool,\
+            "[propbundle_DomainName] is_tld must be of type Bool."
 
-    return uco_object.create_PropertyBundle('DomainName', Value=value, IsTLD=is_tld)
+    properties = _present(Value=value, IsTLD=is_tld)
+    return uco_object.create_PropertyBundle('DomainName', **properties)
 
 
-def propbundle_EmailAccount(uco_object, email_address_ref=Missing()):
+def propbundle_EmailAccount(uco_object, email_address_ref=_MISSING):
     '''
     :param EmailAddressRef: Exactly one occurrence of type Trace.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(email_address_ref, Missing),\
-    "[propbundle_EmailAccount] email_address_ref is required."
-    if not isinstance(email_address_ref, Missing):
-        assert (isinstance(email_address_ref, case.CoreObject) and (email_address_ref.type=='Trace')),\
-        "[propbundle_EmailAccount] email_address_ref must be of type Trace."
+    _require(email_address_ref, "[propbundle_EmailAccount] email_address_ref is required.")
 
-    return uco_object.create_PropertyBundle('EmailAccount', EmailAddressRef=email_address_ref)
+    if _VALIDATE:
+        _check_instance_of(email_address_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_EmailAccount] email_address_ref must be of type Trace.")
 
+    properties = _present(EmailAddressRef=email_address_ref)
+    return uco_object.create_PropertyBundle('EmailAccount', **properties)
 
-def propbundle_EmailAddress(uco_object, value=Missing(), display_name=Missing()):
+
+def propbundle_EmailAddress(uco_object, value=_MISSING, display_name=_MISSING):
     '''
     :param Value: Exactly one value of type String.
     :param DisplayName: At most one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_EmailAddress] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(value, "[propbundle_EmailAddress] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
         "[propbundle_EmailAddress] value must be of type String."
 
-    if not isinstance(display_name, Missing):
-        assert isinstance(display_name, str),\
-        "[propbundle_EmailAddress] display_name must be of type String."
+        if display_name is not _MISSING:
+            assert (type(display_name) is str or isinstance(display_name, str)),\
+            "[propbundle_EmailAddress] display_name must be of type String."
 
-    return uco_object.create_PropertyBundle('EmailAddress', Value=value, DisplayName=display_name)
+    properties = _present(Value=value, DisplayName=display_name)
+    return uco_object.create_PropertyBundle('EmailAddress', **properties)
 
 
-def propbundle_EmailMessage(uco_object, is_mime_encoded=Missing(), is_multipart=Missing(),
-                            application_ref=Missing(), bcc_refs=Missing(), cc_refs=Missing(), body=Missing(),
-                            body_multipart=Missing(), body_raw_ref=Missing(), categories=Missing(),
-                            content_disposition=Missing(), content_type=Missing(), from_ref=Missing(),
-                            to_refs=Missing(), header_raw_ref=Missing(), in_reply_to_refs=Missing(), is_read=Missing(),
-                            labels=Missing(), message_id_ref=Missing(), modified_time=Missing(),
-                            other_headers=Missing(), priority=Missing(), received_lines=Missing(),
-                            received_time=Missing(), references=Missing(), sender_ref=Missing(),
-                            sent_time=Missing(), subject=Missing(), x_mailer=Missing(), x_originating_ip=Missing()):
+def propbundle_EmailMessage(uco_object, is_mime_encoded=_MISSING, is_multipart=_MISSING,
+                            application_ref=_MISSING, bcc_refs=_MISSING, cc_refs=_MISSING, body=_MISSING,
+                            body_multipart=_MISSING, body_raw_ref=_MISSING, categories=_MISSING,
+                            content_disposition=_MISSING, content_type=_MISSING, from_ref=_MISSING,
+                            to_refs=_MISSING, header_raw_ref=_MISSING, in_reply_to_refs=_MISSING, is_read=_MISSING,
+                            labels=_MISSING, message_id_ref=_MISSING, modified_time=_MISSING,
+                            other_headers=_MISSING, priority=_MISSING, received_lines=_MISSING,
+                            received_time=_MISSING, references=_MISSING, sender_ref=_MISSING,
+                            sent_time=_MISSING, subject=_MISSING, x_mailer=_MISSING, x_originating_ip=_MISSING):
     '''
     :param IsMIMEEncoded: Exactly one value of type Bool.
     :param IsMultipart: Exactly one value of type Bool.
@@ -1431,146 +1504,127 @@ def propbundle_EmailMessage(uco_object, is_mime_encoded=Missing(), is_multipart=
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(is_mime_encoded, Missing),\
-    "[propbundle_EmailMessage] is_mime_encoded is required."
-    if not isinstance(is_mime_encoded, Missing):
-        assert isinstance(is_mime_encoded, bool),\
+    _require(is_mime_encoded, "[propbundle_EmailMessage] is_mime_encoded is required.")
+    _require(is_multipart, "[propbundle_EmailMessage] is_multipart is required.")
+
+    if _VALIDATE:
+        assert type(is_mime_encoded) is bool,\
         "[propbundle_EmailMessage] is_mime_encoded must be of type Bool."
-    assert not isinstance(is_multipart, Missing),\
-    "[propbundle_EmailMessage] is_multipart is required."
-    if not isinstance(is_multipart, Missing):
-        assert isinstance(is_multipart, bool),\
+        assert type(is_multipart) is bool,\
         "[propbundle_EmailMessage] is_multipart must be of type Bool."
 
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] application_ref must be of type Trace."
-    if not isinstance(bcc_refs, Missing):
-        assert isinstance(bcc_refs, list),\
-        "[propbundle_EmailMessage] bcc_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in bcc_refs),\
-        "[propbundle_EmailMessage] bcc_refs must be of type List of Trace."
-    if not isinstance(cc_refs, Missing):
-        assert isinstance(cc_refs, list),\
-        "[propbundle_EmailMessage] cc_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in cc_refs),\
-        "[propbundle_EmailMessage] cc_refs must be of type List of Trace."
-    if not isinstance(body, Missing):
-        assert isinstance(body, str),\
-        "[propbundle_EmailMessage] body must be of type String."
-    if not isinstance(body_multipart, Missing):
-        assert isinstance(body_multipart, list),\
-        "[propbundle_EmailMessage] body_multipart must be of type List of MIMEPartType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='MIMEPartType') for i in body_multipart),\
-        "[propbundle_EmailMessage] body_multipart must be of type List of MIMEPartType."
-    if not isinstance(body_raw_ref, Missing):
-        assert (isinstance(body_raw_ref, case.CoreObject) and (body_raw_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] body_raw_ref must be of type Trace."
-    if not isinstance(categories, Missing):
-        assert isinstance(categories, list),\
-        "[propbundle_EmailMessage] categories must be of type List of String."
-        assert all(isinstance(i, str) for i in categories),\
-        "[propbundle_EmailMessage] categories must be of type List of String."
-    if not isinstance(content_disposition, Missing):
-        assert isinstance(content_disposition, str),\
-        "[propbundle_EmailMessage] content_disposition must be of type String."
-    if not isinstance(content_type, Missing):
-        assert isinstance(content_type, str),\
-        "[propbundle_EmailMessage] content_type must be of type String."
-    if not isinstance(from_ref, Missing):
-        assert (isinstance(from_ref, case.CoreObject) and (from_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] from_ref must be of type Trace."
-    if not isinstance(to_refs, Missing):
-        assert isinstance(to_refs, list),\
-        "[propbundle_EmailMessage] to_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in to_refs),\
-        "[propbundle_EmailMessage] to_refs must be of type List of Trace."
-    if not isinstance(header_raw_ref, Missing):
-        assert (isinstance(header_raw_ref, case.CoreObject) and (header_raw_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] header_raw_ref must be of type Trace."
-    if not isinstance(in_reply_to_refs, Missing):
-        assert (isinstance(in_reply_to_refs, case.CoreObject) and (in_reply_to_refs.type=='Trace')),\
-        "[propbundle_EmailMessage] in_reply_to_refs must be of type Trace."
-    if not isinstance(is_read, Missing):
-        assert isinstance(is_read, bool),\
-        "[propbundle_EmailMessage] is_read must be of type Bool."
-    if not isinstance(labels, Missing):
-        assert isinstance(labels, list),\
-        "[propbundle_EmailMessage] labels must be of type List of String."
-        assert all(isinstance(i, str) for i in labels),\
-        "[propbundle_EmailMessage] labels must be of type List of String."
-    if not isinstance(message_id_ref, Missing):
-        assert (isinstance(message_id_ref, case.CoreObject) and (message_id_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] message_id_ref must be of type Trace."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_EmailMessage] modified_time must be of type Datetime."
-    if not isinstance(other_headers, Missing):
-        assert (isinstance(other_headers, case.DuckObject) and (other_headers.type=='Dictionary')),\
-        "[propbundle_EmailMessage] other_headers must be of type Dictionary."
-    if not isinstance(priority, Missing):
-        assert isinstance(priority, str),\
-        "[propbundle_EmailMessage] priority must be of type String."
-    if not isinstance(received_lines, Missing):
-        assert isinstance(received_lines, list),\
-        "[propbundle_EmailMessage] received_lines must be of type List of String."
-        assert all(isinstance(i, str) for i in received_lines),\
-        "[propbundle_EmailMessage] received_lines must be of type List of String."
-    if not isinstance(received_time, Missing):
-        assert isinstance(received_time, datetime.datetime),\
-        "[propbundle_EmailMessage] received_time must be of type Datetime."
-    if not isinstance(references, Missing):
-        assert isinstance(references, list),\
-        "[propbundle_EmailMessage] references must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in references),\
-        "[propbundle_EmailMessage] references must be of type List of Trace."
-    if not isinstance(sender_ref, Missing):
-        assert (isinstance(sender_ref, case.CoreObject) and (sender_ref.type=='Trace')),\
-        "[propbundle_EmailMessage] sender_ref must be of type Trace."
-    if not isinstance(sent_time, Missing):
-        assert isinstance(sent_time, datetime.datetime),\
-        "[propbundle_EmailMessage] sent_time must be of type Datetime."
-    if not isinstance(subject, Missing):
-        assert isinstance(subject, str),\
-        "[propbundle_EmailMessage] subject must be of type String."
-    if not isinstance(x_mailer, Missing):
-        assert isinstance(x_mailer, str),\
-        "[propbundle_EmailMessage] x_mailer must be of type String."
-    if not isinstance(x_originating_ip, Missing):
-        assert (isinstance(x_originating_ip, case.CoreObject) and (x_originating_ip.type=='Trace')),\
-        "[propbundle_EmailMessage] x_originating_ip must be of type Trace."
-
-    return uco_object.create_PropertyBundle('EmailMessage', IsMIMEEncoded=is_mime_encoded,
-                                            IsMultipart=is_multipart, ApplicationRef=application_ref, BCCRefs=bcc_refs,
-                                            CCRefs=cc_refs, Body=body, BodyMultipart=body_multipart,
-                                            BodyRawRef=body_raw_ref, Categories=categories,
-                                            ContentDisposition=content_disposition, ContentType=content_type,
-                                            FromRef=from_ref, ToRefs=to_refs, HeaderRawRef=header_raw_ref,
-                                            InReplyToRefs=in_reply_to_refs, IsRead=is_read, Labels=labels,
-                                            MessageIDRef=message_id_ref, ModifiedTime=modified_time,
-                                            OtherHeaders=other_headers, Priority=priority,
-                                            ReceivedLines=received_lines, ReceivedTime=received_time,
-                                            References=references, SenderRef=sender_ref, SentTime=sent_time,
-                                            Subject=subject, xMailer=x_mailer, xOriginatingIP=x_originating_ip)
-
-
-def propbundle_EncodedStream(uco_object, encoding_method=Missing()):
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] application_ref must be of type Trace.")
+        if bcc_refs is not _MISSING:
+            _check_list_of(bcc_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_EmailMessage] bcc_refs must be of type List of Trace.")
+        if cc_refs is not _MISSING:
+            _check_list_of(cc_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_EmailMessage] cc_refs must be of type List of Trace.")
+        if body is not _MISSING:
+            assert (type(body) is str or isinstance(body, str)),\
+            "[propbundle_EmailMessage] body must be of type String."
+        if body_multipart is not _MISSING:
+            _check_list_of(body_multipart, _DuckObject, _TAG_MIME_PART_TYPE,
+                           "[propbundle_EmailMessage] body_multipart must be of type List of MIMEPartType.")
+        if body_raw_ref is not _MISSING:
+            _check_instance_of(body_raw_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] body_raw_ref must be of type Trace.")
+        if categories is not _MISSING:
+            _check_list_of(categories, str, None,
+                           "[propbundle_EmailMessage] categories must be of type List of String.")
+        if content_disposition is not _MISSING:
+            assert (type(content_disposition) is str or isinstance(content_disposition, str)),\
+            "[propbundle_EmailMessage] content_disposition must be of type String."
+        if content_type is not _MISSING:
+            assert (type(content_type) is str or isinstance(content_type, str)),\
+            "[propbundle_EmailMessage] content_type must be of type String."
+        if from_ref is not _MISSING:
+            _check_instance_of(from_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] from_ref must be of type Trace.")
+        if to_refs is not _MISSING:
+            _check_list_of(to_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_EmailMessage] to_refs must be of type List of Trace.")
+        if header_raw_ref is not _MISSING:
+            _check_instance_of(header_raw_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] header_raw_ref must be of type Trace.")
+        if in_reply_to_refs is not _MISSING:
+            _check_instance_of(in_reply_to_refs, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] in_reply_to_refs must be of type Trace.")
+        if is_read is not _MISSING:
+            assert type(is_read) is bool,\
+            "[propbundle_EmailMessage] is_read must be of type Bool."
+        if labels is not _MISSING:
+            _check_list_of(labels, str, None,
+                           "[propbundle_EmailMessage] labels must be of type List of String.")
+        if message_id_ref is not _MISSING:
+            _check_instance_of(message_id_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] message_id_ref must be of type Trace.")
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_EmailMessage] modified_time must be of type Datetime."
+        if other_headers is not _MISSING:
+            _check_instance_of(other_headers, _DuckObject, _TAG_DICTIONARY,
+                               "[propbundle_EmailMessage] other_headers must be of type Dictionary.")
+        if priority is not _MISSING:
+            assert (type(priority) is str or isinstance(priority, str)),\
+            "[propbundle_EmailMessage] priority must be of type String."
+        if received_lines is not _MISSING:
+            _check_list_of(received_lines, str, None,
+                           "[propbundle_EmailMessage] received_lines must be of type List of String.")
+        if received_time is not _MISSING:
+            assert (type(received_time) is _datetime or isinstance(received_time, _datetime)),\
+            "[propbundle_EmailMessage] received_time must be of type Datetime."
+        if references is not _MISSING:
+            _check_list_of(references, _CoreObject, _TAG_TRACE,
+                           "[propbundle_EmailMessage] references must be of type List of Trace.")
+        if sender_ref is not _MISSING:
+            _check_instance_of(sender_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] sender_ref must be of type Trace.")
+        if sent_time is not _MISSING:
+            assert (type(sent_time) is _datetime or isinstance(sent_time, _datetime)),\
+            "[propbundle_EmailMessage] sent_time must be of type Datetime."
+        if subject is not _MISSING:
+            assert (type(subject) is str or isinstance(subject, str)),\
+            "[propbundle_EmailMessage] subject must be of type String."
+        if x_mailer is not _MISSING:
+            assert (type(x_mailer) is str or isinstance(x_mailer, str)),\
+            "[propbundle_EmailMessage] x_mailer must be of type String."
+        if x_originating_ip is not _MISSING:
+            _check_instance_of(x_originating_ip, _CoreObject, _TAG_TRACE,
+                               "[propbundle_EmailMessage] x_originating_ip must be of type Trace.")
+
+    properties = _present(IsMIMEEncoded=is_mime_encoded, IsMultipart=is_multipart, ApplicationRef=application_ref,
+                          BCCRefs=bcc_refs, CCRefs=cc_refs, Body=body, BodyMultipart=body_multipart,
+                          BodyRawRef=body_raw_ref, Categories=categories, ContentDisposition=content_disposition,
+                          ContentType=content_type, FromRef=from_ref, ToRefs=to_refs, HeaderRawRef=header_raw_ref,
+                          InReplyToRefs=in_reply_to_refs, IsRead=is_read, Labels=labels, MessageIDRef=message_id_ref,
+                          ModifiedTime=modified_time, OtherHeaders=other_headers, Priority=priority,
+                          ReceivedLines=received_lines, ReceivedTime=received_time, References=references,
+                          SenderRef=sender_ref, SentTime=sent_time, Subject=subject, xMailer=x_mailer,
+                          xOriginatingIP=x_originating_ip)
+    return uco_object.create_PropertyBundle('EmailMessage', **properties)
+
+
+def propbundle_EncodedStream(uco_object, encoding_method=_MISSING):
     '''
     :param EncodingMethod: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(encoding_method, Missing),\
-    "[propbundle_EncodedStream] encoding_method is required."
-    if not isinstance(encoding_method, Missing):
-        assert isinstance(encoding_method, str),\
+    _require(encoding_method, "[propbundle_EncodedStream] encoding_method is required.")
+
+    if _VALIDATE:
+        assert (type(encoding_method) is str or isinstance(encoding_method, str)),\
         "[propbundle_EncodedStream] encoding_method must be of type String."
 
-    return uco_object.create_PropertyBundle('EncodedStream', EncodingMethod=encoding_method)
+    properties = _present(EncodingMethod=encoding_method)
+    return uco_object.create_PropertyBundle('EncodedStream', **properties)
 
 
-def propbundle_EncryptedStream(uco_object, encryption_iv=Missing(), encryption_key=Missing(),
-                               encryption_method=Missing(), encryption_mode=Missing()):
+def propbundle_EncryptedStream(uco_object, encryption_iv=_MISSING, encryption_key=_MISSING,
+                               encryption_method=_MISSING, encryption_mode=_MISSING):
     '''
     :param EncryptionIV: At most one value of type HexBinary.
     :param EncryptionKey: At most one value of type HexBinary.
@@ -1579,21 +1633,22 @@ def propbundle_EncryptedStream(uco_object, encryption_iv=Missing(), encryption_k
     :return: A PropertyBundle object.
     '''
 
-    #TODO:HexBinary
-    #TODO:HexBinary
-    if not isinstance(encryption_method, Missing):
-        assert (isinstance(encryption_method, case.CoreObject) and (encryption_method.type=='ControlledVocabulary')),\
-        "[propbundle_EncryptedStream] encryption_method must be of type ControlledVocabulary."
-    if not isinstance(encryption_mode, Missing):
-        assert (isinstance(encryption_mode, case.CoreObject) and (encryption_mode.type=='ControlledVocabulary')),\
-        "[propbundle_EncryptedStream] encryption_mode must be of type ControlledVocabulary."
+    if _VALIDATE:
+        #TODO:HexBinary
+        #TODO:HexBinary
+        if encryption_method is not _MISSING:
+            _check_instance_of(encryption_method, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_EncryptedStream] encryption_method must be of type ControlledVocabulary.")
+        if encryption_mode is not _MISSING:
+            _check_instance_of(encryption_mode, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_EncryptedStream] encryption_mode must be of type ControlledVocabulary.")
 
-    return uco_object.create_PropertyBundle('EncryptedStream', EncryptionIV=encryption_iv,
-                                            EncryptionKey=encryption_key, EncryptionMethod=encryption_method,
-                                            EncryptionMode=encryption_mode)
+    properties = _present(EncryptionIV=encryption_iv, EncryptionKey=encryption_key,
+                          EncryptionMethod=encryption_method, EncryptionMode=encryption_mode)
+    return uco_object.create_PropertyBundle('EncryptedStream', **properties)
 
 
-def propbundle_EnvironmentVariable(uco_object, name=Missing(), value=Missing()):
+def propbundle_EnvironmentVariable(uco_object, name=_MISSING, value=_MISSING):
     '''
     :param Name: Exactly one value of any type.
     :param Value: At most one value of any type.
@@ -1602,12 +1657,13 @@ def propbundle_EnvironmentVariable(uco_object, name=Missing(), value=Missing()):
 
     #TODO:NothingElseToCheck
 
-    return uco_object.create_PropertyBundle('EnvironmentVariable', Name=name, Value=value)
+    properties = _present(Name=name, Value=value)
+    return uco_object.create_PropertyBundle('EnvironmentVariable', **properties)
 
 
-def propbundle_Event(uco_object, application_ref=Missing(), cyber_action_ref=Missing(), categories=Missing(),
-                     computer_name=Missing(), created_time=Missing(), event_id=Missing(), event_text=Missing(),
-                     event_type=Missing()):
+def propbundle_Event(uco_object, application_ref=_MISSING, cyber_action_ref=_MISSING, categories=_MISSING,
+                     computer_name=_MISSING, created_time=_MISSING, event_id=_MISSING, event_text=_MISSING,
+                     event_type=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param CyberActionRef: At most one occurrence of type CyberAction.
@@ -1620,59 +1676,57 @@ def propbundle_Event(uco_object, application_ref=Missing(), cyber_action_ref=Mis
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_Event] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_Event] application_ref must be of type Trace."
-
-    #TODO:CyberAction
-    if not isinstance(categories, Missing):
-        assert isinstance(categories, list),\
-        "[propbundle_Event] categories must be of type List of String."
-        assert all(isinstance(i, str) for i in categories),\
-        "[propbundle_Event] categories must be of type List of String."
-    if not isinstance(computer_name, Missing):
-        assert isinstance(computer_name, str),\
-        "[propbundle_Event] computer_name must be of type String."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_Event] created_time must be of type Datetime."
-    if not isinstance(event_id, Missing):
-        assert isinstance(event_id, str),\
-        "[propbundle_Event] event_id must be of type String."
-    if not isinstance(event_text, Missing):
-        assert isinstance(event_text, str),\
-        "[propbundle_Event] event_text must be of type String."
-    if not isinstance(event_type, Missing):
-        assert isinstance(event_type, str),\
-        "[propbundle_Event] event_type must be of type String."
-
-    return uco_object.create_PropertyBundle('Event', ApplicationRef=application_ref, CyberActionRef=cyber_action_ref,
-                                            Categories=categories, ComputerName=computer_name, CreatedTime=created_time,
-                                            EventID=event_id, EventText=event_text, EventType=event_type)
-
-
-def propbundle_EXIF(uco_object, exif_data=Missing()):
+    _require(application_ref, "[propbundle_Event] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_Event] application_ref must be of type Trace.")
+
+        #TODO:CyberAction
+        if categories is not _MISSING:
+            _check_list_of(categories, str, None,
+                           "[propbundle_Event] categories must be of type List of String.")
+        if computer_name is not _MISSING:
+            assert (type(computer_name) is str or isinstance(computer_name, str)),\
+            "[propbundle_Event] computer_name must be of type String."
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_Event] created_time must be of type Datetime."
+        if event_id is not _MISSING:
+            assert (type(event_id) is str or isinstance(event_id, str)),\
+            "[propbundle_Event] event_id must be of type String."
+        if event_text is not _MISSING:
+            assert (type(event_text) is str or isinstance(event_text, str)),\
+            "[propbundle_Event] event_text must be of type String."
+        if event_type is not _MISSING:
+            assert (type(event_type) is str or isinstance(event_type, str)),\
+            "[propbundle_Event] event_type must be of type String."
+
+    properties = _present(ApplicationRef=application_ref, CyberActionRef=cyber_action_ref, Categories=categories,
+                          ComputerName=computer_name, CreatedTime=created_time, EventID=event_id,
+                          EventText=event_text, EventType=event_type)
+    return uco_object.create_PropertyBundle('Event', **properties)
+
+
+def propbundle_EXIF(uco_object, exif_data=_MISSING):
     '''
     :param EXIFData: At least one occurrence of type ControlledDictionary.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(exif_data, Missing),\
-    "[propbundle_EXIF] exif_data is required."
-    if not isinstance(exif_data, Missing):
-        assert isinstance(exif_data, list),\
-        "[propbundle_EXIF] exif_data must be of type List of ControlledDictionary."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='ControlledDictionary') for i in exif_data),\
-        "[propbundle_EXIF] exif_data must be of type List of ControlledDictionary."
-        
-    return uco_object.create_PropertyBundle('EXIF', EXIFData=exif_data)
+    _require(exif_data, "[propbundle_EXIF] exif_data is required.")
 
+    if _VALIDATE:
+        _check_list_of(exif_data, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                       "[propbundle_EXIF] exif_data must be of type List of ControlledDictionary.")
 
-def propbundle_ExtInode(uco_object, inode_id=Missing(), file_type=Missing(), deletion_time=Missing(),
-                        inode_change_time=Missing(), permissions=Missing(), sgid=Missing(), suid=Missing(),
-                        flags=Missing(), hard_link_count=Missing()):
+    properties = _present(EXIFData=exif_data)
+    return uco_object.create_PropertyBundle('EXIF', **properties)
+
+
+def propbundle_ExtInode(uco_object, inode_id=_MISSING, file_type=_MISSING, deletion_time=_MISSING,
+                        inode_change_time=_MISSING, permissions=_MISSING, sgid=_MISSING, suid=_MISSING,
+                        flags=_MISSING, hard_link_count=_MISSING):
     '''
     :param InodeID: At most one value of type Integer.
     :param FileType: At most one value of type Integer.
@@ -1686,61 +1740,61 @@ def propbundle_ExtInode(uco_object, inode_id=Missing(), file_type=Missing(), del
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(inode_id, Missing):
-        assert isinstance(inode_id, int),\
-        "[propbundle_ExtInode] inode_id must be of type Integer."
-    if not isinstance(file_type, Missing):
-        assert isinstance(file_type, int),\
-        "[propbundle_ExtInode] file_type must be of type Integer."
-    if not isinstance(deletion_time, Missing):
-        assert isinstance(deletion_time, datetime.datetime),\
-        "[propbundle_ExtInode] deletion_time must be of type Datetime."
-    if not isinstance(inode_change_time, Missing):
-        assert isinstance(inode_change_time, datetime.datetime),\
-        "[propbundle_ExtInode] inode_change_time must be of type Datetime."
-    if not isinstance(permissions, Missing):
-        assert isinstance(permissions, int),\
-        "[propbundle_ExtInode] permissions must be of type Integer."
-    if not isinstance(sgid, Missing):
-        assert isinstance(sgid, int),\
-        "[propbundle_ExtInode] sgid must be of type Integer."
-    if not isinstance(suid, Missing):
-        assert isinstance(suid, int),\
-        "[propbundle_ExtInode] suid must be of type Integer."
-    if not isinstance(flags, Missing):
-        assert isinstance(flags, int),\
-        "[propbundle_ExtInode] flags must be of type Integer."
-    if not isinstance(hard_link_count, Missing):
-        assert isinstance(hard_link_count, int),\
-        "[propbundle_ExtInode] hard_link_count must be of type Integer."
-
-    return uco_object.create_PropertyBundle('ExtInode', InodeID=inode_id, FileType=file_type,
-                                            DeletionTime=deletion_time, InodeChangeTime=inode_change_time,
-                                            Permissions=permissions, SGID=sgid, SUID=suid, Flags=flags,
-                                            HardLinkCount=hard_link_count)
-
-
-def propbundle_ExtractedStrings(uco_object, strings=Missing()):
+    if _VALIDATE:
+        if inode_id is not _MISSING:
+            assert _is_integer(inode_id),\
+            "[propbundle_ExtInode] inode_id must be of type Integer."
+        if file_type is not _MISSING:
+            assert _is_integer(file_type),\
+            "[propbundle_ExtInode] file_type must be of type Integer."
+        if deletion_time is not _MISSING:
+            assert (type(deletion_time) is _datetime or isinstance(deletion_time, _datetime)),\
+            "[propbundle_ExtInode] deletion_time must be of type Datetime."
+        if inode_change_time is not _MISSING:
+            assert (type(inode_change_time) is _datetime or isinstance(inode_change_time, _datetime)),\
+            "[propbundle_ExtInode] inode_change_time must be of type Datetime."
+        if permissions is not _MISSING:
+            assert _is_integer(permissions),\
+            "[propbundle_ExtInode] permissions must be of type Integer."
+        if sgid is not _MISSING:
+            assert _is_integer(sgid),\
+            "[propbundle_ExtInode] sgid must be of type Integer."
+        if suid is not _MISSING:
+            assert _is_integer(suid),\
+            "[propbundle_ExtInode] suid must be of type Integer."
+        if flags is not _MISSING:
+            assert _is_integer(flags),\
+            "[propbundle_ExtInode] flags must be of type Integer."
+        if hard_link_count is not _MISSING:
+            assert _is_integer(hard_link_count),\
+            "[propbundle_ExtInode] hard_link_count must be of type Integer."
+
+    properties = _present(InodeID=inode_id, FileType=file_type, DeletionTime=deletion_time,
+                          InodeChangeTime=inode_change_time, Permissions=permissions, SGID=sgid, SUID=suid,
+                          Flags=flags, HardLinkCount=hard_link_count)
+    return uco_object.create_PropertyBundle('ExtInode', **properties)
+
+
+def propbundle_ExtractedStrings(uco_object, strings=_MISSING):
     '''
     :param Strings: At least one occurrence of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(strings, Missing),\
-    "[propbundle_ExtractedStrings] strings is required."
-    if not isinstance(strings, Missing):
-        assert isinstance(strings, list),\
-        "[propbundle_ExtractedStrings] strings must be of type List of String."
-        assert all(isinstance(i, str) for i in strings),\
-        "[propbundle_ExtractedStrings] strings must be of type List of String."
+    _require(strings, "[propbundle_ExtractedStrings] strings is required.")
+
+    if _VALIDATE:
+        _check_list_of(strings, str, None,
+                       "[propbundle_ExtractedStrings] strings must be of type List of String.")
 
-    return uco_object.create_PropertyBundle('ExtInode', Strings=strings)
+    properties = _present(Strings=strings)
+    return uco_object.create_PropertyBundle('ExtractedStrings', **properties)
 
 
-def propbundle_File(uco_object, is_directory=Missing(), filename=Missing(), filepath=Missing(),
-                    filesystem_type=Missing(), created_time=Missing(), modified_time=Missing(),
-                    accessed_time=Missing(), metadata_change_time=Missing(), extension=Missing(),
-                    size_in_bytes=Missing()):
+def propbundle_File(uco_object, is_directory=_MISSING, filename=_MISSING, filepath=_MISSING,
+                    filesystem_type=_MISSING, created_time=_MISSING, modified_time=_MISSING,
+                    accessed_time=_MISSING, metadata_change_time=_MISSING, extension=_MISSING,
+                    size_in_bytes=_MISSING):
     '''
     :param IsDirectory: Any number of values of type Bool.
     :param Filename: Any number of values of type String.
@@ -1755,144 +1809,143 @@ def propbundle_File(uco_object, is_directory=Missing(), filename=Missing(), file
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(is_directory, Missing):
-        assert isinstance(is_directory, list),\
-        "[propbundle_File] is_directory must be of type List of Bool."
-        assert all(isinstance(i, bool) for i in is_directory),\
-        "[propbundle_File] is_directory must be of type List of Bool."
-    if not isinstance(filename, Missing):
-        assert isinstance(filename, list),\
-        "[propbundle_File] filename must be of type List of String."
-        assert all(isinstance(i, str) for i in filename),\
-        "[propbundle_File] filename must be of type List of String."
-    if not isinstance(filesystem_type, Missing):
-        assert (isinstance(filesystem_type, case.CoreObject) and (filesystem_type.type=='ControlledVocabulary')),\
-        "[propbundle_File] filesystem_type must be of type ControlledVocabulary."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_File] created_time must be of type Datetime."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_File] modified_time must be of type Datetime."
-    if not isinstance(accessed_time, Missing):
-        assert isinstance(accessed_time, datetime.datetime),\
-        "[propbundle_File] accessed_time must be of type Datetime."
-    if not isinstance(metadata_change_time, Missing):
-        assert isinstance(metadata_change_time, datetime.datetime),\
-        "[propbundle_File] metadata_change_time must be of type Datetime."
-    if not isinstance(extension, Missing):
-        assert isinstance(extension, str),\
-        "[propbundle_File] extension must be of type String."
-    if not isinstance(size_in_bytes, Missing):
-        assert isinstance(size_in_bytes, int),\
-        "[propbundle_File] size_in_bytes must be of type Integer."
-
-    return uco_object.create_PropertyBundle('File', IsDirectory=is_directory, Filename=filename, Filepath=filepath,
-                                            FilesystemType=filesystem_type, CreatedTime=created_time,
-                                            ModifiedTime=modified_time, AccessedTime=accessed_time,
-                                            MetadataChangeTime=metadata_change_time, Extension=extension,
-                                            SizeInBytes=size_in_bytes)
-
-
-def propbundle_FilePermissions(uco_object, owner_ref=Missing()):
+    if _VALIDATE:
+        if is_directory is not _MISSING:
+            _check_list_of(is_directory, bool, None,
+                           "[propbundle_File] is_directory must be of type List of Bool.")
+        if filename is not _MISSING:
+            _check_list_of(filename, str, None,
+                           "[propbundle_File] filename must be of type List of String.")
+        if filesystem_type is not _MISSING:
+            _check_instance_of(filesystem_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_File] filesystem_type must be of type ControlledVocabulary.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_File] created_time must be of type Datetime."
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_File] modified_time must be of type Datetime."
+        if accessed_time is not _MISSING:
+            assert (type(accessed_time) is _datetime or isinstance(accessed_time, _datetime)),\
+            "[propbundle_File] accessed_time must be of type Datetime."
+        if metadata_change_time is not _MISSING:
+            assert (type(metadata_change_time) is _datetime or isinstance(metadata_change_time, _datetime)),\
+            "[propbundle_File] metadata_change_time must be of type Datetime."
+        if extension is not _MISSING:
+            assert (type(extension) is str or isinstance(extension, str)),\
+            "[propbundle_File] extension must be of type String."
+        if size_in_bytes is not _MISSING:
+            assert _is_integer(size_in_bytes),\
+            "[propbundle_File] size_in_bytes must be of type Integer."
+
+    properties = _present(IsDirectory=is_directory, Filename=filename, Filepath=filepath,
+                          FilesystemType=filesystem_type, CreatedTime=created_time, ModifiedTime=modified_time,
+                          AccessedTime=accessed_time, MetadataChangeTime=metadata_change_time, Extension=extension,
+                          SizeInBytes=size_in_bytes)
+    return uco_object.create_PropertyBundle('File', **properties)
+
+
+def propbundle_FilePermissions(uco_object, owner_ref=_MISSING):
     '''
     :param OwnerRef: Exactly one occurrence of type Trace.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(owner_ref, Missing),\
-    "[propbundle_FilePermissions] owner_ref is required."
-    if not isinstance(owner_ref, Missing):
-        assert (isinstance(owner_ref, case.CoreObject) and (owner_ref.type=='Trace')),\
-        "[propbundle_FilePermissions] owner_ref must be of type Trace."
+    _require(owner_ref, "[propbundle_FilePermissions] owner_ref is required.")
 
-    return uco_object.create_PropertyBundle('FilePermissions', OwnerRef=owner_ref)
+    if _VALIDATE:
+        _check_instance_of(owner_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_FilePermissions] owner_ref must be of type Trace.")
 
+    properties = _present(OwnerRef=owner_ref)
+    return uco_object.create_PropertyBundle('FilePermissions', **properties)
 
-def propbundle_Filesystem(uco_object, filesystem_type=Missing(), cluster_size=Missing()):
+
+def propbundle_Filesystem(uco_object, filesystem_type=_MISSING, cluster_size=_MISSING):
     '''
     :param FilesystemType: At most one occurrence of type ControlledVocabulary.
     :param ClusterSize: At most one value of type Integer.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(filesystem_type, Missing):
-        assert (isinstance(filesystem_type, case.CoreObject) and (filesystem_type.type=='ControlledVocabulary')),\
-        "[propbundle_Filesystem] filesystem_type must be of type ControlledVocabulary."
-    if not isinstance(cluster_size, Missing):
-        assert isinstance(cluster_size, int),\
-        "[propbundle_Filesystem] cluster_size must be of type Integer."
+    if _VALIDATE:
+        if filesystem_type is not _MISSING:
+            _check_instance_of(filesystem_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_Filesystem] filesystem_type must be of type ControlledVocabulary.")
+        if cluster_size is not _MISSING:
+            assert _is_integer(cluster_size),\
+            "[propbundle_Filesystem] cluster_size must be of type Integer."
 
-    return uco_object.create_PropertyBundle('Filesystem', FilesystemType=filesystem_type, ClusterSize=cluster_size)
+    properties = _present(FilesystemType=filesystem_type, ClusterSize=cluster_size)
+    return uco_object.create_PropertyBundle('Filesystem', **properties)
 
 
-def propbundle_Fragment(uco_object, fragment_index=Missing(), total_fragments=Missing()):
+def propbundle_Fragment(uco_object, fragment_index=_MISSING, total_fragments=_MISSING):
     '''
     :param FragmentIndex: Any number of values of type Integer.
     :param TotalFragments: Any number of values of type Integer.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(fragment_index, Missing):
-        assert isinstance(fragment_index, list),\
-        "[propbundle_Fragment] fragment_index must be of type List of Integer."
-        assert all(isinstance(i, int) for i in fragment_index),\
-        "[propbundle_Fragment] fragment_index must be of type List of Integer."
-    if not isinstance(total_fragments, Missing):
-        assert isinstance(total_fragments, list),\
-        "[propbundle_Fragment] total_fragments must be of type List of Integer."
-        assert all(isinstance(i, int) for i in total_fragments),\
-        "[propbundle_Fragment] total_fragments must be of type List of Integer."
+    if _VALIDATE:
+        if fragment_index is not _MISSING:
+            _check_list_of_integers(fragment_index,
+                                    "[propbundle_Fragment] fragment_index must be of type List of Integer.")
+        if total_fragments is not _MISSING:
+            _check_list_of_integers(total_fragments,
+                                    "[propbundle_Fragment] total_fragments must be of type List of Integer.")
 
-    return uco_object.create_PropertyBundle('Fragment', FragmentIndex=fragment_index, TotalFragments=total_fragments)
+    properties = _present(FragmentIndex=fragment_index, TotalFragments=total_fragments)
+    return uco_object.create_PropertyBundle('Fragment', **properties)
 
 
-def propbundle_GeolocationEntry(uco_object, application_ref=Missing(), created_time=Missing(), location_ref=Missing()):
+def propbundle_GeolocationEntry(uco_object, application_ref=_MISSING, created_time=_MISSING, location_ref=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param CreatedTime: At most one value of type Datetime.
     :param LocationRef: At most one occurrence of type Location.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_GeolocationLog] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_GeolocationLog] application_ref must be of type Trace."
+    _require(application_ref, "[propbundle_GeolocationLog] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_GeolocationLog] application_ref must be of type Trace.")
 
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_GeolocationLog] created_time must be of type Datetime."
-    if not isinstance(location_ref, Missing):
-        assert (isinstance(location_ref, case.CoreObject) and (location_ref.type=='Location')),\
-        "[propbundle_GeolocationLog] location_ref must be of type Location."
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_GeolocationLog] created_time must be of type Datetime."
+        if location_ref is not _MISSING:
+            _check_instance_of(location_ref, _CoreObject, _TAG_LOCATION,
+                               "[propbundle_GeolocationLog] location_ref must be of type Location.")
 
-    return uco_object.create_PropertyBundle('GeolocationEntry', ApplicationRef=application_ref,
-                                            CreatedTime=created_time, LocationRef=location_ref)
+    properties = _present(ApplicationRef=application_ref, CreatedTime=created_time, LocationRef=location_ref)
+    return uco_object.create_PropertyBundle('GeolocationEntry', **properties)
 
 
-def propbundle_GeolocationLog(uco_object, application_ref=Missing(), created_time=Missing()):
+def propbundle_GeolocationLog(uco_object, application_ref=_MISSING, created_time=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param CreatedTime: At most one value of type Datetime.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_GeolocationLog] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_GeolocationLog] application_ref must be of type Trace."
+    _require(application_ref, "[propbundle_GeolocationLog] application_ref is required.")
 
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_GeolocationLog] created_time must be of type Datetime."
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_GeolocationLog] application_ref must be of type Trace.")
 
-    return uco_object.create_PropertyBundle('GeolocationLog', ApplicationRef=application_ref, CreatedTime=created_time)
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_GeolocationLog] created_time must be of type Datetime."
 
+    properties = _present(ApplicationRef=application_ref, CreatedTime=created_time)
+    return uco_object.create_PropertyBundle('GeolocationLog', **properties)
 
-def propbundle_GeolocationTrack(uco_object, application_ref=Missing(), start_time=Missing(),
-                                end_time=Missing(), geolocation_entry_refs=Missing()):
+
+def propbundle_GeolocationTrack(uco_object, application_ref=_MISSING, start_time=_MISSING,
+                                end_time=_MISSING, geolocation_entry_refs=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param StartTime: At most one value of type Datetime.
@@ -1901,29 +1954,28 @@ def propbundle_GeolocationTrack(uco_object, application_ref=Missing(), start_tim
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_GeolocationTrack] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_GeolocationTrack] application_ref must be of type Trace."
+    _require(application_ref, "[propbundle_GeolocationTrack] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_GeolocationTrack] application_ref must be of type Trace.")
 
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[propbundle_GeolocationTrack] start_time must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[propbundle_GeolocationTrack] end_time must be of type Datetime."
-    if not isinstance(geolocation_entry_refs, Missing):
-        assert isinstance(geolocation_entry_refs, list),\
-        "[propbundle_GeolocationTrack] geolocation_entry_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in geolocation_entry_refs),\
-        "[propbundle_GeolocationTrack] geolocation_entry_refs must be of type List of Trace."
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[propbundle_GeolocationTrack] start_time must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[propbundle_GeolocationTrack] end_time must be of type Datetime."
+        if geolocation_entry_refs is not _MISSING:
+            _check_list_of(geolocation_entry_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_GeolocationTrack] geolocation_entry_refs must be of type List of Trace.")
 
-    return uco_object.create_PropertyBundle('Geolocation', ApplicationRef=application_ref, EndTime=end_time,
-                                            GeolocationEntryRefs=geolocation_entry_refs, StartTime=start_time)
+    properties = _present(ApplicationRef=application_ref, EndTime=end_time,
+                          GeolocationEntryRefs=geolocation_entry_refs, StartTime=start_time)
+    return uco_object.create_PropertyBundle('Geolocation', **properties)
 
 
-def propbundle_GPSCoordinates(uco_object, hdop=Missing(), pdop=Missing(), tdop=Missing(), vdop=Missing()):
+def propbundle_GPSCoordinates(uco_object, hdop=_MISSING, pdop=_MISSING, tdop=_MISSING, vdop=_MISSING):
     '''
     :param HDOP: At most one value of type Float.
     :param PDOP: At most one value of type Float.
@@ -1932,25 +1984,27 @@ def propbundle_GPSCoordinates(uco_object, hdop=Missing(), pdop=Missing(), tdop=M
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(hdop, Missing):
-        assert isinstance(hdop, float),\
-        "[propbundle_GPSCoordinates] hdop must be of type Float."
-    if not isinstance(pdop, Missing):
-        assert isinstance(pdop, float),\
-        "[propbundle_GPSCoordinates] pdop must be of type Float."
-    if not isinstance(tdop, Missing):
-        assert isinstance(tdop, float),\
-        "[propbundle_GPSCoordinates] tdop must be of type Float."
-    if not isinstance(vdop, Missing):
-        assert isinstance(vdop, float),\
-        "[propbundle_GPSCoordinates] vdop must be of type Float."
+    if _VALIDATE:
+        if hdop is not _MISSING:
+            assert (type(hdop) is float or isinstance(hdop, float)),\
+            "[propbundle_GPSCoordinates] hdop must be of type Float."
+        if pdop is not _MISSING:
+            assert (type(pdop) is float or isinstance(pdop, float)),\
+            "[propbundle_GPSCoordinates] pdop must be of type Float."
+        if tdop is not _MISSING:
+            assert (type(tdop) is float or isinstance(tdop, float)),\
+            "[propbundle_GPSCoordinates] tdop must be of type Float."
+        if vdop is not _MISSING:
+            assert (type(vdop) is float or isinstance(vdop, float)),\
+            "[propbundle_GPSCoordinates] vdop must be of type Float."
 
-    return uco_object.create_PropertyBundle('GPSCoordinates', HDOP=hdop, PDOP=pdop, TDOP=tdop, VDOP=vdop)
+    properties = _present(HDOP=hdop, PDOP=pdop, TDOP=tdop, VDOP=vdop)
+    return uco_object.create_PropertyBundle('GPSCoordinates', **properties)
 
 
-def propbundle_HTTPConnection(uco_object, request_method=Missing(), request_value=Missing(),
-                              http_request_version=Missing(), http_request_header=Missing()
-                              , http_message_body_length=Missing(), http_message_body_data_ref=Missing()):
+def propbundle_HTTPConnection(uco_object, request_method=_MISSING, request_value=_MISSING,
+                              http_request_version=_MISSING, http_request_header=_MISSING
+                              , http_message_body_length=_MISSING, http_message_body_data_ref=_MISSING):
     '''
     :param RequestMethod: Exactly one value of type String.
     :param RequestValue: Exactly one value of type String.
@@ -1961,39 +2015,36 @@ def propbundle_HTTPConnection(uco_object, request_method=Missing(), request_valu
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(request_method, Missing),\
-    "[propbundle_HTTPConnection] request_method is required."
-    if not isinstance(request_method, Missing):
-        assert isinstance(request_method, str),\
+    _require(request_method, "[propbundle_HTTPConnection] request_method is required.")
+    _require(request_value, "[propbundle_HTTPConnection] request_value is required.")
+
+    if _VALIDATE:
+        assert (type(request_method) is str or isinstance(request_method, str)),\
         "[propbundle_HTTPConnection] request_method must be of type String."
-    assert not isinstance(request_value, Missing),\
-    "[propbundle_HTTPConnection] request_value is required."
-    if not isinstance(request_value, Missing):
-        assert isinstance(request_value, str),\
+        assert (type(request_value) is str or isinstance(request_value, str)),\
         "[propbundle_HTTPConnection] request_value must be of type String."
 
-    if not isinstance(http_request_header, Missing):
-        assert isinstance(http_request_header, str),\
-        "[propbundle_HTTPConnection] request_version must be of type String."
-    if not isinstance(http_request_version, Missing):
-        assert isinstance(http_request_version, str),\
-        "[propbundle_HTTPConnection] http_request_version must be of type String."
-    if not isinstance(http_message_body_length, Missing):
-        assert isinstance(http_message_body_length, int),\
-        "[propbundle_HTTPConnection] http_message_body_length must be of type Integer."
-    if not isinstance(http_message_body_data_ref, Missing):
-        assert (isinstance(http_message_body_data_ref, case.CoreObject) and
-                (http_message_body_data_ref.type=='Trace')),\
-        "[propbundle_HTTPConnection] http_message_body_data_ref must be of type Trace."
-
-    return uco_object.create_PropertyBundle('HTTPConnection', RequestMethod=request_method,
-                                            RequestValue=request_value, RequestVersion=http_request_version,
-                                            HTTPRequestVersion=http_request_version,
-                                            HTTPMessageBodyLength=http_message_body_length,
-                                            HTTPMessageBodyDataRef=http_message_body_data_ref)
-
-
-def propbundle_ICMPConnection(uco_object, icmp_type=Missing(), icmp_code=Missing()):
+        if http_request_header is not _MISSING:
+            assert (type(http_request_header) is str or isinstance(http_request_header, str)),\
+            "[propbundle_HTTPConnection] request_version must be of type String."
+        if http_request_version is not _MISSING:
+            assert (type(http_request_version) is str or isinstance(http_request_version, str)),\
+            "[propbundle_HTTPConnection] http_request_version must be of type String."
+        if http_message_body_length is not _MISSING:
+            assert _is_integer(http_message_body_length),\
+            "[propbundle_HTTPConnection] http_message_body_length must be of type Integer."
+        if http_message_body_data_ref is not _MISSING:
+            _check_instance_of(http_message_body_data_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_HTTPConnection] http_message_body_data_ref must be of type Trace.")
+
+    properties = _present(RequestMethod=request_method, RequestValue=request_value,
+                          RequestVersion=http_request_version, HTTPRequestVersion=http_request_version,
+                          HTTPMessageBodyLength=http_message_body_length,
+                          HTTPMessageBodyDataRef=http_message_body_data_ref)
+    return uco_object.create_PropertyBundle('HTTPConnection', **properties)
+
+
+def propbundle_ICMPConnection(uco_object, icmp_type=_MISSING, icmp_code=_MISSING):
     '''
     :param ICMPType: Exactly one value of type HexBinary.
     :param ICMPCode: Exactly one value of tpye HexBinary.
@@ -2003,7 +2054,8 @@ def propbundle_ICMPConnection(uco_object, icmp_type=Missing(), icmp_code=Missing
     #TODO:HexBinary
     #TODO:HexBinary
 
-    return uco_object.create_PropertyBundle('ICMPConnection', ICMPType=icmp_type, ICMPCode=icmp_code)
+    properties = _present(ICMPType=icmp_type, ICMPCode=icmp_code)
+    return uco_object.create_PropertyBundle('ICMPConnection', **properties)
 
 
 def propbundle_Identity(uco_object):
@@ -2016,52 +2068,55 @@ def propbundle_Identity(uco_object):
     return uco_object.create_PropertyBundle('Identity')
 
 
-def propbundle_Image(uco_object, image_type=Missing()):
+def propbundle_Image(uco_object, image_type=_MISSING):
     '''
     :param ImageType: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(image_type, Missing),\
-    "[propbundle_Image] image_type is required."
-    if not isinstance(image_type, Missing):
-        assert isinstance(image_type, str),\
+    _require(image_type, "[propbundle_Image] image_type is required.")
+
+    if _VALIDATE:
+        assert (type(image_type) is str or isinstance(image_type, str)),\
         "[propbundle_Image] image_type must be of type String."
 
-    return uco_object.create_PropertyBundle('Image', ImageType=image_type)
+    properties = _present(ImageType=image_type)
+    return uco_object.create_PropertyBundle('Image', **properties)
 
 
-def propbundle_IPV4Address(uco_object, value=Missing()):
+def propbundle_IPV4Address(uco_object, value=_MISSING):
     '''
     :param Value: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_IPV4Address] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(value, "[propbundle_IPV4Address] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
         "[propbundle_IPV4Address] value must be of type String."
 
-    return uco_object.create_PropertyBundle('IPV4Address', Value=value)
+    properties = _present(Value=value)
+    return uco_object.create_PropertyBundle('IPV4Address', **properties)
 
 
-def propbundle_IPV6Address(uco_object, value=Missing()):
+def propbundle_IPV6Address(uco_object, value=_MISSING):
     '''
     :param Value: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_IPV6Address] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(value, "[propbundle_IPV6Address] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
         "[propbundle_IPV6Address] value must be of type String."
 
-    return uco_object.create_PropertyBundle('IPV6Address', Value=value)
+    properties = _present(Value=value)
+    return uco_object.create_PropertyBundle('IPV6Address', **properties)
 
 
-def propbundle_LatLongCoordinates(uco_object, latitude=Missing(), longitude=Missing(), altitude=Missing()):
+def propbundle_LatLongCoordinates(uco_object, latitude=_MISSING, longitude=_MISSING, altitude=_MISSING):
     '''
     :param Latitude: At most one value of type Float.
     :param Longitude: At most one value of type Float.
@@ -2069,53 +2124,56 @@ def propbundle_LatLongCoordinates(uco_object, latitude=Missing(), longitude=Miss
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(latitude, Missing):
-        assert isinstance(latitude, float),\
-        "[propbundle_LatLongCoordinates] latitude must be of type Float."
-    if not isinstance(longitude, Missing):
-        assert isinstance(longitude, float),\
-        "[propbundle_LatLongCoordinates] longitude must be of type Float."
-    if not isinstance(altitude, Missing):
-        assert isinstance(altitude, float),\
-        "[propbundle_LatLongCoordinates] altitude must be of type Float."
+    if _VALIDATE:
+        if latitude is not _MISSING:
+            assert (type(latitude) is float or isinstance(latitude, float)),\
+            "[propbundle_LatLongCoordinates] latitude must be of type Float."
+        if longitude is not _MISSING:
+            assert (type(longitude) is float or isinstance(longitude, float)),\
+            "[propbundle_LatLongCoordinates] longitude must be of type Float."
+        if altitude is not _MISSING:
+            assert (type(altitude) is float or isinstance(altitude, float)),\
+            "[propbundle_LatLongCoordinates] altitude must be of type Float."
 
-    return uco_object.create_PropertyBundle('LatLongCoordinates', Latitude=latitude,
-                                            Longitude=longitude, Altitude=altitude)
+    properties = _present(Latitude=latitude, Longitude=longitude, Altitude=altitude)
+    return uco_object.create_PropertyBundle('LatLongCoordinates', **properties)
 
 
-def propbundle_Library(uco_object, library_type=Missing()):
+def propbundle_Library(uco_object, library_type=_MISSING):
     '''
     :param LibraryType: Exactly one occurrence of type ControlledVocabulary.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(library_type, Missing),\
-    "[propbundle_Library] library_type is required."
-    if not isinstance(library_type, Missing):
-        assert (isinstance(library_type, case.CoreObject) and (library_type.type=='ControlledVocabulary')),\
-        "[propbundle_Library] library_type must be of type ControlledVocabulary."
+    _require(library_type, "[propbundle_Library] library_type is required.")
+
+    if _VALIDATE:
+        _check_instance_of(library_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[propbundle_Library] library_type must be of type ControlledVocabulary.")
 
-    return uco_object.create_PropertyBundle('Library', LibraryType=library_type)
+    properties = _present(LibraryType=library_type)
+    return uco_object.create_PropertyBundle('Library', **properties)
 
 
-def propbundle_MACAddress(uco_object, value=Missing()):
+def propbundle_MACAddress(uco_object, value=_MISSING):
     '''
     :param Value: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(value, Missing),\
-    "[propbundle_MACAddress] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, bool),\
-        "[propbundle_MACAddress] value must be of type Bool."
+    _require(value, "[propbundle_MACAddress] value is required.")
+
+    if _VALIDATE:
+        assert (type(value) is str or isinstance(value, str)),\
+        "[propbundle_MACAddress] value must be of type String."
 
-    return uco_object.create_PropertyBundle('MACAddress', Value=value)
+    properties = _present(Value=value)
+    return uco_object.create_PropertyBundle('MACAddress', **properties)
 
 
-def propbundle_Memory(uco_object, is_injected=Missing(), is_mapped=Missing(), is_protected=Missing(),
-                      is_volatile=Missing(), region_size=Missing(), region_start_address=Missing(),
-                      region_end_address=Missing()):
+def propbundle_Memory(uco_object, is_injected=_MISSING, is_mapped=_MISSING, is_protected=_MISSING,
+                      is_volatile=_MISSING, region_size=_MISSING, region_start_address=_MISSING,
+                      region_end_address=_MISSING):
     '''
     :param IsInjected: Exactly one value of type Bool.
     :param IsMapped: Exactly one value of type Bool.
@@ -2127,41 +2185,35 @@ def propbundle_Memory(uco_object, is_injected=Missing(), is_mapped=Missing(), is
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(is_injected, Missing),\
-    "[propbundle_Memory] is_injected is required."
-    if not isinstance(is_injected, Missing):
-        assert isinstance(is_injected, bool),\
+    _require(is_injected, "[propbundle_Memory] is_injected is required.")
+    _require(is_mapped, "[propbundle_Memory] is_mapped is required.")
+    _require(is_protected, "[propbundle_Memory] is_protected is required.")
+    _require(is_volatile, "[propbundle_Memory] is_volatile is required.")
+
+    if _VALIDATE:
+        assert type(is_injected) is bool,\
         "[propbundle_Memory] is_injected must be of type Bool."
-    assert not isinstance(is_mapped, Missing),\
-    "[propbundle_Memory] is_mapped is required."
-    if not isinstance(is_mapped, Missing):
-        assert isinstance(is_mapped, bool),\
+        assert type(is_mapped) is bool,\
         "[propbundle_Memory] is_mapped must be of type Bool."
-    assert not isinstance(is_protected, Missing),\
-    "[propbundle_Memory] is_protected is required."
-    if not isinstance(is_protected, Missing):
-        assert isinstance(is_protected, bool),\
+        assert type(is_protected) is bool,\
         "[propbundle_Memory] is_protected must be of type Bool."
-    assert not isinstance(is_volatile, Missing),\
-    "[propbundle_Memory] is_volatile is required."
-    if not isinstance(is_volatile, Missing):
-        assert isinstance(is_volatile, bool),\
+        assert type(is_volatile) is bool,\
         "[propbundle_Memory] is_volatile must be of type Bool."
 
     #NOCHECK:region_size
     #TODO:HexBinary
     #TODO:HexBinary
 
-    return uco_object.create_PropertyBundle('Memory', IsInjected=is_injected, IsMapped=is_mapped,
-                                            IsProtected=is_protected, IsVolatile=is_volatile, RegionSize=region_size,
-                                            RegionStartAddress=region_start_address,
-                                            RegionEndAddress=region_end_address)
+    properties = _present(IsInjected=is_injected, IsMapped=is_mapped, IsProtected=is_protected,
+                          IsVolatile=is_volatile, RegionSize=region_size, RegionStartAddress=region_start_address,
+                          RegionEndAddress=region_end_address)
+    return uco_object.create_PropertyBundle('Memory', **properties)
 
 
-def propbundle_Message(uco_object, application_ref=Missing(), from_ref=Missing(),
-                       to_refs=Missing(), message_text=Missing(), message_id=Missing(),
-                       message_type=Missing(), session_id=Missing(), sent_time=Missing(),
-                       participant_refs=Missing()):
+def propbundle_Message(uco_object, application_ref=_MISSING, from_ref=_MISSING,
+                       to_refs=_MISSING, message_text=_MISSING, message_id=_MISSING,
+                       message_type=_MISSING, session_id=_MISSING, sent_time=_MISSING,
+                       participant_refs=_MISSING):
     '''
     :param ApplicationRef: At most one occurrence of type Trace.
     :param FromRef: At most one occurrence of type Trace.
@@ -2175,74 +2227,68 @@ def propbundle_Message(uco_object, application_ref=Missing(), from_ref=Missing()
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_Message] application_ref must be of type Trace."
-    if not isinstance(from_ref, Missing):
-        assert (isinstance(from_ref, case.CoreObject) and (from_ref.type=='Trace')),\
-        "[propbundle_Message] from_ref must be of type Trace."
-    if not isinstance(to_refs, Missing):
-        assert isinstance(to_refs, list),\
-        "[propbundle_Message] to_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in to_refs),\
-        "[propbundle_Message] to_refs must be of type List of Trace."
-    if not isinstance(message_text, Missing):
-        assert isinstance(message_text, str),\
-        "[propbundle_Message] message_text must be of type String."
-    if not isinstance(message_id, Missing):
-        assert isinstance(message_id, str),\
-        "[propbundle_Message] message_id must be of type String."
-    if not isinstance(message_type, Missing):
-        assert isinstance(message_type, str),\
-        "[propbundle_Message] message_type must be of type String."
-    if not isinstance(session_id, Missing):
-        assert isinstance(session_id, str),\
-        "[propbundle_Message] session_id must be of type String."
-    if not isinstance(sent_time, Missing):
-        assert isinstance(sent_time, datetime.datetime),\
-        "[propbundle_Message] sent_time must be of type Datetime."
-    if not isinstance(participant_refs, Missing):
-        assert isinstance(participant_refs, list),\
-        "[propbundle_Message] participant_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in participant_refs),\
-        "[propbundle_Message] participant_refs must be of type List of Trace."
-
-    return uco_object.create_PropertyBundle('Message', ApplicationRef=application_ref,
-                                            FromRef=from_ref, ToRefs=to_refs, MessageText=message_text,
-                                            MessageID=message_id, MessageType=message_type, SessionID=session_id,
-                                            SentTime=sent_time, ParticipantRefs=participant_refs)
-
-
-def propbundle_MessageThread(uco_object, message_refs=Missing(), visibility=Missing(), participant_refs=Missing()):
+    if _VALIDATE:
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Message] application_ref must be of type Trace.")
+        if from_ref is not _MISSING:
+            _check_instance_of(from_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Message] from_ref must be of type Trace.")
+        if to_refs is not _MISSING:
+            _check_list_of(to_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_Message] to_refs must be of type List of Trace.")
+        if message_text is not _MISSING:
+            assert (type(message_text) is str or isinstance(message_text, str)),\
+            "[propbundle_Message] message_text must be of type String."
+        if message_id is not _MISSING:
+            assert (type(message_id) is str or isinstance(message_id, str)),\
+            "[propbundle_Message] message_id must be of type String."
+        if message_type is not _MISSING:
+            assert (type(message_type) is str or isinstance(message_type, str)),\
+            "[propbundle_Message] message_type must be of type String."
+        if session_id is not _MISSING:
+            assert (type(session_id) is str or isinstance(session_id, str)),\
+            "[propbundle_Message] session_id must be of type String."
+        if sent_time is not _MISSING:
+            assert (type(sent_time) is _datetime or isinstance(sent_time, _datetime)),\
+            "[propbundle_Message] sent_time must be of type Datetime."
+        if participant_refs is not _MISSING:
+            _check_list_of(participant_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_Message] participant_refs must be of type List of Trace.")
+
+    properties = _present(ApplicationRef=application_ref, FromRef=from_ref, ToRefs=to_refs, MessageText=message_text,
+                          MessageID=message_id, MessageType=message_type, SessionID=session_id, SentTime=sent_time,
+                          ParticipantRefs=participant_refs)
+    return uco_object.create_PropertyBundle('Message', **properties)
+
+
+def propbundle_MessageThread(uco_object, message_refs=_MISSING, visibility=_MISSING, participant_refs=_MISSING):
     '''
     :param MessageRefs: Any number of occurrences of type ArrayOfObject.
     :param Visibility: At most one value of type Bool.
     :param ParticipantRefs: Any number of occurrences of type Trace.
     '''
 
-    if not isinstance(message_refs, Missing):
-        assert isinstance(message_refs, list),\
-        "[propbundle_MessageThread] message_refs must be of type List of ArrayOfObject."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='ArrayOfObject') for i in message_refs),\
-        "[propbundle_MessageThread] message_refs must be of type List of ArrayOfObject."
-    if not isinstance(visibility, Missing):
-        assert isinstance(visibility, bool),\
-        "[propbundle_MessageThread] visibility must be of type Bool."
-    if not isinstance(participant_refs, Missing):
-        assert isinstance(participant_refs, list),\
-        "[propbundle_MessageThread] participant_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in participant_refs),\
-        "[propbundle_MessageThread] participant_refs must be of type List of Trace."
+    if _VALIDATE:
+        if message_refs is not _MISSING:
+            _check_list_of(message_refs, _DuckObject, _TAG_ARRAY_OF_OBJECT,
+                           "[propbundle_MessageThread] message_refs must be of type List of ArrayOfObject.")
+        if visibility is not _MISSING:
+            assert type(visibility) is bool,\
+            "[propbundle_MessageThread] visibility must be of type Bool."
+        if participant_refs is not _MISSING:
+            _check_list_of(participant_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_MessageThread] participant_refs must be of type List of Trace.")
 
-    return uco_object.create_PropertyBundle('MessageThread', MessageRefs=message_refs, Visibility=visibility,
-                                            ParticipantRefs=participant_refs)
+    properties = _present(MessageRefs=message_refs, Visibility=visibility, ParticipantRefs=participant_refs)
+    return uco_object.create_PropertyBundle('MessageThread', **properties)
 
 
-def propbundle_MFTRecord(uco_object, mft_file_id=Missing(), mft_parent_id=Missing(), ntfs_hard_link_count=Missing(),
-                         mft_record_change_time=Missing(), ntfs_owner_sid=Missing(), ntfs_owner_id=Missing(),
-                         mft_flags=Missing(), mft_filename_created_time=Missing(), mft_filename_modified_time=Missing(),
-                         mft_filename_accessed_time=Missing(), mft_filename_record_change_time=Missing(),
-                         mft_filename_length=Missing()):
+def propbundle_MFTRecord(uco_object, mft_file_id=_MISSING, mft_parent_id=_MISSING, ntfs_hard_link_count=_MISSING,
+                         mft_record_change_time=_MISSING, ntfs_owner_sid=_MISSING, ntfs_owner_id=_MISSING,
+                         mft_flags=_MISSING, mft_filename_created_time=_MISSING, mft_filename_modified_time=_MISSING,
+                         mft_filename_accessed_time=_MISSING, mft_filename_record_change_time=_MISSING,
+                         mft_filename_length=_MISSING):
     '''
     :param MFTFileID: At most one value of type Integer.
     :param MFTParentID: At most one value of type Integer.
@@ -2259,72 +2305,74 @@ def propbundle_MFTRecord(uco_object, mft_file_id=Missing(), mft_parent_id=Missin
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(mft_file_id, Missing):
-        assert isinstance(mft_file_id, int),\
-        "[propbundle_MFTRecord] mft_file_id must be of type Integer."
-    if not isinstance(mft_parent_id, Missing):
-        assert isinstance(mft_parent_id, int),\
-        "[propbundle_MFTRecord] mft_parent_id must be of type Integer."
-    if not isinstance(ntfs_hard_link_count, Missing):
-        assert isinstance(ntfs_hard_link_count, int),\
-        "[propbundle_MFTRecord] ntfs_hard_link_count must be of type Integer."
-    if not isinstance(mft_record_change_time, Missing):
-        assert isinstance(mft_record_change_time, datetime.datetime),\
-        "[propbundle_MFTRecord] mft_record_change_time must be of type Datetime."
-    if not isinstance(ntfs_owner_sid, Missing):
-        assert isinstance(ntfs_owner_sid, str),\
-        "[propbundle_MFTRecord] ntfs_owner_sid must be of type String."
-    if not isinstance(ntfs_owner_id, Missing):
-        assert isinstance(ntfs_owner_id, str),\
-        "[propbundle_MFTRecord] ntfs_owner_id must be of type String."
-    if not isinstance(mft_flags, Missing):
-        assert isinstance(mft_flags, int),\
-        "[propbundle_MFTRecord] mft_flags must be of type Integer."
-    if not isinstance(mft_filename_created_time, Missing):
-        assert isinstance(mft_filename_created_time, datetime.datetime),\
-        "[propbundle_MFTRecord] mft_filename_created_time must be of type Datetime."
-    if not isinstance(mft_filename_modified_time, Missing):
-        assert isinstance(mft_filename_modified_time, datetime.datetime),\
-        "[propbundle_MFTRecord] mft_filename_modified_time must be of type Datetime."
-    if not isinstance(mft_filename_accessed_time, Missing):
-        assert isinstance(mft_filename_accessed_time, datetime.datetime),\
-        "[propbundle_MFTRecord] mft_filename_accessed_time must be of type Datetime."
-    if not isinstance(mft_filename_record_change_time, Missing):
-        assert isinstance(mft_filename_record_change_time, datetime.datetime),\
-        "[propbundle_MFTRecord] mft_filename_record_change_time must be of type Datetime."
-    if not isinstance(mft_filename_length, Missing):
-        assert isinstance(mft_filename_length, int),\
-        "[propbundle_MFTRecord] mft_filename_length must be of type Integer."
-
-    return uco_object.create_PropertyBundle('MFTRecord', MFTFileID=mft_file_id, MFTParentID=mft_parent_id,
-                                            NTFSHardLinkCount=ntfs_hard_link_count,
-                                            MFTRecordChangeTime=mft_record_change_time, NTFSOwnerSID=ntfs_owner_sid,
-                                            NTFSOwnerID=ntfs_owner_id, MFTFlags=mft_flags,
-                                            MFTFileNameCreatedTime=mft_filename_created_time,
-                                            MFTFileNameModifiedTime=mft_filename_modified_time,
-                                            MFTFileNameAccessedTime=mft_filename_accessed_time,
-                                            MFTFileNameRecordChangeTime=mft_filename_record_change_time,
-                                            MFTFileNameLength=mft_filename_length)
-
-
-def propbundle_Mutex(uco_object, is_named=Missing()):
+    if _VALIDATE:
+        if mft_file_id is not _MISSING:
+            assert _is_integer(mft_file_id),\
+            "[propbundle_MFTRecord] mft_file_id must be of type Integer."
+        if mft_parent_id is not _MISSING:
+            assert _is_integer(mft_parent_id),\
+            "[propbundle_MFTRecord] mft_parent_id must be of type Integer."
+        if ntfs_hard_link_count is not _MISSING:
+            assert _is_integer(ntfs_hard_link_count),\
+            "[propbundle_MFTRecord] ntfs_hard_link_count must be of type Integer."
+        if mft_record_change_time is not _MISSING:
+            assert (type(mft_record_change_time) is _datetime or isinstance(mft_record_change_time, _datetime)),\
+            "[propbundle_MFTRecord] mft_record_change_time must be of type Datetime."
+        if ntfs_owner_sid is not _MISSING:
+            assert (type(ntfs_owner_sid) is str or isinstance(ntfs_owner_sid, str)),\
+            "[propbundle_MFTRecord] ntfs_owner_sid must be of type String."
+        if ntfs_owner_id is not _MISSING:
+            assert (type(ntfs_owner_id) is str or isinstance(ntfs_owner_id, str)),\
+            "[propbundle_MFTRecord] ntfs_owner_id must be of type String."
+        if mft_flags is not _MISSING:
+            assert _is_integer(mft_flags),\
+            "[propbundle_MFTRecord] mft_flags must be of type Integer."
+        if mft_filename_created_time is not _MISSING:
+            assert (type(mft_filename_created_time) is _datetime or isinstance(mft_filename_created_time, _datetime)),\
+            "[propbundle_MFTRecord] mft_filename_created_time must be of type Datetime."
+        if mft_filename_modified_time is not _MISSING:
+            assert (type(mft_filename_modified_time) is _datetime or isinstance(mft_filename_modified_time, _datetime)),\
+            "[propbundle_MFTRecord] mft_filename_modified_time must be of type Datetime."
+        if mft_filename_accessed_time is not _MISSING:
+            assert (type(mft_filename_accessed_time) is _datetime or isinstance(mft_filename_accessed_time, _datetime)),\
+            "[propbundle_MFTRecord] mft_filename_accessed_time must be of type Datetime."
+        if mft_filename_record_change_time is not _MISSING:
+            assert (type(mft_filename_record_change_time) is _datetime or isinstance(mft_filename_record_change_time, _datetime)),\
+            "[propbundle_MFTRecord] mft_filename_record_change_time must be of type Datetime."
+        if mft_filename_length is not _MISSING:
+            assert _is_integer(mft_filename_length),\
+            "[propbundle_MFTRecord] mft_filename_length must be of type Integer."
+
+    properties = _present(MFTFileID=mft_file_id, MFTParentID=mft_parent_id, NTFSHardLinkCount=ntfs_hard_link_count,
+                          MFTRecordChangeTime=mft_record_change_time, NTFSOwnerSID=ntfs_owner_sid,
+                          NTFSOwnerID=ntfs_owner_id, MFTFlags=mft_flags,
+                          MFTFileNameCreatedTime=mft_filename_created_time,
+                          MFTFileNameModifiedTime=mft_filename_modified_time,
+                          MFTFileNameAccessedTime=mft_filename_accessed_time,
+                          MFTFileNameRecordChangeTime=mft_filename_record_change_time,
+                          MFTFileNameLength=mft_filename_length)
+    return uco_object.create_PropertyBundle('MFTRecord', **properties)
+
+
+def propbundle_Mutex(uco_object, is_named=_MISSING):
     '''
     :param IsNamed: Exactly one value of type Bool.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(is_named, Missing),\
-    "[propbundle_Mutex] is_named is required."
-    if not isinstance(is_named, Missing):
-        assert isinstance(is_named, bool),\
+    _require(is_named, "[propbundle_Mutex] is_named is required.")
+
+    if _VALIDATE:
+        assert type(is_named) is bool,\
         "[propbundle_Mutex] is_named must be of type Bool."
 
-    return uco_object.create_PropertyBundle('Mutex', IsNamed=is_named)
+    properties = _present(IsNamed=is_named)
+    return uco_object.create_PropertyBundle('Mutex', **properties)
 
 
-def propbundle_NetworkConnection(uco_object, is_active=Missing(), start_time=Missing(), end_time=Missing(),
-                                 source_refs=Missing(), destination_refs=Missing(), source_port=Missing(),
-                                 destination_port=Missing(), protocols=Missing()):
+def propbundle_NetworkConnection(uco_object, is_active=_MISSING, start_time=_MISSING, end_time=_MISSING,
+                                 source_refs=_MISSING, destination_refs=_MISSING, source_port=_MISSING,
+                                 destination_port=_MISSING, protocols=_MISSING):
     '''
     :param IsActive: At most one value of type Bool.
     :param StartTime: At most one value of type Datetime.
@@ -2337,45 +2385,42 @@ def propbundle_NetworkConnection(uco_object, is_active=Missing(), start_time=Mis
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(is_active, Missing):
-        assert isinstance(is_active, bool),\
-        "[propbundle_NetworkConnection] is_active must be of type Bool."
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[propbundle_NetworkConnection] start_time must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[propbundle_NetworkConnection] end_time must be of type Datetime."
-    if not isinstance(source_refs, Missing):
-        assert isinstance(source_refs, list),\
-        "[propbundle_NetworkConnection] source_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in source_refs),\
-        "[propbundle_NetworkConnection] source_refs must be of type List of CoreObject."
-    if not isinstance(destination_refs, Missing):
-        assert isinstance(destination_refs, list),\
-        "[propbundle_NetworkConnection] destination_refs must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in destination_refs),\
-        "[propbundle_NetworkConnection] destination_refs must be of type List of CoreObject."
-    if not isinstance(source_port, Missing):
-        assert isinstance(source_port, int),\
-        "[propbundle_NetworkConnection] source_port must be of type Integer."
-    if not isinstance(destination_port, Missing):
-        assert isinstance(destination_port, int),\
-        "[propbundle_NetworkConnection] destination_port must be of type Integer."
-    if not isinstance(protocols, Missing):
-        assert (isinstance(protocols, case.DuckObject) and (protocols.type=='ControlledDictionary')),\
-        "[propbundle_NetworkConnection] protocols must be of type ControlledDictionary."
-
-    return uco_object.create_PropertyBundle('NetworkConnection', IsActive=is_active, StartTime=start_time,
-                                            EndTime=end_time, SourceRefs=source_refs,
-                                            DestinationRefs=destination_refs, SourcePort=source_port,
-                                            DestinationPort=destination_port, Protocols=protocols)
+    if _VALIDATE:
+        if is_active is not _MISSING:
+            assert type(is_active) is bool,\
+            "[propbundle_NetworkConnection] is_active must be of type Bool."
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[propbundle_NetworkConnection] start_time must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[propbundle_NetworkConnection] end_time must be of type Datetime."
+        if source_refs is not _MISSING:
+            _check_list_of(source_refs, _CoreObject, None,
+                           "[propbundle_NetworkConnection] source_refs must be of type List of CoreObject.")
+        if destination_refs is not _MISSING:
+            _check_list_of(destination_refs, _CoreObject, None,
+                           "[propbundle_NetworkConnection] destination_refs must be of type List of CoreObject.")
+        if source_port is not _MISSING:
+            assert _is_integer(source_port),\
+            "[propbundle_NetworkConnection] source_port must be of type Integer."
+        if destination_port is not _MISSING:
+            assert _is_integer(destination_port),\
+            "[propbundle_NetworkConnection] destination_port must be of type Integer."
+        if protocols is not _MISSING:
+            _check_instance_of(protocols, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                               "[propbundle_NetworkConnection] protocols must be of type ControlledDictionary.")
+
+    properties = _present(IsActive=is_active, StartTime=start_time, EndTime=end_time, SourceRefs=source_refs,
+                          DestinationRefs=destination_refs, SourcePort=source_port, DestinationPort=destination_port,
+                          Protocols=protocols)
+    return uco_object.create_PropertyBundle('NetworkConnection', **properties)
 
     
-def propbundle_NetworkFlow(uco_object, source_bytes=Missing(), destination_bytes=Missing(),
-                           source_packets=Missing(), destination_packets=Missing(),
-                           source_payload_refs=Missing(), destination_payload_refs=Missing(),
-                           ipfix=Missing()):
+def propbundle_NetworkFlow(uco_object, source_bytes=_MISSING, destination_bytes=_MISSING,
+                           source_packets=_MISSING, destination_packets=_MISSING,
+                           source_payload_refs=_MISSING, destination_payload_refs=_MISSING,
+                           ipfix=_MISSING):
     '''
     :param SourceBytes: At most one value of type Integer.
     :param DestinationBytes: At most one value of type Integer.
@@ -2386,41 +2431,39 @@ def propbundle_NetworkFlow(uco_object, source_bytes=Missing(), destination_bytes
     :param IPFIX: At most one occurrence of type Dictionary.
     :return: A PropertyBundle object.
     '''
-    
-    if not isinstance(source_bytes, Missing):
-        assert isinstance(source_bytes, int),\
-        "[propbundle_NetworkFlow] source_bytes must be of type Integer."
-    if not isinstance(destination_bytes, Missing):
-        assert isinstance(destination_bytes, int),\
-        "[propbundle_NetworkFlow] destination_bytes must be of type Integer."
-    if not isinstance(source_packets, Missing):
-        assert isinstance(source_packets, int),\
-        "[propbundle_NetworkFlow] source_packets must be of type Integer."
-    if not isinstance(destination_packets, Missing):
-        assert isinstance(destination_packets, int),\
-        "[propbundle_NetworkFlow] destination_packets must be of type Integer."
-    if not isinstance(source_payload_refs, Missing):
-        assert (isinstance(source_payload_refs, case.CoreObject) and (source_payload_refs.type=='Trace')),\
-        "[propbundle_NetworkFlow] source_payload_refs must be of type Trace."
-    if not isinstance(destination_payload_refs, Missing):
-        assert (isinstance(destination_payload_refs, case.CoreObject) and (destination_payload_refs.type=='Trace')),\
-        "[propbundle_NetworkFlow] destination_payload_refs must be of type Trace."
-    if not isinstance(ipfix, Missing):
-        assert (isinstance(ipfix, case.DuckObject) and (ipfix.type=='Dictionary')),\
-        "[propbundle_NetworkFlow] ipfix must be of type Dictionary."
-
-    return uco_object.create_PropertyBundle('NetworkFlow', SourceBytes=source_bytes,
-                                            DestinationBytes=destination_bytes,
-                                            SourcePackets=source_packets,
-                                            DestinationPackets=destination_packets,
-                                            SourcePayloadRefs=source_payload_refs,
-                                            DestinationPayloadRefs=destination_payload_refs,
-                                            IPFIX=ipfix)
-
-
-def propbundle_NetworkInterface(uco_object, adapter_name=Missing(), dhcp_lease_expires=Missing(),
-                                dhcp_lease_obtained=Missing(), dhcp_server_refs=Missing(),
-                                ip_gateway_refs=Missing(), ip_refs=Missing(), mac_address_ref=Missing()):
+
+    if _VALIDATE:
+        if source_bytes is not _MISSING:
+            assert _is_integer(source_bytes),\
+            "[propbundle_NetworkFlow] source_bytes must be of type Integer."
+        if destination_bytes is not _MISSING:
+            assert _is_integer(destination_bytes),\
+            "[propbundle_NetworkFlow] destination_bytes must be of type Integer."
+        if source_packets is not _MISSING:
+            assert _is_integer(source_packets),\
+            "[propbundle_NetworkFlow] source_packets must be of type Integer."
+        if destination_packets is not _MISSING:
+            assert _is_integer(destination_packets),\
+            "[propbundle_NetworkFlow] destination_packets must be of type Integer."
+        if source_payload_refs is not _MISSING:
+            _check_instance_of(source_payload_refs, _CoreObject, _TAG_TRACE,
+                               "[propbundle_NetworkFlow] source_payload_refs must be of type Trace.")
+        if destination_payload_refs is not _MISSING:
+            _check_instance_of(destination_payload_refs, _CoreObject, _TAG_TRACE,
+                               "[propbundle_NetworkFlow] destination_payload_refs must be of type Trace.")
+        if ipfix is not _MISSING:
+            _check_instance_of(ipfix, _DuckObject, _TAG_DICTIONARY,
+                               "[propbundle_NetworkFlow] ipfix must be of type Dictionary.")
+
+    properties = _present(SourceBytes=source_bytes, DestinationBytes=destination_bytes, SourcePackets=source_packets,
+                          DestinationPackets=destination_packets, SourcePayloadRefs=source_payload_refs,
+                          DestinationPayloadRefs=destination_payload_refs, IPFIX=ipfix)
+    return uco_object.create_PropertyBundle('NetworkFlow', **properties)
+
+
+def propbundle_NetworkInterface(uco_object, adapter_name=_MISSING, dhcp_lease_expires=_MISSING,
+                                dhcp_lease_obtained=_MISSING, dhcp_server_refs=_MISSING,
+                                ip_gateway_refs=_MISSING, ip_refs=_MISSING, mac_address_ref=_MISSING):
     '''
     :param AdapterName: At most one value of type String.
     :param DHCPLeaseExpires: At most one value of type Datetime.
@@ -2432,42 +2475,37 @@ def propbundle_NetworkInterface(uco_object, adapter_name=Missing(), dhcp_lease_e
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(adapter_name, Missing):
-        assert isinstance(adapter_name, str),\
-        "[propbundle_NetworkInterface] adapter_name must be of type String."
-    if not isinstance(dhcp_lease_expires, Missing):
-        assert isinstance(dhcp_lease_expires, datetime.datetime),\
-        "[propbundle_NetworkInterface] dhcp_lease_expires must be of type Datetime."
-    if not isinstance(dhcp_lease_obtained, Missing):
-        assert isinstance(dhcp_lease_obtained, datetime.datetime),\
-        "[propbundle_NetworkInterface] dhcp_lease_obtained must be of type Datetime."
-    if not isinstance(dhcp_server_refs, Missing):
-        assert isinstance(dhcp_server_refs, list),\
-        "[propbundle_NetworkInterface] dhcp_server_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in dhcp_server_refs),\
-        "[propbundle_NetworkInterface] dhcp_server_refs must be of type List of Trace."
-    if not isinstance(ip_gateway_refs, Missing):
-        assert isinstance(ip_gateway_refs, list),\
-        "[propbundle_NetworkInterface] ip_gateway_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in ip_gateway_refs),\
-        "[propbundle_NetworkInterface] ip_gateway_refs must be of type List of Trace."
-    if not isinstance(ip_refs, Missing):
-        assert isinstance(ip_refs, list),\
-        "[propbundle_NetworkInterface] ip_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in ip_refs),\
-        "[propbundle_NetworkInterface] ip_refs must be of type List of Trace."
-    if not isinstance(mac_address_ref, Missing):
-        assert (isinstance(mac_address_ref, case.CoreObject) and (mac_address_ref.type=='Trace')),\
-        "[propbundle_NetworkInterface] mac_address_ref must be of type Trace."
-
-    return uco_object.create_PropertyBundle('NetworkInterface', AdapterName=adapter_name,
-                                            DHCPLeaseExpires=dhcp_lease_expires, DHCPLeaseObtained=dhcp_lease_obtained,
-                                            DHCPServerRefs=dhcp_server_refs, IPGatewayRefs=ip_gateway_refs,
-                                            IPRefs=ip_refs, MACAddressRef=mac_address_ref)
-
-
-def propbundle_Note(uco_object, application_ref=Missing(), categories=Missing(), created_time=Missing(),
-                    modified_time=Missing(), labels=Missing(), text=Missing()):
+    if _VALIDATE:
+        if adapter_name is not _MISSING:
+            assert (type(adapter_name) is str or isinstance(adapter_name, str)),\
+            "[propbundle_NetworkInterface] adapter_name must be of type String."
+        if dhcp_lease_expires is not _MISSING:
+            assert (type(dhcp_lease_expires) is _datetime or isinstance(dhcp_lease_expires, _datetime)),\
+            "[propbundle_NetworkInterface] dhcp_lease_expires must be of type Datetime."
+        if dhcp_lease_obtained is not _MISSING:
+            assert (type(dhcp_lease_obtained) is _datetime or isinstance(dhcp_lease_obtained, _datetime)),\
+            "[propbundle_NetworkInterface] dhcp_lease_obtained must be of type Datetime."
+        if dhcp_server_refs is not _MISSING:
+            _check_list_of(dhcp_server_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_NetworkInterface] dhcp_server_refs must be of type List of Trace.")
+        if ip_gateway_refs is not _MISSING:
+            _check_list_of(ip_gateway_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_NetworkInterface] ip_gateway_refs must be of type List of Trace.")
+        if ip_refs is not _MISSING:
+            _check_list_of(ip_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_NetworkInterface] ip_refs must be of type List of Trace.")
+        if mac_address_ref is not _MISSING:
+            _check_instance_of(mac_address_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_NetworkInterface] mac_address_ref must be of type Trace.")
+
+    properties = _present(AdapterName=adapter_name, DHCPLeaseExpires=dhcp_lease_expires,
+                          DHCPLeaseObtained=dhcp_lease_obtained, DHCPServerRefs=dhcp_server_refs,
+                          IPGatewayRefs=ip_gateway_refs, IPRefs=ip_refs, MACAddressRef=mac_address_ref)
+    return uco_object.create_PropertyBundle('NetworkInterface', **properties)
+
+
+def propbundle_Note(uco_object, application_ref=_MISSING, categories=_MISSING, created_time=_MISSING,
+                    modified_time=_MISSING, labels=_MISSING, text=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param Categories: Any number of values of type String.
@@ -2478,35 +2516,31 @@ def propbundle_Note(uco_object, application_ref=Missing(), categories=Missing(),
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_Note] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_Note] application_ref must be of type Trace."
-
-    if not isinstance(categories, Missing):
-        assert isinstance(categories, list),\
-        "[propbundle_Note] categories must be of type List of String."
-        assert all(isinstance(i, str) for i in categories),\
-        "[propbundle_Note] categories must be of type List of String."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_Note] created_time must be of type Datetime."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_Note] modified_time must be of type Datetime."
-    if not isinstance(labels, Missing):
-        assert isinstance(labels, list),\
-        "[propbundle_Note] labels must be of type List of String."
-        assert all(isinstance(i, str) for i in labels),\
-        "[propbundle_Note] labels must be of type List of String."
-    if not isinstance(text, Missing):
-        assert isinstance(text, str),\
-        "[propbundle_Note] text must be of type String."
-
-    return uco_object.create_PropertyBundle('Note', ApplicationRef=application_ref, Categories=categories,
-                                            CreatedTime=created_time, ModifiedTime=modified_time,
-                                            Labels=labels, Text=text)
+    _require(application_ref, "[propbundle_Note] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_Note] application_ref must be of type Trace.")
+
+        if categories is not _MISSING:
+            _check_list_of(categories, str, None,
+                           "[propbundle_Note] categories must be of type List of String.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_Note] created_time must be of type Datetime."
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_Note] modified_time must be of type Datetime."
+        if labels is not _MISSING:
+            _check_list_of(labels, str, None,
+                           "[propbundle_Note] labels must be of type List of String.")
+        if text is not _MISSING:
+            assert (type(text) is str or isinstance(text, str)),\
+            "[propbundle_Note] text must be of type String."
+
+    properties = _present(ApplicationRef=application_ref, Categories=categories, CreatedTime=created_time,
+                          ModifiedTime=modified_time, Labels=labels, Text=text)
+    return uco_object.create_PropertyBundle('Note', **properties)
 
 
 def propbundle_NTFSFilePermissions(uco_object):
@@ -2519,7 +2553,7 @@ def propbundle_NTFSFilePermissions(uco_object):
     return uco_object.create_PropertyBundle('NTFSFilePermission')
 
 
-def propbundle_NTFSFileSystem(uco_object, sid=Missing(), alternate_data_streams=Missing(), entry_id=Missing()):
+def propbundle_NTFSFileSystem(uco_object, sid=_MISSING, alternate_data_streams=_MISSING, entry_id=_MISSING):
     '''
     :param SID: At most one value of type String.
     :param AlternateDataStreams: Any number of occurrences of type AlternateDataStream.
@@ -2527,24 +2561,23 @@ def propbundle_NTFSFileSystem(uco_object, sid=Missing(), alternate_data_streams=
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(sid, Missing):
-        assert isinstance(sid, str),\
-        "[propbundle_NTFSFileSystem] sid must be of type String."
-    if not isinstance(alternate_data_streams, Missing):
-        assert isinstance(alternate_data_streams, list),\
-        "[propbundle_NTFSFileSystem] alternate_data_streams must be of type List of AlternateDataStream."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='AlternateDataStream') for i in alternate_data_streams),\
-        "[propbundle_NTFSFileSystem] alternate_data_streams must be of type List of AlternateDataStream."
-    if not isinstance(entry_id, Missing):
-        assert isinstance(entry_id, long),\
-        "[propbundle_NTFSFileSystem] entry_id must be of type Long."
+    if _VALIDATE:
+        if sid is not _MISSING:
+            assert (type(sid) is str or isinstance(sid, str)),\
+            "[propbundle_NTFSFileSystem] sid must be of type String."
+        if alternate_data_streams is not _MISSING:
+            _check_list_of(alternate_data_streams, _DuckObject, _TAG_ALTERNATE_DATA_STREAM,
+                           "[propbundle_NTFSFileSystem] alternate_data_streams must be of type List of AlternateDataStream.")
+        if entry_id is not _MISSING:
+            assert _is_integer(entry_id),\
+            "[propbundle_NTFSFileSystem] entry_id must be of type Long."
 
-    return uco_object.create_PropertyBundle('NTFSFileSystem', SID=sid, AlternateDataStreams=alternate_data_streams,
-                                            EntryID=entry_id)
+    properties = _present(SID=sid, AlternateDataStreams=alternate_data_streams, EntryID=entry_id)
+    return uco_object.create_PropertyBundle('NTFSFileSystem', **properties)
 
 
-def propbundle_OperatingSystem(uco_object, manufacturer=Missing(), version=Missing(), bitness=Missing(),
-                               environment_variables=Missing(), install_date=Missing()):
+def propbundle_OperatingSystem(uco_object, manufacturer=_MISSING, version=_MISSING, bitness=_MISSING,
+                               environment_variables=_MISSING, install_date=_MISSING):
     '''
     :param Manufacturer: At most one value of type String.
     :param Version: At most one value of type String.
@@ -2554,46 +2587,46 @@ def propbundle_OperatingSystem(uco_object, manufacturer=Missing(), version=Missi
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(manufacturer, Missing):
-        assert isinstance(manufacturer, str),\
-        "[propbundle_OperatingSystem] manufacturer must be of type String."
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_OperatingSystem] version must be of type String."
-    if not isinstance(bitness, Missing):
-        assert (isinstance(bitness, case.DuckObject) and (bitness.type=='ControlledDictionary')),\
-        "[propbundle_OperatingSystem] bitness must be of type ControlledDictionary."
-    if not isinstance(environment_variables, Missing):
-        assert (isinstance(environment_variables, case.DuckObject) and (environment_variables.type=='Dictionary')),\
-        "[propbundle_OperatingSystem] environment_variables must be of type Dictionary."
-    if not isinstance(install_date, Missing):
-        assert isinstance(install_date, datetime.datetime),\
-        "[propbundle_OperatingSystem] install_date must be of type Datetime."
+    if _VALIDATE:
+        if manufacturer is not _MISSING:
+            assert (type(manufacturer) is str or isinstance(manufacturer, str)),\
+            "[propbundle_OperatingSystem] manufacturer must be of type String."
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_OperatingSystem] version must be of type String."
+        if bitness is not _MISSING:
+            _check_instance_of(bitness, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                               "[propbundle_OperatingSystem] bitness must be of type ControlledDictionary.")
+        if environment_variables is not _MISSING:
+            _check_instance_of(environment_variables, _DuckObject, _TAG_DICTIONARY,
+                               "[propbundle_OperatingSystem] environment_variables must be of type Dictionary.")
+        if install_date is not _MISSING:
+            assert (type(install_date) is _datetime or isinstance(install_date, _datetime)),\
+            "[propbundle_OperatingSystem] install_date must be of type Datetime."
 
-    return uco_object.create_PropertyBundle('OperatingSystem', Manufacturer=manufacturer, Version=version,
-                                            Bitness=bitness, EnvironmentVariables=environment_variables,
-                                            InstallDate=install_date)
+    properties = _present(Manufacturer=manufacturer, Version=version, Bitness=bitness,
+                          EnvironmentVariables=environment_variables, InstallDate=install_date)
+    return uco_object.create_PropertyBundle('OperatingSystem', **properties)
 
 
-def propbundle_PathRelation(uco_object, path=Missing()):
+def propbundle_PathRelation(uco_object, path=_MISSING):
     '''
     :param Path: At least one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(path, Missing),\
-    "[propbundle_PathRelation] path is required."
-    if not isinstance(path, Missing):
-        assert isinstance(path, list),\
-        "[propbundle_PathRelation] path must be of type List of String."
-        assert all(isinstance(i, str) for i in path),\
-        "[propbundle_PathRelation] path must be of type List of String."
-        
-    return uco_object.create_PropertyBundle('PathRelationship', Path=path)
+    _require(path, "[propbundle_PathRelation] path is required.")
 
+    if _VALIDATE:
+        _check_list_of(path, str, None,
+                       "[propbundle_PathRelation] path must be of type List of String.")
 
-def propbundle_PDFFile(uco_object, version=Missing(), is_optimized=Missing(), document_information_dictionary=Missing(),
-                       pdf_id_zero=Missing(), pdf_id_one=Missing()):
+    properties = _present(Path=path)
+    return uco_object.create_PropertyBundle('PathRelationship', **properties)
+
+
+def propbundle_PDFFile(uco_object, version=_MISSING, is_optimized=_MISSING, document_information_dictionary=_MISSING,
+                       pdf_id_zero=_MISSING, pdf_id_one=_MISSING):
     '''
     :param Version: At most one value of type String.
     :param IsOptimized: At most one value of type Bool.
@@ -2603,48 +2636,48 @@ def propbundle_PDFFile(uco_object, version=Missing(), is_optimized=Missing(), do
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_PDFFile] version must be of type String."
-    if not isinstance(is_optimized, Missing):
-        assert isinstance(is_optimized, bool),\
-        "[propbundle_PDFFile] is_optimized must be of type Bool."
-    if not isinstance(document_information_dictionary, Missing):
-        assert (isinstance(document_information_dictionary, case.DuckObject) and
-                (document_information_dictionary.type=='ControlledDictionary')),\
-        "[propbundle_PDFFile] document_information_dictionary must be of type ControlledDictionary."
-    if not isinstance(pdf_id_zero, Missing):
-        assert isinstance(pdf_id_zero, list),\
-        "[propbundle_PDFFile] pdf_id_zero must be of type List of String."
-        assert all(isinstance(i, str) for i in pdf_id_zero),\
-        "[propbundle_PDFFile] pdf_id_zero must be of type List of String."
-    if not isinstance(pdf_id_one, Missing):
-        assert isinstance(pdf_id_one, str),\
-        "[propbundle_PDFFile] pdf_id_one must be of type String."
-    
-    return uco_object.create_PropertyBundle('PDFFile', Version=version, IsOptimized=is_optimized,
-                                            DocumentInformationDictionary=document_information_dictionary,
-                                            PDFIDZero=pdf_id_zero, PDFIDOne=pdf_id_one)
+    if _VALIDATE:
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_PDFFile] version must be of type String."
+        if is_optimized is not _MISSING:
+            assert type(is_optimized) is bool,\
+            "[propbundle_PDFFile] is_optimized must be of type Bool."
+        if document_information_dictionary is not _MISSING:
+            _check_instance_of(document_information_dictionary, _DuckObject, _TAG_CONTROLLED_DICTIONARY,
+                               "[propbundle_PDFFile] document_information_dictionary must be of type ControlledDictionary.")
+        if pdf_id_zero is not _MISSING:
+            _check_list_of(pdf_id_zero, str, None,
+                           "[propbundle_PDFFile] pdf_id_zero must be of type List of String.")
+        if pdf_id_one is not _MISSING:
+            assert (type(pdf_id_one) is str or isinstance(pdf_id_one, str)),\
+            "[propbundle_PDFFile] pdf_id_one must be of type String."
 
+    properties = _present(Version=version, IsOptimized=is_optimized,
+                          DocumentInformationDictionary=document_information_dictionary, PDFIDZero=pdf_id_zero,
+                          PDFIDOne=pdf_id_one)
+    return uco_object.create_PropertyBundle('PDFFile', **properties)
 
-def propbundle_PhoneAccount(uco_object, phone_number=Missing()):
+
+def propbundle_PhoneAccount(uco_object, phone_number=_MISSING):
     '''
     :param PhoneNumber: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(phone_number, Missing),\
-    "[propbundle_PhoneAccount] phone_number is required."
-    if not isinstance(phone_number, Missing):
-        assert isinstance(phone_number, str),\
+    _require(phone_number, "[propbundle_PhoneAccount] phone_number is required.")
+
+    if _VALIDATE:
+        assert (type(phone_number) is str or isinstance(phone_number, str)),\
         "[propbundle_PhoneAccount] phone_number must be of type String."
 
-    return uco_object.create_PropertyBundle('PhoneAccount', PhoneNumber=phone_number)
+    properties = _present(PhoneNumber=phone_number)
+    return uco_object.create_PropertyBundle('PhoneAccount', **properties)
 
 
-def propbundle_PhoneCall(uco_object, application_ref=Missing(), call_type=Missing(), duration=Missing(),
-                         start_time=Missing(), end_time=Missing(), from_ref=Missing(), to_ref=Missing(),
-                         participant_refs=Missing()):
+def propbundle_PhoneCall(uco_object, application_ref=_MISSING, call_type=_MISSING, duration=_MISSING,
+                         start_time=_MISSING, end_time=_MISSING, from_ref=_MISSING, to_ref=_MISSING,
+                         participant_refs=_MISSING):
     '''
     :param ApplicationRef: Exactly one occurrence of type Trace.
     :param CallType: At most one value of type String.
@@ -2657,45 +2690,43 @@ def propbundle_PhoneCall(uco_object, application_ref=Missing(), call_type=Missin
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(application_ref, Missing),\
-    "[propbundle_PhoneCall] application_ref is required."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_PhoneCall] application_ref must be of type Trace."
-
-    if not isinstance(call_type, Missing):
-        assert isinstance(call_type, str),\
-        "[propbundle_PhoneCall] call_type must be of type String."
-    if not isinstance(duration, Missing):
-        assert isinstance(duration, long),\
-        "[propbundle_PhoneCall] duration must be of type Long."
-    if not isinstance(start_time, Missing):
-        assert isinstance(start_time, datetime.datetime),\
-        "[propbundle_PhoneCall] start_time must be of type Datetime."
-    if not isinstance(end_time, Missing):
-        assert isinstance(end_time, datetime.datetime),\
-        "[propbundle_PhoneCall] end_time must be of type Datetime."
-    if not isinstance(from_ref, Missing):
-        assert (isinstance(from_ref, case.CoreObject) and (from_ref.type=='Trace')),\
-        "[propbundle_PhoneCall] from_ref must be of type Trace."
-    if not isinstance(to_ref, Missing):
-        assert (isinstance(to_ref, case.CoreObject) and (to_ref.type=='Trace')),\
-        "[propbundle_PhoneCall] to_ref must be of type Trace."
-    if not isinstance(participant_refs, Missing):
-        assert isinstance(participant_refs, list),\
-        "[propbundle_PhoneCall] participant_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in participant_refs),\
-        "[propbundle_PhoneCall] participant_refs must be of type List of Trace."
-
-    return uco_object.create_PropertyBundle('PhoneCall', ApplicationRef=application_ref, CallType=call_type,
-                                            Duration=duration, StartTime=start_time, EndTime=end_time,
-                                            FromRef=from_ref, ToRef=to_ref, ParticipantRef=participant_refs)
-
-
-def propbundle_Process(uco_object, arguments=Missing(), binary_ref=Missing(), created_time=Missing(),
-                       creator_user_ref=Missing(), current_working_directory=Missing(),
-                       environment_variables=Missing(), exit_status=Missing(), exit_time=Missing(),
-                       is_hidden=Missing(), parent_ref=Missing(), pid=Missing(), status=Missing()):
+    _require(application_ref, "[propbundle_PhoneCall] application_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_PhoneCall] application_ref must be of type Trace.")
+
+        if call_type is not _MISSING:
+            assert (type(call_type) is str or isinstance(call_type, str)),\
+            "[propbundle_PhoneCall] call_type must be of type String."
+        if duration is not _MISSING:
+            assert _is_integer(duration),\
+            "[propbundle_PhoneCall] duration must be of type Long."
+        if start_time is not _MISSING:
+            assert (type(start_time) is _datetime or isinstance(start_time, _datetime)),\
+            "[propbundle_PhoneCall] start_time must be of type Datetime."
+        if end_time is not _MISSING:
+            assert (type(end_time) is _datetime or isinstance(end_time, _datetime)),\
+            "[propbundle_PhoneCall] end_time must be of type Datetime."
+        if from_ref is not _MISSING:
+            _check_instance_of(from_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_PhoneCall] from_ref must be of type Trace.")
+        if to_ref is not _MISSING:
+            _check_instance_of(to_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_PhoneCall] to_ref must be of type Trace.")
+        if participant_refs is not _MISSING:
+            _check_list_of(participant_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_PhoneCall] participant_refs must be of type List of Trace.")
+
+    properties = _present(ApplicationRef=application_ref, CallType=call_type, Duration=duration, StartTime=start_time,
+                          EndTime=end_time, FromRef=from_ref, ToRef=to_ref, ParticipantRef=participant_refs)
+    return uco_object.create_PropertyBundle('PhoneCall', **properties)
+
+
+def propbundle_Process(uco_object, arguments=_MISSING, binary_ref=_MISSING, created_time=_MISSING,
+                       creator_user_ref=_MISSING, current_working_directory=_MISSING,
+                       environment_variables=_MISSING, exit_status=_MISSING, exit_time=_MISSING,
+                       is_hidden=_MISSING, parent_ref=_MISSING, pid=_MISSING, status=_MISSING):
     '''
     :param Arguments: Any number of values of type String.
     :param BinaryRef: At most one occurrence of type Trace.
@@ -2712,55 +2743,53 @@ def propbundle_Process(uco_object, arguments=Missing(), binary_ref=Missing(), cr
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(arguments, Missing):
-        assert isinstance(arguments, list),\
-        "[propbundle_Process] arguments must be of type List of String."
-        assert all(isinstance(i, str) for i in arguments),\
-        "[propbundle_Process] arguments must be of type List of String."
-    if not isinstance(binary_ref, Missing):
-        assert (isinstance(binary_ref, case.CoreObject) and (binary_ref.type=='Trace')),\
-        "[propbundle_Process] binary_ref must be of type Trace."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_Process] created_time must be of type Datetime."
-    if not isinstance(creator_user_ref, Missing):
-        assert (isinstance(creator_user_ref, case.CoreObject) and (creator_user_ref.type=='Trace')),\
-        "[propbundle_Process] creator_user_ref must be of type Trace."
-    if not isinstance(current_working_directory, Missing):
-        assert isinstance(current_working_directory, str),\
-        "[propbundle_Process] current_working_directory must be of type String."
-    if not isinstance(environment_variables, Missing):
-        assert (isinstance(environment_variables, case.DuckObject) and (environment_variables.type=='Dictionary')),\
-        "[propbundle_Process] environment_variables must be of type Dictionary."
-    if not isinstance(exit_status, Missing):
-        assert isinstance(exit_status, long),\
-        "[propbundle_Process] exit_status must be of type Long."
-    if not isinstance(exit_time, Missing):
-        assert isinstance(exit_time, datetime.datetime),\
-        "[propbundle_Process] exit_time must be of type Datetime."
-    if not isinstance(is_hidden, Missing):
-        assert isinstance(is_hidden, bool),\
-        "[propbundle_Process] is_hidden must be of type Bool."
-    if not isinstance(parent_ref, Missing):
-        assert (isinstance(parent_ref, case.CoreObject) and (parent_ref.type=='Trace')),\
-        "[propbundle_Process] parent_ref must be of type Trace."
-    if not isinstance(pid, Missing):
-        assert isinstance(pid, int),\
-        "[propbundle_Process] pid must be of type Integer."
-    if not isinstance(status, Missing):
-        assert isinstance(status, str),\
-        "[propbundle_Process] status must be of type String."
-
-    return uco_object.create_PropertyBundle('Process', Arguments=arguments, BinaryRef=binary_ref,
-                                            CreatedTime=created_time, CreatorUserRef=creator_user_ref,
-                                            CurrentWorkingDirectory=current_working_directory,
-                                            EnvironmentVariables=environment_variables,
-                                            ExitStatus=exit_status, ExitTime=exit_time, IsHidden=is_hidden,
-                                            ParentRef=parent_ref, PID=pid, Status=status)
-
-
-def propbundle_RasterPicture(uco_object, picture_height=Missing(), picture_width=Missing(), bits_per_pixel=Missing(),
-                             image_compression_method=Missing(), camera_ref=Missing(), picture_type=Missing()):
+    if _VALIDATE:
+        if arguments is not _MISSING:
+            _check_list_of(arguments, str, None,
+                           "[propbundle_Process] arguments must be of type List of String.")
+        if binary_ref is not _MISSING:
+            _check_instance_of(binary_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Process] binary_ref must be of type Trace.")
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_Process] created_time must be of type Datetime."
+        if creator_user_ref is not _MISSING:
+            _check_instance_of(creator_user_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Process] creator_user_ref must be of type Trace.")
+        if current_working_directory is not _MISSING:
+            assert (type(current_working_directory) is str or isinstance(current_working_directory, str)),\
+            "[propbundle_Process] current_working_directory must be of type String."
+        if environment_variables is not _MISSING:
+            _check_instance_of(environment_variables, _DuckObject, _TAG_DICTIONARY,
+                               "[propbundle_Process] environment_variables must be of type Dictionary.")
+        if exit_status is not _MISSING:
+            assert _is_integer(exit_status),\
+            "[propbundle_Process] exit_status must be of type Long."
+        if exit_time is not _MISSING:
+            assert (type(exit_time) is _datetime or isinstance(exit_time, _datetime)),\
+            "[propbundle_Process] exit_time must be of type Datetime."
+        if is_hidden is not _MISSING:
+            assert type(is_hidden) is bool,\
+            "[propbundle_Process] is_hidden must be of type Bool."
+        if parent_ref is not _MISSING:
+            _check_instance_of(parent_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_Process] parent_ref must be of type Trace.")
+        if pid is not _MISSING:
+            assert _is_integer(pid),\
+            "[propbundle_Process] pid must be of type Integer."
+        if status is not _MISSING:
+            assert (type(status) is str or isinstance(status, str)),\
+            "[propbundle_Process] status must be of type String."
+
+    properties = _present(Arguments=arguments, BinaryRef=binary_ref, CreatedTime=created_time,
+                          CreatorUserRef=creator_user_ref, CurrentWorkingDirectory=current_working_directory,
+                          EnvironmentVariables=environment_variables, ExitStatus=exit_status, ExitTime=exit_time,
+                          IsHidden=is_hidden, ParentRef=parent_ref, PID=pid, Status=status)
+    return uco_object.create_PropertyBundle('Process', **properties)
+
+
+def propbundle_RasterPicture(uco_object, picture_height=_MISSING, picture_width=_MISSING, bits_per_pixel=_MISSING,
+                             image_compression_method=_MISSING, camera_ref=_MISSING, picture_type=_MISSING):
     '''
     :param PictureHeight: At most one value of type Integer.
     :param PictureWidth: At most one value of type Integer.
@@ -2771,33 +2800,34 @@ def propbundle_RasterPicture(uco_object, picture_height=Missing(), picture_width
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(picture_height, Missing):
-        assert isinstance(picture_height, int),\
-        "[propbundle_RasterPicture] picture_height must be of type Integer."
-    if not isinstance(picture_width, Missing):
-        assert isinstance(picture_width, int),\
-        "[propbundle_RasterPicture] picture_width must be of type Integer."
-    if not isinstance(bits_per_pixel, Missing):
-        assert isinstance(bits_per_pixel, int),\
-        "[propbundle_RasterPicture] bits_per_pixel must be of type Integer."
-    if not isinstance(image_compression_method, Missing):
-        assert isinstance(image_compression_method, str),\
-        "[propbundle_RasterPicture] image_compression_method must be of type String."
-    if not isinstance(camera_ref, Missing):
-        assert (isinstance(camera_ref, case.CoreObject) and (camera_ref.type=='Trace')),\
-        "[propbundle_RasterPicture] camera_ref must be of type Trace."
-    if not isinstance(picture_type, Missing):
-        assert isinstance(picture_type, str),\
-        "[propbundle_RasterPicture] picture_type must be of type String."
-
-    return uco_object.create_PropertyBundle('RasterPicture', PictureHeight=picture_height, PictureWidth=picture_width,
-                                            BitsPerPixel=bits_per_pixel,
-                                            ImageCompressionMethod=image_compression_method,
-                                            CameraRef=camera_ref, PictureType=picture_type)
-
-
-def propbundle_SimpleAddress(uco_object, street=Missing(), locality=Missing(), region=Missing(),
-                             postal_code=Missing(), country=Missing(), address_type=Missing()):
+    if _VALIDATE:
+        if picture_height is not _MISSING:
+            assert _is_integer(picture_height),\
+            "[propbundle_RasterPicture] picture_height must be of type Integer."
+        if picture_width is not _MISSING:
+            assert _is_integer(picture_width),\
+            "[propbundle_RasterPicture] picture_width must be of type Integer."
+        if bits_per_pixel is not _MISSING:
+            assert _is_integer(bits_per_pixel),\
+            "[propbundle_RasterPicture] bits_per_pixel must be of type Integer."
+        if image_compression_method is not _MISSING:
+            assert (type(image_compression_method) is str or isinstance(image_compression_method, str)),\
+            "[propbundle_RasterPicture] image_compression_method must be of type String."
+        if camera_ref is not _MISSING:
+            _check_instance_of(camera_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_RasterPicture] camera_ref must be of type Trace.")
+        if picture_type is not _MISSING:
+            assert (type(picture_type) is str or isinstance(picture_type, str)),\
+            "[propbundle_RasterPicture] picture_type must be of type String."
+
+    properties = _present(PictureHeight=picture_height, PictureWidth=picture_width, BitsPerPixel=bits_per_pixel,
+                          ImageCompressionMethod=image_compression_method, CameraRef=camera_ref,
+                          PictureType=picture_type)
+    return uco_object.create_PropertyBundle('RasterPicture', **properties)
+
+
+def propbundle_SimpleAddress(uco_object, street=_MISSING, locality=_MISSING, region=_MISSING,
+                             postal_code=_MISSING, country=_MISSING, address_type=_MISSING):
     '''
     :param Street: At most one value of type String.
     :param Locality: At most one value of type String.
@@ -2808,47 +2838,49 @@ def propbundle_SimpleAddress(uco_object, street=Missing(), locality=Missing(), r
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(street, Missing):
-        assert isinstance(street, str),\
-        "[propbundle_SimpleAddress] street must be of type String."
-    if not isinstance(locality, Missing):
-        assert isinstance(locality, str),\
-        "[propbundle_SimpleAddress] locality must be of type String."
-    if not isinstance(region, Missing):
-        assert isinstance(region, str),\
-        "[propbundle_SimpleAddress] region must be of type String."
-    if not isinstance(postal_code, Missing):
-        assert isinstance(postal_code, str),\
-        "[propbundle_SimpleAddress] postal_code must be of type String."
-    if not isinstance(country, Missing):
-        assert isinstance(country, str),\
-        "[propbundle_SimpleAddress] country must be of type String."
-    if not isinstance(address_type, Missing):
-        assert isinstance(address_type, str),\
-        "[propbundle_SimpleAddress] address_type must be of type String."
-
-    return uco_object.create_PropertyBundle('SimpleAddress', Street=street, Locality=locality,
-                                            Region=region, PostalCode=postal_code, Country=country,
-                                            AddressType=address_type)
-
-
-def propbundle_SMSMessage(uco_object, is_read=Missing()):
+    if _VALIDATE:
+        if street is not _MISSING:
+            assert (type(street) is str or isinstance(street, str)),\
+            "[propbundle_SimpleAddress] street must be of type String."
+        if locality is not _MISSING:
+            assert (type(locality) is str or isinstance(locality, str)),\
+            "[propbundle_SimpleAddress] locality must be of type String."
+        if region is not _MISSING:
+            assert (type(region) is str or isinstance(region, str)),\
+            "[propbundle_SimpleAddress] region must be of type String."
+        if postal_code is not _MISSING:
+            assert (type(postal_code) is str or isinstance(postal_code, str)),\
+            "[propbundle_SimpleAddress] postal_code must be of type String."
+        if country is not _MISSING:
+            assert (type(country) is str or isinstance(country, str)),\
+            "[propbundle_SimpleAddress] country must be of type String."
+        if address_type is not _MISSING:
+            assert (type(address_type) is str or isinstance(address_type, str)),\
+            "[propbundle_SimpleAddress] address_type must be of type String."
+
+    properties = _present(Street=street, Locality=locality, Region=region, PostalCode=postal_code, Country=country,
+                          AddressType=address_type)
+    return uco_object.create_PropertyBundle('SimpleAddress', **properties)
+
+
+def propbundle_SMSMessage(uco_object, is_read=_MISSING):
     '''
     :param IsRead: Exactly one value of type Bool.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(is_read, Missing),\
-    "[propbundle_SMSMessage] is_read is required."
-    if not isinstance(is_read, Missing):
-        assert isinstance(is_read, bool),\
+    _require(is_read, "[propbundle_SMSMessage] is_read is required.")
+
+    if _VALIDATE:
+        assert type(is_read) is bool,\
         "[propbundle_SMSMessage] is_read must be of type Bool."
 
-    return uco_object.create_PropertyBundle('SMSMessage', IsRead=is_read)
+    properties = _present(IsRead=is_read)
+    return uco_object.create_PropertyBundle('SMSMessage', **properties)
 
 
-def propbundle_Software(uco_object, version=Missing(), language=Missing(), manufacturer=Missing(), swid=Missing(),
-                        cpeid=Missing()):
+def propbundle_Software(uco_object, version=_MISSING, language=_MISSING, manufacturer=_MISSING, swid=_MISSING,
+                        cpeid=_MISSING):
     '''
     :param Version: At most one value of type String.
     :param Language: At most one value of type String.
@@ -2857,29 +2889,30 @@ def propbundle_Software(uco_object, version=Missing(), language=Missing(), manuf
     :param CPEID: At most one value of type String.
     :return: A PropertyBundle object.
     '''
-    
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_Software] version must be of type String."
-    if not isinstance(language, Missing):
-        assert isinstance(language, str),\
-        "[propbundle_Software] language must be of type String."
-    if not isinstance(manufacturer, Missing):
-        assert isinstance(manufacturer, str),\
-        "[propbundle_Software] manufacturer must be of type String."
-    if not isinstance(swid, Missing):
-        assert isinstance(swid, str),\
-        "[propbundle_Software] swid must be of type String."
-    if not isinstance(cpeid, Missing):
-        assert isinstance(cpeid, str),\
-        "[propbundle_Software] cpeid must be of type String."
-
-    return uco_object.create_PropertyBundle('Software', Version=version, Language=language,
-                                            Manufacturer=manufacturer, SWID=swid, CPEID=cpeid)
-
-
-def propbundle_SQLiteBlob(uco_object, column_name=Missing(), row_condition=Missing(), row_index=Missing(),
-                          table_name=Missing()):
+
+    if _VALIDATE:
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_Software] version must be of type String."
+        if language is not _MISSING:
+            assert (type(language) is str or isinstance(language, str)),\
+            "[propbundle_Software] language must be of type String."
+        if manufacturer is not _MISSING:
+            assert (type(manufacturer) is str or isinstance(manufacturer, str)),\
+            "[propbundle_Software] manufacturer must be of type String."
+        if swid is not _MISSING:
+            assert (type(swid) is str or isinstance(swid, str)),\
+            "[propbundle_Software] swid must be of type String."
+        if cpeid is not _MISSING:
+            assert (type(cpeid) is str or isinstance(cpeid, str)),\
+            "[propbundle_Software] cpeid must be of type String."
+
+    properties = _present(Version=version, Language=language, Manufacturer=manufacturer, SWID=swid, CPEID=cpeid)
+    return uco_object.create_PropertyBundle('Software', **properties)
+
+
+def propbundle_SQLiteBlob(uco_object, column_name=_MISSING, row_condition=_MISSING, row_index=_MISSING,
+                          table_name=_MISSING):
     '''
     :param ColumnName: At most one value of type String.
     :param RowCondition: At most one value of type String.
@@ -2888,39 +2921,42 @@ def propbundle_SQLiteBlob(uco_object, column_name=Missing(), row_condition=Missi
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(column_name, Missing):
-        assert isinstance(column_name, str),\
-        "[propbundle_SQLiteBlob] column_name must be of type String."
-    if not isinstance(row_condition, Missing):
-        assert isinstance(row_condition, str),\
-        "[propbundle_SQLiteBlob] row_condition must be of type String."
-    if not isinstance(row_index, Missing):
-        assert (isinstance(row_index, int) and (row_index > 0)),\
-        "[propbundle_SQLiteBlob] row_index must be of type PositiveInteger."
-    if not isinstance(table_name, Missing):
-        assert isinstance(table_name, str),\
-        "[propbundle_SQLiteBlob] table_name must be of type String."
+    if _VALIDATE:
+        if column_name is not _MISSING:
+            assert (type(column_name) is str or isinstance(column_name, str)),\
+            "[propbundle_SQLiteBlob] column_name must be of type String."
+        if row_condition is not _MISSING:
+            assert (type(row_condition) is str or isinstance(row_condition, str)),\
+            "[propbundle_SQLiteBlob] row_condition must be of type String."
+        if row_index is not _MISSING:
+            assert _is_positive_integer(row_index),\
+            "[propbundle_SQLiteBlob] row_index must be of type PositiveInteger."
+        if table_name is not _MISSING:
+            assert (type(table_name) is str or isinstance(table_name, str)),\
+            "[propbundle_SQLiteBlob] table_name must be of type String."
 
-    return uco_object.create_PropertyBundle('SQLiteBlob', ColumnName=column_name,
-                                            RowCondition=row_condition, RowIndex=row_index, TableName=table_name)
+    properties = _present(ColumnName=column_name, RowCondition=row_condition, RowIndex=row_index,
+                          TableName=table_name)
+    return uco_object.create_PropertyBundle('SQLiteBlob', **properties)
 
 
-def propbundle_SymbolicLink(uco_object, target_file_ref=Missing()):
+def propbundle_SymbolicLink(uco_object, target_file_ref=_MISSING):
     '''
     :param TargetFileRef: Exactly one occurrence of type Trace.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(target_file_ref, Missing),\
-    "[propbundle_SymbolicLink] target_file_ref is required."
-    if not isinstance(target_file_ref, Missing):
-        assert (isinstance(target_file_ref, case.CoreObject) and (target_file_ref.type=='Trace')),\
-        "[propbundle_SymbolicLink] target_file_ref must be of type Trace."
+    _require(target_file_ref, "[propbundle_SymbolicLink] target_file_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(target_file_ref, _CoreObject, _TAG_TRACE,
+                           "[propbundle_SymbolicLink] target_file_ref must be of type Trace.")
 
-    return uco_object.create_PropertyBundle('SymbolicLink', TargetFileRef=target_file_ref)
+    properties = _present(TargetFileRef=target_file_ref)
+    return uco_object.create_PropertyBundle('SymbolicLink', **properties)
 
 
-def propbundle_TCPConnection(uco_object, source_flags=Missing(), destination_flags=Missing()):
+def propbundle_TCPConnection(uco_object, source_flags=_MISSING, destination_flags=_MISSING):
     '''
     :param SourceFlags: At most one value of type HexBinary.
     :param DestinationFlags: At most one value of type HexBinary.
@@ -2930,12 +2966,12 @@ def propbundle_TCPConnection(uco_object, source_flags=Missing(), destination_fla
     #TODO:HexBinary
     #TODO:HexBinary
 
-    return uco_object.create_PropertyBundle('TCPConnection', SourceFlags=source_flags,
-                                            DestinationFlags=destination_flags)
+    properties = _present(SourceFlags=source_flags, DestinationFlags=destination_flags)
+    return uco_object.create_PropertyBundle('TCPConnection', **properties)
 
 
-def propbundle_ToolConfigurationType(uco_object, configuration_settings=Missing(), dependencies=Missing(),
-                                     usage_context_assumptions=Missing()):
+def propbundle_ToolConfigurationType(uco_object, configuration_settings=_MISSING, dependencies=_MISSING,
+                                     usage_context_assumptions=_MISSING):
     '''
     :param ConfigurationSettings: Any number of occurrences of type ConfigurationSettingType.
     :param Dependencies: Any number of occurrences of type DependencyType.
@@ -2943,25 +2979,22 @@ def propbundle_ToolConfigurationType(uco_object, configuration_settings=Missing(
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(configuration_settings, Missing):
-        assert isinstance(configuration_settings, list),\
-        "[propbundle_ToolConfigurationType] configuration_settings must be of type List of ConfigurationSettingType."
-        assert all( (isinstance(i, case.DuckObject) and
-                     i.type=='ConfigurationSettingType') for i in configuration_settings),\
-        "[propbundle_ToolConfigurationType] configuration_settings must be of type List of ConfigurationSettingType."
-    if not isinstance(dependencies, Missing):
-        assert isinstance(dependencies, list),\
-        "[propbundle_ToolConfigurationType] dependencies must be of type List of DependencyType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='DependencyType') for i in dependencies),\
-        "[propbundle_ToolConfigurationType] dependencies must be of type List of DependencyType."
+    if _VALIDATE:
+        if configuration_settings is not _MISSING:
+            _check_list_of(configuration_settings, _DuckObject, _TAG_CONFIGURATION_SETTING_TYPE,
+                           "[propbundle_ToolConfigurationType] configuration_settings must be of type List of ConfigurationSettingType.")
+        if dependencies is not _MISSING:
+            _check_list_of(dependencies, _DuckObject, _TAG_DEPENDENCY_TYPE,
+                           "[propbundle_ToolConfigurationType] dependencies must be of type List of DependencyType.")
+
     #TODO:StructuredType
 
-    return uco_object.create_PropertyBundle('ToolConfigurationType', ConfigurationSettings=configuration_settings,
-                                            Dependencies=dependencies,
-                                            UsageContextAssumptions=usage_context_assumptions)
+    properties = _present(ConfigurationSettings=configuration_settings, Dependencies=dependencies,
+                          UsageContextAssumptions=usage_context_assumptions)
+    return uco_object.create_PropertyBundle('ToolConfigurationType', **properties)
 
 
-def propbundle_UNIXAccount(uco_object, gid=Missing(), groups=Missing(), shell=Missing(), **kwargs):
+def propbundle_UNIXAccount(uco_object, gid=_MISSING, groups=_MISSING, shell=_MISSING, **kwargs):
     '''
     :param GID: At most one value of type Integer.
     :param Groups: Any number of values of type String.
@@ -2969,19 +3002,19 @@ def propbundle_UNIXAccount(uco_object, gid=Missing(), groups=Missing(), shell=Mi
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(gid, Missing):
-        assert isinstance(gid, int),\
-        "[propbundle_UNIXAccount] gid must be of type Integer."
-    if not isinstance(groups, Missing):
-        assert isinstance(groups, list),\
-        "[propbundle_UNIXAccount] groups must be of type List of String."
-        assert all(isinstance(i, str) for i in groups),\
-        "[propbundle_UNIXAccount] groups must be of type List of String."
-    if not isinstance(shell, Missing):
-        assert isinstance(shell, str),\
-        "[propbundle_UNIXAccount] shell must be of type String."
+    if _VALIDATE:
+        if gid is not _MISSING:
+            assert _is_integer(gid),\
+            "[propbundle_UNIXAccount] gid must be of type Integer."
+        if groups is not _MISSING:
+            _check_list_of(groups, str, None,
+                           "[propbundle_UNIXAccount] groups must be of type List of String.")
+        if shell is not _MISSING:
+            assert (type(shell) is str or isinstance(shell, str)),\
+            "[propbundle_UNIXAccount] shell must be of type String."
 
-    return uco_object.create_PropertyBundle('UNIXAccount', GID=gid, Groups=groups, Shell=shell)
+    properties = _present(GID=gid, Groups=groups, Shell=shell)
+    return uco_object.create_PropertyBundle('UNIXAccount', **properties)
 
 
 def propbundle_UNIXFilePermissions(uco_object):
@@ -2994,8 +3027,8 @@ def propbundle_UNIXFilePermissions(uco_object):
     return uco_object.create_PropertyBundle('UNIXFilePermissions')
 
 
-def propbundle_UNIXProcess(uco_object, open_file_descriptor_refs=Missing(), priority=Missing(), ruid=Missing(),
-                           session_id=Missing()):
+def propbundle_UNIXProcess(uco_object, open_file_descriptor_refs=_MISSING, priority=_MISSING, ruid=_MISSING,
+                           session_id=_MISSING):
     '''
     :param OpenFileDescriptorRefs: Any number of value of type Integer.
     :param Priority: At most one value of type PositiveInteger.
@@ -3004,44 +3037,47 @@ def propbundle_UNIXProcess(uco_object, open_file_descriptor_refs=Missing(), prio
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(open_file_descriptor_refs, Missing):
-        assert isinstance(open_file_descriptor_refs, list),\
-        "[propbundle_UNIXProcess] open_file_descriptor_refs must be of type List of Integer."
-        assert all(isinstance(i, int) for i in open_file_descriptor_refs),\
-        "[propbundle_UNIXProcess] open_file_descriptor_refs must be of type List of Integer."
-    if not isinstance(priority, Missing):
-        assert (isinstance(priority, int) and (priority > 0)),\
-        "[propbundle_UNIXProcess] priority must be of type PositiveInteger."
-    if not isinstance(ruid, Missing):
-        assert (isinstance(ruid, int) and (ruid > 0)),\
-        "[propbundle_UNIXProcess] ruid must be of type PositiveInteger."
-    if not isinstance(session_id, Missing):
-        assert (isinstance(session_id, int) and (session_id > 0)),\
-        "[propbundle_UNIXProcess] session_id must be of type PositiveInteger."
+    if _VALIDATE:
+        if open_file_descriptor_refs is not _MISSING:
+            _check_list_of_integers(open_file_descriptor_refs,
+                                    "[propbundle_UNIXProcess] open_file_descriptor_refs must be of type "
+                                    "List of Integer.")
+        if priority is not _MISSING:
+            assert _is_positive_integer(priority),\
+            "[propbundle_UNIXProcess] priority must be of type PositiveInteger."
+        if ruid is not _MISSING:
+            assert _is_positive_integer(ruid),\
+            "[propbundle_UNIXProcess] ruid must be of type PositiveInteger."
+        if session_id is not _MISSING:
+            assert _is_positive_integer(session_id),\
+            "[propbundle_UNIXProcess] session_id must be of type PositiveInteger."
 
-    return uco_object.create_PropertyBundle('UNIXProcess', OpenFileDescriptorRefs=open_file_descriptor_refs,
-                                            Priority=priority, RUID=ruid, SessionID=session_id)
+    properties = _present(OpenFileDescriptorRefs=open_file_descriptor_refs, Priority=priority, RUID=ruid,
+                          SessionID=session_id)
+    return uco_object.create_PropertyBundle('UNIXProcess', **properties)
 
 
-def propbundle_UNIXVolume(uco_object, mount_point=Missing(), options=Missing()):
+def propbundle_UNIXVolume(uco_object, mount_point=_MISSING, options=_MISSING):
     '''
     :param MountPoint: At most one value of type String.
     :param Options: At most one value of type String.
     :return: A PropertyBundle objects.
     '''
 
-    if not isinstance(mount_point, Missing):
-        assert isinstance(mount_point, str),\
-        "[propbundle_UNIXVolume] mount_point must be of type String."
-    if not isinstance(options, Missing):
-        assert isinstance(options, str),\
-        "[propbundle_UNIXVolume] options must be of type String."
+    if _VALIDATE:
+        if mount_point is not _MISSING:
+            assert (type(mount_point) is str or isinstance(mount_point, str)),\
+            "[propbundle_UNIXVolume] mount_point must be of type String."
+        if options is not _MISSING:
+            assert (type(options) is str or isinstance(options, str)),\
+            "[propbundle_UNIXVolume] options must be of type String."
 
-    return uco_object.create_PropertyBundle('UNIXVolume', MountPoint=mount_point, Options=options)
+    properties = _present(MountPoint=mount_point, Options=options)
+    return uco_object.create_PropertyBundle('UNIXVolume', **properties)
 
 
-def propbundle_URL(uco_object, full_value=Missing(), scheme=Missing(), user_name_ref=Missing(), password_ref=Missing(),
-                   host_ref=Missing(), port=Missing(), path=Missing(), query=Missing(), fragment=Missing()):
+def propbundle_URL(uco_object, full_value=_MISSING, scheme=_MISSING, user_name_ref=_MISSING, password_ref=_MISSING,
+                   host_ref=_MISSING, port=_MISSING, path=_MISSING, query=_MISSING, fragment=_MISSING):
     '''
     :param FullValue: Exactly one value of type String.
     :param Scheme: At most one value of type String.
@@ -3055,44 +3091,44 @@ def propbundle_URL(uco_object, full_value=Missing(), scheme=Missing(), user_name
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(full_value, Missing),\
-    "[propbundle_URL] full_value is required."
-    if not isinstance(full_value, Missing):
-        assert isinstance(full_value, str),\
+    _require(full_value, "[propbundle_URL] full_value is required.")
+
+    if _VALIDATE:
+        assert (type(full_value) is str or isinstance(full_value, str)),\
         "[propbundle_URL] full_value must be of type String."
 
-    if not isinstance(scheme, Missing):
-        assert isinstance(scheme, str),\
-        "[propbundle_URL] scheme must be of type String."
-    if not isinstance(user_name_ref, Missing):
-        assert (isinstance(user_name_ref, case.CoreObject) and (user_name_ref.type=='Trace')),\
-        "[propbundle_URL] user_name_ref must be of type Trace."
-    if not isinstance(password_ref, Missing):
-        assert (isinstance(password_ref, case.CoreObject) and (password_ref.type=='Trace')),\
-        "[propbundle_URL] password_ref must be of type Trace."
-    if not isinstance(host_ref, Missing):
-        assert (isinstance(host_ref, case.CoreObject) and (host_ref.type=='Trace')),\
-        "[propbundle_URL] host_ref must be of type Trace."
-    if not isinstance(port, Missing):
-        assert isinstance(port, long),\
-        "[propbundle_URL] port must be of type Long."
-    if not isinstance(path, Missing):
-        assert isinstance(port, str),\
-        "[propbundle_URL] port must be of type String."
-    if not isinstance(query, Missing):
-        assert isinstance(query, str),\
-        "[propbundle_URL] query must be of type String."
-    if not isinstance(fragment, Missing):
-        assert isinstance(fragment, str),\
-        "[propbundle_URL] fragment must be of type String."
-
-    return uco_object.create_PropertyBundle('URL', FullValue=full_value, Scheme=scheme, UserNameRef=user_name_ref,
-                                            PasswordRef=password_ref, HostRef=host_ref, Port=port, Path=path,
-                                            Query=query, Fragment=fragment)
-
-
-def propbundle_UserAccount(uco_object, home_directory=Missing(), is_service_account=Missing(), is_privileged=Missing(),
-                           can_escalate_privileges=Missing()):
+        if scheme is not _MISSING:
+            assert (type(scheme) is str or isinstance(scheme, str)),\
+            "[propbundle_URL] scheme must be of type String."
+        if user_name_ref is not _MISSING:
+            _check_instance_of(user_name_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_URL] user_name_ref must be of type Trace.")
+        if password_ref is not _MISSING:
+            _check_instance_of(password_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_URL] password_ref must be of type Trace.")
+        if host_ref is not _MISSING:
+            _check_instance_of(host_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_URL] host_ref must be of type Trace.")
+        if port is not _MISSING:
+            assert _is_integer(port),\
+            "[propbundle_URL] port must be of type Long."
+        if path is not _MISSING:
+            assert (type(port) is str or isinstance(port, str)),\
+            "[propbundle_URL] port must be of type String."
+        if query is not _MISSING:
+            assert (type(query) is str or isinstance(query, str)),\
+            "[propbundle_URL] query must be of type String."
+        if fragment is not _MISSING:
+            assert (type(fragment) is str or isinstance(fragment, str)),\
+            "[propbundle_URL] fragment must be of type String."
+
+    properties = _present(FullValue=full_value, Scheme=scheme, UserNameRef=user_name_ref, PasswordRef=password_ref,
+                          HostRef=host_ref, Port=port, Path=path, Query=query, Fragment=fragment)
+    return uco_object.create_PropertyBundle('URL', **properties)
+
+
+def propbundle_UserAccount(uco_object, home_directory=_MISSING, is_service_account=_MISSING, is_privileged=_MISSING,
+                           can_escalate_privileges=_MISSING):
     '''
     :param HomeDirectory: At most one value of type String.
     :param IsServiceAccount: At most one value of type Bool.
@@ -3101,26 +3137,27 @@ def propbundle_UserAccount(uco_object, home_directory=Missing(), is_service_acco
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(home_directory, Missing):
-        assert isinstance(home_directory, str),\
-        "[propbundle_UserAccount] home_directory must be of type String."
-    if not isinstance(is_service_account, Missing):
-        assert isinstance(is_service_account, bool),\
-        "[propbundle_UserAccount] is_service_account must be of type Bool."
-    if not isinstance(is_privileged, Missing):
-        assert isinstance(is_privileged, bool),\
-        "[propbundle_UserAccount] is_privileged must be of type Bool."
-    if not isinstance(can_escalate_privileges, Missing):
-        assert isinstance(can_escalate_privileges, bool),\
-        "[propbundle_UserAccount] can_escalate_privileges must be of type Bool."
+    if _VALIDATE:
+        if home_directory is not _MISSING:
+            assert (type(home_directory) is str or isinstance(home_directory, str)),\
+            "[propbundle_UserAccount] home_directory must be of type String."
+        if is_service_account is not _MISSING:
+            assert type(is_service_account) is bool,\
+            "[propbundle_UserAccount] is_service_account must be of type Bool."
+        if is_privileged is not _MISSING:
+            assert type(is_privileged) is bool,\
+            "[propbundle_UserAccount] is_privileged must be of type Bool."
+        if can_escalate_privileges is not _MISSING:
+            assert type(can_escalate_privileges) is bool,\
+            "[propbundle_UserAccount] can_escalate_privileges must be of type Bool."
 
-    return uco_object.create_PropertyBundle('UserAccount', HomeDirectory=home_directory,
-                                            IsServiceAccount=is_service_account, IsPrivileged=is_privileged,
-                                            CanEscalatePrivileges=can_escalate_privileges)
+    properties = _present(HomeDirectory=home_directory, IsServiceAccount=is_service_account,
+                          IsPrivileged=is_privileged, CanEscalatePrivileges=can_escalate_privileges)
+    return uco_object.create_PropertyBundle('UserAccount', **properties)
 
 
-def propbundle_UserSession(uco_object, effective_group=Missing(), effective_group_id=Missing(),
-                           effective_user_ref=Missing(), login_time=Missing(), logout_time=Missing()):
+def propbundle_UserSession(uco_object, effective_group=_MISSING, effective_group_id=_MISSING,
+                           effective_user_ref=_MISSING, login_time=_MISSING, logout_time=_MISSING):
     '''
     :param EffectiveGroup: At most one value of type String.
     :param EffectiveGroupID: At most one value of type String.
@@ -3130,49 +3167,52 @@ def propbundle_UserSession(uco_object, effective_group=Missing(), effective_grou
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(effective_group, Missing):
-        assert isinstance(effective_group, str),\
-        "[propbundle_UserSession] effective_group must be of type String."
-    if not isinstance(effective_group_id, Missing):
-        assert isinstance(effective_group_id, str),\
-        "[propbundle_UserSession] effective_group_id must be of type String."
-    if not isinstance(effective_user_ref, Missing):
-        assert (isinstance(effective_user_ref, case.CoreObject) and (effective_user_ref.type=='Trace')),\
-        "[propbundle_UserSession] effective_user_ref must be of type Trace."
-    if not isinstance(login_time, Missing):
-        assert isinstance(login_time, datetime.datetime),\
-        "[propbundle_UserSession] login_time must be of type Datetime."
-    if not isinstance(logout_time, Missing):
-        assert isinstance(logout_time, datetime.datetime),\
-        "[propbundle_UserSession] logout_time must be of type Datetime."
+    if _VALIDATE:
+        if effective_group is not _MISSING:
+            assert (type(effective_group) is str or isinstance(effective_group, str)),\
+            "[propbundle_UserSession] effective_group must be of type String."
+        if effective_group_id is not _MISSING:
+            assert (type(effective_group_id) is str or isinstance(effective_group_id, str)),\
+            "[propbundle_UserSession] effective_group_id must be of type String."
+        if effective_user_ref is not _MISSING:
+            _check_instance_of(effective_user_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_UserSession] effective_user_ref must be of type Trace.")
+        if login_time is not _MISSING:
+            assert (type(login_time) is _datetime or isinstance(login_time, _datetime)),\
+            "[propbundle_UserSession] login_time must be of type Datetime."
+        if logout_time is not _MISSING:
+            assert (type(logout_time) is _datetime or isinstance(logout_time, _datetime)),\
+            "[propbundle_UserSession] logout_time must be of type Datetime."
 
-    return uco_object.create_PropertyBundle('UserSession', EffectiveGroup=effective_group,
-                                            EffectiveGroupID=effective_group_id, EffectiveUserRef=effective_user_ref,
-                                            LoginTime=login_time, LogoutTime=logout_time)
+    properties = _present(EffectiveGroup=effective_group, EffectiveGroupID=effective_group_id,
+                          EffectiveUserRef=effective_user_ref, LoginTime=login_time, LogoutTime=logout_time)
+    return uco_object.create_PropertyBundle('UserSession', **properties)
 
 
-def propbundle_Volume(uco_object, volume_id=Missing(), sector_size=Missing()):
+def propbundle_Volume(uco_object, volume_id=_MISSING, sector_size=_MISSING):
     '''
     :param VolumeID: At most one value of type String.
     :param SectorSize: At most one value of type Long.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(volume_id, Missing):
-        assert isinstance(volume_id, str),\
-        "[propbundle_Volume] volume_id must be of type String."
-    if not isinstance(sector_size, Missing):
-        assert isinstance(sector_size, str),\
-        "[propbundle_Volume] sector_size must be of type String."
+    if _VALIDATE:
+        if volume_id is not _MISSING:
+            assert (type(volume_id) is str or isinstance(volume_id, str)),\
+            "[propbundle_Volume] volume_id must be of type String."
+        if sector_size is not _MISSING:
+            assert (type(sector_size) is str or isinstance(sector_size, str)),\
+            "[propbundle_Volume] sector_size must be of type String."
 
-    return uco_object.create_PropertyBundle('Volume', VolumeID=volume_id, SectorSize=sector_size)
+    properties = _present(VolumeID=volume_id, SectorSize=sector_size)
+    return uco_object.create_PropertyBundle('Volume', **properties)
 
 
-def propbundle_WhoIs(uco_object, lookup_date=Missing(), domain_name_ref=Missing(), domain_id=Missing(),
-                     server_name_ref=Missing(), ip_address_ref=Missing(), name_server_refs=Missing(),
-                     updated_date=Missing(), creation_date=Missing(), expiration_date=Missing(),
-                     sponsoring_registrar=Missing(), registrar_info=Missing(), registrant_ids=Missing(),
-                     contact_info=Missing(), remarks=Missing()):
+def propbundle_WhoIs(uco_object, lookup_date=_MISSING, domain_name_ref=_MISSING, domain_id=_MISSING,
+                     server_name_ref=_MISSING, ip_address_ref=_MISSING, name_server_refs=_MISSING,
+                     updated_date=_MISSING, creation_date=_MISSING, expiration_date=_MISSING,
+                     sponsoring_registrar=_MISSING, registrar_info=_MISSING, registrant_ids=_MISSING,
+                     contact_info=_MISSING, remarks=_MISSING):
     '''
     :param LookupDate: At most one value of type Datetime.
     :param DomainNameRef: At most one occurrence of type Trace.
@@ -3191,110 +3231,101 @@ def propbundle_WhoIs(uco_object, lookup_date=Missing(), domain_name_ref=Missing(
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(lookup_date, Missing):
-        assert isinstance(lookup_date, datetime.datetime),\
-        "[propbundle_WhoIs] lookup_date must be of type Datetime."
-    if not isinstance(domain_name_ref, Missing):
-        assert (isinstance(domain_name_ref, case.CoreObject) and (domain_name_ref.type=='Trace')),\
-        "[propbundle_WhoIs] domain_name_ref must be of type Trace."
-    if not isinstance(domain_id, Missing):
-        assert isinstance(domain_id, str),\
-        "[propbundle_WhoIs] domain_id must be of type String."
-    if not isinstance(server_name_ref, Missing):
-        assert (isinstance(server_name_ref, case.CoreObject) and (server_name_ref.type=='Trace')),\
-        "[propbundle_WhoIs] server_name_ref must be of type Trace."
-    if not isinstance(ip_address_ref, Missing):
-        assert (isinstance(ip_address_ref, case.CoreObject) and (ip_address_ref.type=='Trace')),\
-        "[propbundle_WhoIs] ip_address_ref must be of type Trace."
-    if not isinstance(name_server_refs, Missing):
-        assert isinstance(name_server_refs, list),\
-        "[propbundle_WhoIs] name_server_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in name_server_refs),\
-        "[propbundle_WhoIs] name_server_refs must be of type List of Trace."
-    if not isinstance(updated_date, Missing):
-        assert isinstance(updated_date, datetime.datetime),\
-        "[propbundle_WhoIs] updated_date must be of type Datetime."
-    if not isinstance(creation_date, Missing):
-        assert isinstance(creation_date, datetime.datetime),\
-        "[propbundle_WhoIs] creation_date must be of type Datetime."
-    if not isinstance(expiration_date, Missing):
-        assert isinstance(expiration_date, datetime.datetime),\
-        "[propbundle_WhoIs] expiration_date must be of type Datetime."
-    if not isinstance(sponsoring_registrar, Missing):
-        assert isinstance(sponsoring_registrar, str),\
-        "[propbundle_WhoIs] sponsoring_registrar must be of type String."
-    if not isinstance(registrar_info, Missing):
-        assert (isinstance(registrar_info, case.DuckObject) and (registrar_info.type=='WhoIsRegistrarInfoType')),\
-        "[propbundle_WhoIs] registrar_info must be of type WhoIsRegistrarInfoType."
-    if not isinstance(registrant_ids, Missing):
-        assert isinstance(registrant_ids, list),\
-        "[propbundle_WhoIs] registrant_ids must be of type List of String."
-        assert all(isinstance(i, str) for i in registrant_ids),\
-        "[propbundle_WhoIs] registrant_ids must be of type List of String."
-    if not isinstance(contact_info, Missing):
-        assert isinstance(contact_info, list),\
-        "[propbundle_WhoIs] contact_info must be of type List of WhoIsContactType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='WhoIsContactType') for i in contact_info),\
-        "[propbundle_WhoIs] contact_info must be of type List of WhoIsContactType."
-    if not isinstance(remarks, Missing):
-        assert isinstance(remarks, str),\
-        "[propbundle_WhoIs] remarks must be of type String."
-
-    return uco_object.create_PropertyBundle('WhoIs', LookupDate=lookup_date, DomainNameRef=domain_name_ref,
-                                            DomainID=domain_id, ServerNameRef=server_name_ref,
-                                            IPAddressRef=ip_address_ref, NameServerRefs=name_server_refs,
-                                            UpdatedDate=updated_date, CreationDate=creation_date,
-                                            ExpirationDate=expiration_date, SponsoringRegistrar=sponsoring_registrar,
-                                            RegistrarInfo=registrar_info, RegistrantIDs=registrant_ids,
-                                            ContactInfo=contact_info, Remarks=remarks)
-
-
-def propbundle_WindowsAccount(uco_object, groups=Missing()):
+    if _VALIDATE:
+        if lookup_date is not _MISSING:
+            assert (type(lookup_date) is _datetime or isinstance(lookup_date, _datetime)),\
+            "[propbundle_WhoIs] lookup_date must be of type Datetime."
+        if domain_name_ref is not _MISSING:
+            _check_instance_of(domain_name_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WhoIs] domain_name_ref must be of type Trace.")
+        if domain_id is not _MISSING:
+            assert (type(domain_id) is str or isinstance(domain_id, str)),\
+            "[propbundle_WhoIs] domain_id must be of type String."
+        if server_name_ref is not _MISSING:
+            _check_instance_of(server_name_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WhoIs] server_name_ref must be of type Trace.")
+        if ip_address_ref is not _MISSING:
+            _check_instance_of(ip_address_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WhoIs] ip_address_ref must be of type Trace.")
+        if name_server_refs is not _MISSING:
+            _check_list_of(name_server_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_WhoIs] name_server_refs must be of type List of Trace.")
+        if updated_date is not _MISSING:
+            assert (type(updated_date) is _datetime or isinstance(updated_date, _datetime)),\
+            "[propbundle_WhoIs] updated_date must be of type Datetime."
+        if creation_date is not _MISSING:
+            assert (type(creation_date) is _datetime or isinstance(creation_date, _datetime)),\
+            "[propbundle_WhoIs] creation_date must be of type Datetime."
+        if expiration_date is not _MISSING:
+            assert (type(expiration_date) is _datetime or isinstance(expiration_date, _datetime)),\
+            "[propbundle_WhoIs] expiration_date must be of type Datetime."
+        if sponsoring_registrar is not _MISSING:
+            assert (type(sponsoring_registrar) is str or isinstance(sponsoring_registrar, str)),\
+            "[propbundle_WhoIs] sponsoring_registrar must be of type String."
+        if registrar_info is not _MISSING:
+            _check_instance_of(registrar_info, _DuckObject, _TAG_WHO_IS_REGISTRAR_INFO_TYPE,
+                               "[propbundle_WhoIs] registrar_info must be of type WhoIsRegistrarInfoType.")
+        if registrant_ids is not _MISSING:
+            _check_list_of(registrant_ids, str, None,
+                           "[propbundle_WhoIs] registrant_ids must be of type List of String.")
+        if contact_info is not _MISSING:
+            _check_list_of(contact_info, _DuckObject, _TAG_WHO_IS_CONTACT_TYPE,
+                           "[propbundle_WhoIs] contact_info must be of type List of WhoIsContactType.")
+        if remarks is not _MISSING:
+            assert (type(remarks) is str or isinstance(remarks, str)),\
+            "[propbundle_WhoIs] remarks must be of type String."
+
+    properties = _present(LookupDate=lookup_date, DomainNameRef=domain_name_ref, DomainID=domain_id,
+                          ServerNameRef=server_name_ref, IPAddressRef=ip_address_ref, NameServerRefs=name_server_refs,
+                          UpdatedDate=updated_date, CreationDate=creation_date, ExpirationDate=expiration_date,
+                          SponsoringRegistrar=sponsoring_registrar, RegistrarInfo=registrar_info,
+                          RegistrantIDs=registrant_ids, ContactInfo=contact_info, Remarks=remarks)
+    return uco_object.create_PropertyBundle('WhoIs', **properties)
+
+
+def propbundle_WindowsAccount(uco_object, groups=_MISSING):
     '''
     :param Groups: At least one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(groups, Missing),\
-    "[propbundle_WindowsAccount] groups is required."
-    if not isinstance(groups, Missing):
-        assert isinstance(groups, list),\
-        "[propbundle_WindowsAccount] groups must be of type List of String."
-        assert all(isinstance(i, str) for i in groups),\
-        "[propbundle_WindowsAccount] groups must be of type List of String."
+    _require(groups, "[propbundle_WindowsAccount] groups is required.")
+
+    if _VALIDATE:
+        _check_list_of(groups, str, None,
+                       "[propbundle_WindowsAccount] groups must be of type List of String.")
 
-    return uco_object.create_PropertyBundle('WindowsAccount', Groups=groups)
+    properties = _present(Groups=groups)
+    return uco_object.create_PropertyBundle('WindowsAccount', **properties)
 
 
-def propbundle_WindowsActiveDirectoryAccount(uco_object, object_guid=Missing(), active_directory_groups=Missing()):
+def propbundle_WindowsActiveDirectoryAccount(uco_object, object_guid=_MISSING, active_directory_groups=_MISSING):
     '''
     :param ObjectGUID: Exactly one value of type String.
     :param ActiveDirectoryGroups: Any number of values of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(object_guid, Missing),\
-    "[propbundle_WindowsActiveDirectoryAccount] object_guid is required."
-    if not isinstance(object_guid, Missing):
-        assert isinstance(object_guid, str),\
+    _require(object_guid, "[propbundle_WindowsActiveDirectoryAccount] object_guid is required.")
+
+    if _VALIDATE:
+        assert (type(object_guid) is str or isinstance(object_guid, str)),\
         "[propbundle_WindowsActiveDirectoryAccount] object_guid must be of type String."
 
-    if not isinstance(active_directory_groups, Missing):
-        assert isinstance(active_directory_groups, list),\
-        "[propbundle_WindowsActiveDirectoryAccount] active_directory_groups must be of type List of String."
-        assert all(isinstance(i, str) for i in active_directory_groups),\
-        "[propbundle_WindowsActiveDirectoryAccount] active_directory_groups must be of type List of String."
+        if active_directory_groups is not _MISSING:
+            _check_list_of(active_directory_groups, str, None,
+                           "[propbundle_WindowsActiveDirectoryAccount] active_directory_groups must be of type List of String.")
 
-    return uco_object.create_PropertyBundle('WindowsActiveDirectoryAccount', ObjectGUID=object_guid,
-                                            ActiveDirectoryGroups=active_directory_groups)
+    properties = _present(ObjectGUID=object_guid, ActiveDirectoryGroups=active_directory_groups)
+    return uco_object.create_PropertyBundle('WindowsActiveDirectoryAccount', **properties)
 
 
-def propbundle_WindowsComputerSpecification(uco_object, domain=Missing(), global_flag_list=Missing(),
-                                            net_bios_name=Missing(), ms_product_id=Missing(),
-                                            ms_product_name=Missing(), registered_organization_ref=Missing(),
-                                            registered_owner_ref=Missing(), windows_directory_ref=Missing(),
-                                            windows_system_directory_ref=Missing(),
-                                            windows_temp_directory_ref=Missing()):
+def propbundle_WindowsComputerSpecification(uco_object, domain=_MISSING, global_flag_list=_MISSING,
+                                            net_bios_name=_MISSING, ms_product_id=_MISSING,
+                                            ms_product_name=_MISSING, registered_organization_ref=_MISSING,
+                                            registered_owner_ref=_MISSING, windows_directory_ref=_MISSING,
+                                            windows_system_directory_ref=_MISSING,
+                                            windows_temp_directory_ref=_MISSING):
     '''
     :param Domain: Any number of values of type String.
     :param GlobalFlagList: Any number of occurrences of type GlobalFlagType.
@@ -3309,53 +3340,49 @@ def propbundle_WindowsComputerSpecification(uco_object, domain=Missing(), global
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(domain, Missing):
-        assert isinstance(domain, list),\
-        "[propbundle_WindowsComputerSpecification] domain must be of type List of String."
-        assert all(isinstance(i, str) for i in domain),\
-        "[propbundle_WindowsComputerSpecification] domain must be of type List of String."
-    if not isinstance(global_flag_list, Missing):
-        assert isinstance(global_flag_list, list),\
-        "[propbundle_WindowsComputerSpecification] global_flag_list must be of type List of GlobalFlagType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='GlobalFlagType') for i in global_flag_list),\
-        "[propbundle_WindowsComputerSpecification] global_flag_list must be of type List of GlobalFlagType."
-    if not isinstance(net_bios_name, Missing):
-        assert isinstance(net_bios_name, str),\
-        "[propbundle_WindowsComputerSpecification] net_bios_name must be of type String."
-    if not isinstance(ms_product_id, Missing):
-        assert isinstance(ms_product_id, str),\
-        "[propbundle_WindowsComputerSpecification] ms_product_id must be of type String."
-    if not isinstance(ms_product_name, Missing):
-        assert isinstance(ms_product_name, str),\
-        "[propbundle_WindowsComputerSpecification] ms_product_name must be of type String."
-    if not isinstance(registered_organization_ref, Missing):
-        assert (isinstance(registered_organization_ref, case.CoreObject) and (registered_organization_ref.type=='Identity (core)')),\
-        "[propbundle_WindowsComputerSpecification] registered_organization_ref must be of type Identity (core)."
-    if not isinstance(windows_directory_ref, Missing):
-        assert (isinstance(windows_directory_ref, case.CoreObject) and (windows_directory_ref.type=='Trace')),\
-        "[propbundle_WindowsComputerSpecification] windows_directory_ref must be of type Trace."
-    if not isinstance(windows_system_directory_ref, Missing):
-        assert (isinstance(windows_system_directory_ref, case.CoreObject) and (windows_system_directory_ref.type=='Trace')),\
-        "[propbundle_WindowsComputerSpecification] windows_system_directory_ref must be of type Trace."
-    if not isinstance(windows_temp_directory_ref, Missing):
-        assert (isinstance(windows_temp_directory_ref, case.CoreObject) and (windows_temp_directory_ref.type=='Trace')),\
-        "[propbundle_WindowsComputerSpecification] windows_temp_directory_ref must be of type Trace."
-        
-    return uco_object.create_PropertyBundle('WindowsComputerSpecification', Domain=domain,
-                                            GlobalFlagList=global_flag_list, NetBIOSName=net_bios_name,
-                                            MsProductID=ms_product_id, MsProductName=ms_product_name,
-                                            RegisteredOrganizationRef=registered_organization_ref,
-                                            RegisteredOwnerRef=registered_owner_ref,
-                                            WindowsDirectoryRef=windows_directory_ref,
-                                            WindowsSystemDirectoryRef=windows_system_directory_ref,
-                                            WindowsTempDirectoryRef=windows_temp_directory_ref)
-
-
-def propbundle_WindowsPEBinaryFile(uco_object, machine=Missing(), pe_type=Missing(), imp_hash=Missing(),
-                                   number_of_sections=Missing(), datetime_stamp=Missing(),
-                                   pointer_to_symbol_table=Missing(), size_of_optional_header=Missing(),
-                                   characteristics=Missing(), file_header_hashes=Missing(),
-                                   optional_header=Missing(), sections=Missing()):
+    if _VALIDATE:
+        if domain is not _MISSING:
+            _check_list_of(domain, str, None,
+                           "[propbundle_WindowsComputerSpecification] domain must be of type List of String.")
+        if global_flag_list is not _MISSING:
+            _check_list_of(global_flag_list, _DuckObject, _TAG_GLOBAL_FLAG_TYPE,
+                           "[propbundle_WindowsComputerSpecification] global_flag_list must be of type List of GlobalFlagType.")
+        if net_bios_name is not _MISSING:
+            assert (type(net_bios_name) is str or isinstance(net_bios_name, str)),\
+            "[propbundle_WindowsComputerSpecification] net_bios_name must be of type String."
+        if ms_product_id is not _MISSING:
+            assert (type(ms_product_id) is str or isinstance(ms_product_id, str)),\
+            "[propbundle_WindowsComputerSpecification] ms_product_id must be of type String."
+        if ms_product_name is not _MISSING:
+            assert (type(ms_product_name) is str or isinstance(ms_product_name, str)),\
+            "[propbundle_WindowsComputerSpecification] ms_product_name must be of type String."
+        if registered_organization_ref is not _MISSING:
+            _check_instance_of(registered_organization_ref, _CoreObject, _TAG_IDENTITY,
+                               "[propbundle_WindowsComputerSpecification] registered_organization_ref must be of type Identity (core).")
+        if windows_directory_ref is not _MISSING:
+            _check_instance_of(windows_directory_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsComputerSpecification] windows_directory_ref must be of type Trace.")
+        if windows_system_directory_ref is not _MISSING:
+            _check_instance_of(windows_system_directory_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsComputerSpecification] windows_system_directory_ref must be of type Trace.")
+        if windows_temp_directory_ref is not _MISSING:
+            _check_instance_of(windows_temp_directory_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsComputerSpecification] windows_temp_directory_ref must be of type Trace.")
+
+    properties = _present(Domain=domain, GlobalFlagList=global_flag_list, NetBIOSName=net_bios_name,
+                          MsProductID=ms_product_id, MsProductName=ms_product_name,
+                          RegisteredOrganizationRef=registered_organization_ref,
+                          RegisteredOwnerRef=registered_owner_ref, WindowsDirectoryRef=windows_directory_ref,
+                          WindowsSystemDirectoryRef=windows_system_directory_ref,
+                          WindowsTempDirectoryRef=windows_temp_directory_ref)
+    return uco_object.create_PropertyBundle('WindowsComputerSpecification', **properties)
+
+
+def propbundle_WindowsPEBinaryFile(uco_object, machine=_MISSING, pe_type=_MISSING, imp_hash=_MISSING,
+                                   number_of_sections=_MISSING, datetime_stamp=_MISSING,
+                                   pointer_to_symbol_table=_MISSING, size_of_optional_header=_MISSING,
+                                   characteristics=_MISSING, file_header_hashes=_MISSING,
+                                   optional_header=_MISSING, sections=_MISSING):
     '''
     :param Machine: Exactly one value of type HexBinary.
     :param PEType: At most one occurrence of type Controlled Vocabulary.
@@ -3372,58 +3399,53 @@ def propbundle_WindowsPEBinaryFile(uco_object, machine=Missing(), pe_type=Missin
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(machine, Missing),\
-    "[propbundle_WindowsPEBinaryFile] machine is required."
-    #TODO:HexBinary
-
-    if not isinstance(pe_type, Missing):
-        assert (isinstance(pe_type, case.CoreObject) and (pe_type.type=='ControlledVocabulary')),\
-        "[propbundle_WindowsPEBinaryFile] pe_type must be of type ControlledVocabulary."
-    if not isinstance(imp_hash, Missing):
-        assert isinstance(imp_hash, str),\
-        "[propbundle_WindowsPEBinaryFile] imp_hash must be of type String."
-    if not isinstance(number_of_sections, Missing):
-        assert isinstance(number_of_sections, int),\
-        "[propbundle_WindowsPEBinaryFile] number_of_sections must be of type Integer."
-    if not isinstance(datetime_stamp, Missing):
-        assert isinstance(datetime_stamp, datetime.datetime),\
-        "[propbundle_WindowsPEBinaryFile] datetime_stamp must be of type Datetime."
-    #TODO:HexBinary
-    if not isinstance(pointer_to_symbol_table, Missing):
-        assert isinstance(pointer_to_symbol_table, int),\
-        "[propbundle_WindowsPEBinaryFile] number_of_symbols must be of type Integer."
-    if not isinstance(size_of_optional_header, Missing):
-        assert isinstance(size_of_optional_header, int),\
-        "[propbundle_WindowsPEBinaryFile] size_of_optional_header must be of type Integer."
-    #TODO:HexBinary
-    if not isinstance(file_header_hashes, Missing):
-        assert isinstance(file_header_hashes, list),\
-        "[propbundle_WindowsPEBinaryFile] file_header_hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in file_header_hashes),\
-        "[propbundle_WindowsPEBinaryFile] file_header_hashes must be of type List of Hash."
-    if not isinstance(optional_header, Missing):
-        assert (isinstance(optional_header, case.DuckObject) and (optional_header.type=='WindowsPEOptionalHeader')),\
-        "[propbundle_WindowsPEBinaryFile] pe_type must be of type WindowsPEOptionalHeader."
-    if not isinstance(sections, Missing):
-        assert isinstance(sections, list),\
-        "[propbundle_WindowsPEBinaryFile] sections must be of type List of WindowsPESection."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='WindowsPESection') for i in sections),\
-        "[propbundle_WindowsPEBinaryFile] sections must be of type List of WindowsPESection."
-
-    return uco_object.create_PropertyBundle('WindowsPEBinaryFile', Machine=machine, PEType=pe_type,
-                                            ImpHash=imp_hash, NumberOfSections=number_of_sections,
-                                            DatetimeStamp=datetime_stamp, PointerToSymbolTable=pointer_to_symbol_table,
-                                            NumberOfSymbols=pointer_to_symbol_table,
-                                            SizeOfOptionalHeader=size_of_optional_header,
-                                            Characteristics=characteristics,
-                                            FileHeaderHashes=file_header_hashes, OptionalHeader=optional_header,
-                                            Sections=sections)
-
-
-def propbundle_WindowsPrefetch(uco_object, application_file_name=Missing(), prefetch_hash=Missing(),
-                               times_executed=Missing(), first_run=Missing(), last_run=Missing(),
-                               volume_ref=Missing(), accessed_file_refs=Missing(),
-                               accessed_directory_refs=Missing()):
+    _require(machine, "[propbundle_WindowsPEBinaryFile] machine is required.")
+
+    if _VALIDATE:
+        #TODO:HexBinary
+
+        if pe_type is not _MISSING:
+            _check_instance_of(pe_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_WindowsPEBinaryFile] pe_type must be of type ControlledVocabulary.")
+        if imp_hash is not _MISSING:
+            assert (type(imp_hash) is str or isinstance(imp_hash, str)),\
+            "[propbundle_WindowsPEBinaryFile] imp_hash must be of type String."
+        if number_of_sections is not _MISSING:
+            assert _is_integer(number_of_sections),\
+            "[propbundle_WindowsPEBinaryFile] number_of_sections must be of type Integer."
+        if datetime_stamp is not _MISSING:
+            assert (type(datetime_stamp) is _datetime or isinstance(datetime_stamp, _datetime)),\
+            "[propbundle_WindowsPEBinaryFile] datetime_stamp must be of type Datetime."
+        #TODO:HexBinary
+        if pointer_to_symbol_table is not _MISSING:
+            assert _is_integer(pointer_to_symbol_table),\
+            "[propbundle_WindowsPEBinaryFile] number_of_symbols must be of type Integer."
+        if size_of_optional_header is not _MISSING:
+            assert _is_integer(size_of_optional_header),\
+            "[propbundle_WindowsPEBinaryFile] size_of_optional_header must be of type Integer."
+        #TODO:HexBinary
+        if file_header_hashes is not _MISSING:
+            _check_list_of(file_header_hashes, _DuckObject, _TAG_HASH,
+                           "[propbundle_WindowsPEBinaryFile] file_header_hashes must be of type List of Hash.")
+        if optional_header is not _MISSING:
+            _check_instance_of(optional_header, _DuckObject, _TAG_WINDOWS_PE_OPTIONAL_HEADER,
+                               "[propbundle_WindowsPEBinaryFile] pe_type must be of type WindowsPEOptionalHeader.")
+        if sections is not _MISSING:
+            _check_list_of(sections, _DuckObject, _TAG_WINDOWS_PE_SECTION,
+                           "[propbundle_WindowsPEBinaryFile] sections must be of type List of WindowsPESection.")
+
+    properties = _present(Machine=machine, PEType=pe_type, ImpHash=imp_hash, NumberOfSections=number_of_sections,
+                          DatetimeStamp=datetime_stamp, PointerToSymbolTable=pointer_to_symbol_table,
+                          NumberOfSymbols=pointer_to_symbol_table, SizeOfOptionalHeader=size_of_optional_header,
+                          Characteristics=characteristics, FileHeaderHashes=file_header_hashes,
+                          OptionalHeader=optional_header, Sections=sections)
+    return uco_object.create_PropertyBundle('WindowsPEBinaryFile', **properties)
+
+
+def propbundle_WindowsPrefetch(uco_object, application_file_name=_MISSING, prefetch_hash=_MISSING,
+                               times_executed=_MISSING, first_run=_MISSING, last_run=_MISSING,
+                               volume_ref=_MISSING, accessed_file_refs=_MISSING,
+                               accessed_directory_refs=_MISSING):
     '''
     :param ApplicationFileName: At most one value of type String.
     :param PrefetchHash: At most one value of type String.
@@ -3436,44 +3458,40 @@ def propbundle_WindowsPrefetch(uco_object, application_file_name=Missing(), pref
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(application_file_name, Missing):
-        assert isinstance(application_file_name, str),\
-        "[propbundle_WindowsPrefetch] application_file_name must be of type String."
-    if not isinstance(prefetch_hash, Missing):
-        assert isinstance(prefetch_hash, str),\
-        "[propbundle_WindowsPrefetch] prefetch_hash must be of type String."
-    if not isinstance(times_executed, Missing):
-        assert isinstance(times_executed, long),\
-        "[propbundle_WindowsPrefetch] times_executed must be of type Long."
-    if not isinstance(first_run, Missing):
-        assert isinstance(first_run, long),\
-        "[propbundle_WindowsPrefetch] first_run must be of type Datetime."
-    if not isinstance(last_run, Missing):
-        assert isinstance(last_run, datetime.datetime),\
-        "[propbundle_WindowsPrefetch] last_run must be of type Datetime."
-    if not isinstance(volume_ref, Missing):
-        assert (isinstance(volume_ref, case.CoreObject) and (volume_ref.type=='Trace')),\
-        "[propbundle_WindowsPrefetch] volume_ref must be of type Trace."
-    if not isinstance(accessed_file_refs, Missing):
-        assert isinstance(accessed_file_refs, list),\
-        "[propbundle_WindowsPrefetch] accessed_file_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in accessed_file_refs),\
-        "[propbundle_WindowsPrefetch] accessed_file_refs must be of type List of Trace."
-    if not isinstance(accessed_directory_refs, Missing):
-        assert isinstance(accessed_directory_refs, list),\
-        "[propbundle_WindowsPrefetch] accessed_directory_refs must be of type List of Trace."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='Trace') for i in accessed_directory_refs),\
-        "[propbundle_WindowsPrefetch] accessed_directory_refs must be of type List of Trace."
-
-    return uco_object.create_PropertyBundle('WindowsPrefetch', ApplicationFileName=application_file_name,
-                                            PrefetchHash=prefetch_hash, TimesExecuted=times_executed,
-                                            FirstRun=first_run, LastRun=last_run,
-                                            VolumeRef=volume_ref, AccessedFileRefs=accessed_file_refs,
-                                            AccessedDirectoryRefs=accessed_directory_refs)
-
-
-def propbundle_WindowsProcess(uco_object, aslr_enabled=Missing(), dep_enabled=Missing(), priority=Missing(),
-                              owner_sid=Missing(), window_title=Missing(), startup_info=Missing()):
+    if _VALIDATE:
+        if application_file_name is not _MISSING:
+            assert (type(application_file_name) is str or isinstance(application_file_name, str)),\
+            "[propbundle_WindowsPrefetch] application_file_name must be of type String."
+        if prefetch_hash is not _MISSING:
+            assert (type(prefetch_hash) is str or isinstance(prefetch_hash, str)),\
+            "[propbundle_WindowsPrefetch] prefetch_hash must be of type String."
+        if times_executed is not _MISSING:
+            assert _is_integer(times_executed),\
+            "[propbundle_WindowsPrefetch] times_executed must be of type Long."
+        if first_run is not _MISSING:
+            assert _is_integer(first_run),\
+            "[propbundle_WindowsPrefetch] first_run must be of type Datetime."
+        if last_run is not _MISSING:
+            assert (type(last_run) is _datetime or isinstance(last_run, _datetime)),\
+            "[propbundle_WindowsPrefetch] last_run must be of type Datetime."
+        if volume_ref is not _MISSING:
+            _check_instance_of(volume_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsPrefetch] volume_ref must be of type Trace.")
+        if accessed_file_refs is not _MISSING:
+            _check_list_of(accessed_file_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_WindowsPrefetch] accessed_file_refs must be of type List of Trace.")
+        if accessed_directory_refs is not _MISSING:
+            _check_list_of(accessed_directory_refs, _CoreObject, _TAG_TRACE,
+                           "[propbundle_WindowsPrefetch] accessed_directory_refs must be of type List of Trace.")
+
+    properties = _present(ApplicationFileName=application_file_name, PrefetchHash=prefetch_hash,
+                          TimesExecuted=times_executed, FirstRun=first_run, LastRun=last_run, VolumeRef=volume_ref,
+                          AccessedFileRefs=accessed_file_refs, AccessedDirectoryRefs=accessed_directory_refs)
+    return uco_object.create_PropertyBundle('WindowsPrefetch', **properties)
+
+
+def propbundle_WindowsProcess(uco_object, aslr_enabled=_MISSING, dep_enabled=_MISSING, priority=_MISSING,
+                              owner_sid=_MISSING, window_title=_MISSING, startup_info=_MISSING):
     '''
     :param ASLREnabled: At most one value of type Bool.
     :param DEPEnabled: At most one value of type Bool.
@@ -3484,47 +3502,49 @@ def propbundle_WindowsProcess(uco_object, aslr_enabled=Missing(), dep_enabled=Mi
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(aslr_enabled, Missing):
-        assert isinstance(aslr_enabled, bool),\
-        "[propbundle_WindowsProcess] aslr_enabled must be of type Bool."
-    if not isinstance(dep_enabled, Missing):
-        assert isinstance(dep_enabled, bool),\
-        "[propbundle_WindowsProcess] dep_enabled must be of type Bool."
-    if not isinstance(priority, Missing):
-        assert isinstance(priority, str),\
-        "[propbundle_WindowsProcess] priority must be of type String."
-    if not isinstance(owner_sid, Missing):
-        assert isinstance(owner_sid, str),\
-        "[propbundle_WindowsProcess] priority must be of type String."
-    if not isinstance(window_title, Missing):
-        assert isinstance(window_title, str),\
-        "[propbundle_WindowsProcess] window_title must be of type String."
-    if not isinstance(startup_info, Missing):
-        assert (isinstance(startup_info, case.DuckObject) and (startup_info.type=='Dictionary')),\
-        "[propbundle_WindowsProcess] startup_info must be of type Dictionary."
-
-    return uco_object.create_PropertyBundle('WindowsProcess', ASLREnabled=aslr_enabled, DEPEnabled=dep_enabled,
-                                            Priority=priority, OwnerSID=owner_sid, WindowTitle=window_title,
-                                            StartupInfo=startup_info)
-
-
-def propbundle_WindowsRegistryHive(uco_object, hive_type=Missing()):
+    if _VALIDATE:
+        if aslr_enabled is not _MISSING:
+            assert type(aslr_enabled) is bool,\
+            "[propbundle_WindowsProcess] aslr_enabled must be of type Bool."
+        if dep_enabled is not _MISSING:
+            assert type(dep_enabled) is bool,\
+            "[propbundle_WindowsProcess] dep_enabled must be of type Bool."
+        if priority is not _MISSING:
+            assert (type(priority) is str or isinstance(priority, str)),\
+            "[propbundle_WindowsProcess] priority must be of type String."
+        if owner_sid is not _MISSING:
+            assert (type(owner_sid) is str or isinstance(owner_sid, str)),\
+            "[propbundle_WindowsProcess] priority must be of type String."
+        if window_title is not _MISSING:
+            assert (type(window_title) is str or isinstance(window_title, str)),\
+            "[propbundle_WindowsProcess] window_title must be of type String."
+        if startup_info is not _MISSING:
+            _check_instance_of(startup_info, _DuckObject, _TAG_DICTIONARY,
+                               "[propbundle_WindowsProcess] startup_info must be of type Dictionary.")
+
+    properties = _present(ASLREnabled=aslr_enabled, DEPEnabled=dep_enabled, Priority=priority, OwnerSID=owner_sid,
+                          WindowTitle=window_title, StartupInfo=startup_info)
+    return uco_object.create_PropertyBundle('WindowsProcess', **properties)
+
+
+def propbundle_WindowsRegistryHive(uco_object, hive_type=_MISSING):
     '''
     :param HiveType: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(hive_type, Missing),\
-    "[propbundle_WindowsRegistryHive] hive_type is required."
-    if not isinstance(hive_type, Missing):
-        assert isinstance(hive_type, str),\
+    _require(hive_type, "[propbundle_WindowsRegistryHive] hive_type is required.")
+
+    if _VALIDATE:
+        assert (type(hive_type) is str or isinstance(hive_type, str)),\
         "[propbundle_WindowsRegistryHive] hive_type must be of type String."
 
-    return uco_object.create_PropertyBundle('WindowsRegistryHive', HiveType=hive_type)
+    properties = _present(HiveType=hive_type)
+    return uco_object.create_PropertyBundle('WindowsRegistryHive', **properties)
 
 
-def propbundle_WindowsRegistryKey(uco_object, key=Missing(), values=Missing(), modified_time=Missing(),
-                                  creator_ref=Missing(), number_of_subkeys=Missing()):
+def propbundle_WindowsRegistryKey(uco_object, key=_MISSING, values=_MISSING, modified_time=_MISSING,
+                                  creator_ref=_MISSING, number_of_subkeys=_MISSING):
     '''
     :param Key: Exactly one value of type String.
     :param Values: Any number of occurrences of type WindowsRegistryHive.
@@ -3534,34 +3554,33 @@ def propbundle_WindowsRegistryKey(uco_object, key=Missing(), values=Missing(), m
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(key, Missing),\
-    "[propbundle_WindowsRegistryKey] key is required."
-    if not isinstance(key, Missing):
-        assert isinstance(key, str),\
+    _require(key, "[propbundle_WindowsRegistryKey] key is required.")
+
+    if _VALIDATE:
+        assert (type(key) is str or isinstance(key, str)),\
         "[propbundle_WindowsRegistryKey] key must be of type String."
 
-    if not isinstance(values, Missing):
-        assert isinstance(values, list),\
-        "[propbundle_WindowsRegistryKey] values must be of type List of WindowsRegistryHive."
-        assert all( (isinstance(i, case.PropertyBundle) and i.type=='WindowsRegistryHive') for i in values),\
-        "[propbundle_WindowsRegistryKey] values must be of type List of WindowsRegistryHive."
-    if not isinstance(modified_time, Missing):
-        assert isinstance(modified_time, datetime.datetime),\
-        "[propbundle_WindowsRegistryKey] modified_time must be of type Datetime."
-    if not isinstance(creator_ref, Missing):
-        assert (isinstance(creator_ref, case.CoreObject) and (creator_ref.type=='Trace')),\
-        "[propbundle_WindowsRegistryKey] creator_ref must be of type Trace."
-    if not isinstance(number_of_subkeys, Missing):
-        assert isinstance(number_of_subkeys, int),\
-        "[propbundle_WindowsRegistryKey] number_of_subkeys must be of type Integer."
-
-    return uco_object.create_PropertyBundle('WindowsRegistryKey', Key=key, Values=values, ModifiedTime=modified_time,
-                                            CreatorRef=creator_ref, NumberOfSubkeys=number_of_subkeys)
-
-
-def propbundle_WindowsService(uco_object, service_name=Missing(), descriptions=Missing(), display_name=Missing(),
-                              group_name=Missing(), start_command_line=Missing(), start_type=Missing(),
-                              service_type=Missing(), service_status=Missing()):
+        if values is not _MISSING:
+            _check_list_of(values, _PropertyBundle, _TAG_WINDOWS_REGISTRY_HIVE,
+                           "[propbundle_WindowsRegistryKey] values must be of type List of WindowsRegistryHive.")
+        if modified_time is not _MISSING:
+            assert (type(modified_time) is _datetime or isinstance(modified_time, _datetime)),\
+            "[propbundle_WindowsRegistryKey] modified_time must be of type Datetime."
+        if creator_ref is not _MISSING:
+            _check_instance_of(creator_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsRegistryKey] creator_ref must be of type Trace.")
+        if number_of_subkeys is not _MISSING:
+            assert _is_integer(number_of_subkeys),\
+            "[propbundle_WindowsRegistryKey] number_of_subkeys must be of type Integer."
+
+    properties = _present(Key=key, Values=values, ModifiedTime=modified_time, CreatorRef=creator_ref,
+                          NumberOfSubkeys=number_of_subkeys)
+    return uco_object.create_PropertyBundle('WindowsRegistryKey', **properties)
+
+
+def propbundle_WindowsService(uco_object, service_name=_MISSING, descriptions=_MISSING, display_name=_MISSING,
+                              group_name=_MISSING, start_command_line=_MISSING, start_type=_MISSING,
+                              service_type=_MISSING, service_status=_MISSING):
     '''
     :param ServiceName: Exactly one value of type String.
     :param Descriptions: Any number of values of type String.
@@ -3574,48 +3593,46 @@ def propbundle_WindowsService(uco_object, service_name=Missing(), descriptions=M
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(service_name, Missing),\
-    "[propbundle_WindowsService] service_name is required."
-    if not isinstance(service_name, Missing):
-        assert isinstance(service_name, str),\
+    _require(service_name, "[propbundle_WindowsService] service_name is required.")
+
+    if _VALIDATE:
+        assert (type(service_name) is str or isinstance(service_name, str)),\
         "[propbundle_WindowsService] service_name must be of type String."
 
-    if not isinstance(descriptions, Missing):
-        assert isinstance(descriptions, list),\
-        "[propbundle_WindowsService] descriptions must be of type List of String."
-        assert all(isinstance(i, str) for i in descriptions),\
-        "[propbundle_WindowsService] descriptions must be of type List of String."
-    if not isinstance(display_name, Missing):
-        assert isinstance(display_name, str),\
-        "[propbundle_WindowsService] display_name must be of type String."
-    if not isinstance(group_name, Missing):
-        assert isinstance(group_name, str),\
-        "[propbundle_WindowsService] group_name must be of type String."
-    if not isinstance(start_command_line, Missing):
-        assert isinstance(start_command_line, str),\
-        "[propbundle_WindowsService] start_command_line must be of type String."
-    if not isinstance(start_type, Missing):
-        assert (isinstance(start_type, case.CoreObject) and (start_type.type=='ControlledVocabulary')),\
-        "[propbundle_WindowsTask] start_type must be of type ControlledVocabulary."
-    if not isinstance(service_type, Missing):
-        assert (isinstance(service_type, case.CoreObject) and (service_type.type=='ControlledVocabulary')),\
-        "[propbundle_WindowsTask] service_type must be of type ControlledVocabulary."
-    if not isinstance(service_status, Missing):
-        assert (isinstance(service_status, case.CoreObject) and (service_status.type=='ControlledVocabulary')),\
-        "[propbundle_WindowsTask] service_status must be of type ControlledVocabulary."
-
-    return uco_object.create_PropertyBundle('WindowsService', ServiceName=service_name, Descriptions=descriptions,
-                                            DisplayName=display_name, GroupName=group_name,
-                                            StartCommandLine=start_command_line, StartType=start_type,
-                                            ServiceType=service_type, ServiceStatus=service_status)
-
-
-def propbundle_WindowsTask(uco_object, image_name=Missing(), application_ref=Missing(), parameters=Missing(),
-                           account_ref=Missing(), account_run_level=Missing(), account_logon_type=Missing(),
-                           creator=Missing(), created_time=Missing(), most_recent_run_time=Missing(),
-                           exit_code=Missing(), max_run_time=Missing(), next_run_time=Missing(),
-                           action_list=Missing(), trigger_list=Missing(), comment=Missing(),
-                           working_directory=Missing(), work_item_data_ref=Missing()):
+        if descriptions is not _MISSING:
+            _check_list_of(descriptions, str, None,
+                           "[propbundle_WindowsService] descriptions must be of type List of String.")
+        if display_name is not _MISSING:
+            assert (type(display_name) is str or isinstance(display_name, str)),\
+            "[propbundle_WindowsService] display_name must be of type String."
+        if group_name is not _MISSING:
+            assert (type(group_name) is str or isinstance(group_name, str)),\
+            "[propbundle_WindowsService] group_name must be of type String."
+        if start_command_line is not _MISSING:
+            assert (type(start_command_line) is str or isinstance(start_command_line, str)),\
+            "[propbundle_WindowsService] start_command_line must be of type String."
+        if start_type is not _MISSING:
+            _check_instance_of(start_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_WindowsTask] start_type must be of type ControlledVocabulary.")
+        if service_type is not _MISSING:
+            _check_instance_of(service_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_WindowsTask] service_type must be of type ControlledVocabulary.")
+        if service_status is not _MISSING:
+            _check_instance_of(service_status, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_WindowsTask] service_status must be of type ControlledVocabulary.")
+
+    properties = _present(ServiceName=service_name, Descriptions=descriptions, DisplayName=display_name,
+                          GroupName=group_name, StartCommandLine=start_command_line, StartType=start_type,
+                          ServiceType=service_type, ServiceStatus=service_status)
+    return uco_object.create_PropertyBundle('WindowsService', **properties)
+
+
+def propbundle_WindowsTask(uco_object, image_name=_MISSING, application_ref=_MISSING, parameters=_MISSING,
+                           account_ref=_MISSING, account_run_level=_MISSING, account_logon_type=_MISSING,
+                           creator=_MISSING, created_time=_MISSING, most_recent_run_time=_MISSING,
+                           exit_code=_MISSING, max_run_time=_MISSING, next_run_time=_MISSING,
+                           action_list=_MISSING, trigger_list=_MISSING, comment=_MISSING,
+                           working_directory=_MISSING, work_item_data_ref=_MISSING):
     '''
     :param ImageName: At most one value of type String.
     :param ApplicationRef: At most one occurrence of type Trace.
@@ -3637,76 +3654,72 @@ def propbundle_WindowsTask(uco_object, image_name=Missing(), application_ref=Mis
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(image_name, Missing):
-        assert isinstance(image_name, str),\
-        "[propbundle_WindowsTask] image_name must be of type String."
-    if not isinstance(application_ref, Missing):
-        assert (isinstance(application_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_WindowsTask] application_ref must be of type Trace."
-    if not isinstance(parameters, Missing):
-        assert isinstance(parameters, str),\
-        "[propbundle_WindowsTask] parameters must be of type String."
-    if not isinstance(account_ref, Missing):
-        assert (isinstance(account_ref, case.CoreObject) and (account_ref.type=='Trace')),\
-        "[propbundle_WindowsTask] account_ref must be of type Trace."
-    if not isinstance(account_run_level, Missing):
-        assert isinstance(account_run_level, str),\
-        "[propbundle_WindowsTask] account_run_level must be of type String."
-    if not isinstance(account_logon_type, Missing):
-        assert isinstance(account_logon_type, str),\
-        "[propbundle_WindowsTask] account_logon_type must be of type String."
-    if not isinstance(creator, Missing):
-        assert isinstance(creator, str),\
-        "[propbundle_WindowsTask] creator must be of type String."
-    if not isinstance(created_time, Missing):
-        assert isinstance(created_time, datetime.datetime),\
-        "[propbundle_WindowsTask] created_time must be of type Datetime."
-    if not isinstance(most_recent_run_time, Missing):
-        assert isinstance(most_recent_run_time, datetime.datetime),\
-        "[propbundle_WindowsTask] most_recent_run_time must be of type Datetime."
-    if not isinstance(exit_code, Missing):
-        assert isinstance(exit_code, long),\
-        "[propbundle_WindowsTask] exit_code must be of type Long."
-    if not isinstance(max_run_time, Missing):
-        assert isinstance(max_run_time, long),\
-        "[propbundle_WindowsTask] max_run_time must be of type Long."
-    if not isinstance(next_run_time, Missing):
-        assert isinstance(next_run_time, datetime.datetime),\
-        "[propbundle_WindowsTask] next_run_time must be of type Datetime."
-    if not isinstance(action_list, Missing):
-        assert isinstance(action_list, list),\
-        "[propbundle_WindowsTask] action_list must be of type List of TaskActionType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='TaskActionType') for i in action_list),\
-        "[propbundle_WindowsTask] action_list must be of type List of TaskActionType."
-    if not isinstance(trigger_list, Missing):
-        assert isinstance(trigger_list, list),\
-        "[propbundle_WindowsTask] trigger_list must be of type List of TriggerType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='TriggerType') for i in trigger_list),\
-        "[propbundle_WindowsTask] trigger_list must be of type List of TriggerType."
-    if not isinstance(comment, Missing):
-        assert isinstance(comment, str),\
-        "[propbundle_WindowsTask] comment must be of type String."
-    if not isinstance(working_directory, Missing):
-        assert (isinstance(working_directory, case.CoreObject) and (working_directory.type=='Trace')),\
-        "[propbundle_WindowsTask] working_directory must be of type Trace."
-    if not isinstance(work_item_data_ref, Missing):
-        assert (isinstance(work_item_data_ref, case.CoreObject) and (application_ref.type=='Trace')),\
-        "[propbundle_WindowsTask] work_item_data_ref must be of type Trace."
-
-    return uco_object.create_PropertyBundle('WindowsTask', ImageName=image_name, ApplicationRef=application_ref,
-                                            Parameters=parameters, AccountRef=account_ref,
-                                            AccountRunLevel=account_run_level,
-                                            AccountLogonType=account_logon_type, Creator=creator,
-                                            CreatedTime=created_time, MostRecentRunTime=most_recent_run_time,
-                                            ExitCode=exit_code, MaxRunTime=max_run_time, NextRunTime=next_run_time,
-                                            ActionList=action_list, TriggerList=trigger_list, Comment=comment,
-                                            WorkingDirectory=working_directory, WorkItemDataRef=work_item_data_ref)
-
-
-def propbundle_WindowsThread(uco_object, thread_id=Missing(), running_status=Missing(), context=Missing(),
-                             priority=Missing(), creation_flags=Missing(), creation_time=Missing(),
-                             start_address=Missing(), parameter_address=Missing(), security_attributes=Missing(),
-                             stack_size=Missing()):
+    if _VALIDATE:
+        if image_name is not _MISSING:
+            assert (type(image_name) is str or isinstance(image_name, str)),\
+            "[propbundle_WindowsTask] image_name must be of type String."
+        if application_ref is not _MISSING:
+            _check_instance_of(application_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsTask] application_ref must be of type Trace.")
+        if parameters is not _MISSING:
+            assert (type(parameters) is str or isinstance(parameters, str)),\
+            "[propbundle_WindowsTask] parameters must be of type String."
+        if account_ref is not _MISSING:
+            _check_instance_of(account_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsTask] account_ref must be of type Trace.")
+        if account_run_level is not _MISSING:
+            assert (type(account_run_level) is str or isinstance(account_run_level, str)),\
+            "[propbundle_WindowsTask] account_run_level must be of type String."
+        if account_logon_type is not _MISSING:
+            assert (type(account_logon_type) is str or isinstance(account_logon_type, str)),\
+            "[propbundle_WindowsTask] account_logon_type must be of type String."
+        if creator is not _MISSING:
+            assert (type(creator) is str or isinstance(creator, str)),\
+            "[propbundle_WindowsTask] creator must be of type String."
+        if created_time is not _MISSING:
+            assert (type(created_time) is _datetime or isinstance(created_time, _datetime)),\
+            "[propbundle_WindowsTask] created_time must be of type Datetime."
+        if most_recent_run_time is not _MISSING:
+            assert (type(most_recent_run_time) is _datetime or isinstance(most_recent_run_time, _datetime)),\
+            "[propbundle_WindowsTask] most_recent_run_time must be of type Datetime."
+        if exit_code is not _MISSING:
+            assert _is_integer(exit_code),\
+            "[propbundle_WindowsTask] exit_code must be of type Long."
+        if max_run_time is not _MISSING:
+            assert _is_integer(max_run_time),\
+            "[propbundle_WindowsTask] max_run_time must be of type Long."
+        if next_run_time is not _MISSING:
+            assert (type(next_run_time) is _datetime or isinstance(next_run_time, _datetime)),\
+            "[propbundle_WindowsTask] next_run_time must be of type Datetime."
+        if action_list is not _MISSING:
+            _check_list_of(action_list, _DuckObject, _TAG_TASK_ACTION_TYPE,
+                           "[propbundle_WindowsTask] action_list must be of type List of TaskActionType.")
+        if trigger_list is not _MISSING:
+            _check_list_of(trigger_list, _DuckObject, _TAG_TRIGGER_TYPE,
+                           "[propbundle_WindowsTask] trigger_list must be of type List of TriggerType.")
+        if comment is not _MISSING:
+            assert (type(comment) is str or isinstance(comment, str)),\
+            "[propbundle_WindowsTask] comment must be of type String."
+        if working_directory is not _MISSING:
+            _check_instance_of(working_directory, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsTask] working_directory must be of type Trace.")
+        if work_item_data_ref is not _MISSING:
+            _check_instance_of(work_item_data_ref, _CoreObject, _TAG_TRACE,
+                               "[propbundle_WindowsTask] work_item_data_ref must be of type Trace.")
+
+    properties = _present(ImageName=image_name, ApplicationRef=application_ref, Parameters=parameters,
+                          AccountRef=account_ref, AccountRunLevel=account_run_level,
+                          AccountLogonType=account_logon_type, Creator=creator, CreatedTime=created_time,
+                          MostRecentRunTime=most_recent_run_time, ExitCode=exit_code, MaxRunTime=max_run_time,
+                          NextRunTime=next_run_time, ActionList=action_list, TriggerList=trigger_list,
+                          Comment=comment, WorkingDirectory=working_directory, WorkItemDataRef=work_item_data_ref)
+    return uco_object.create_PropertyBundle('WindowsTask', **properties)
+
+
+def propbundle_WindowsThread(uco_object, thread_id=_MISSING, running_status=_MISSING, context=_MISSING,
+                             priority=_MISSING, creation_flags=_MISSING, creation_time=_MISSING,
+                             start_address=_MISSING, parameter_address=_MISSING, security_attributes=_MISSING,
+                             stack_size=_MISSING):
     '''
     :param ThreadID: At most one value of type PositiveInteger.
     :param RunningStatus: At most one occurence of type ControlledVocabulary.
@@ -3721,76 +3734,80 @@ def propbundle_WindowsThread(uco_object, thread_id=Missing(), running_status=Mis
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(thread_id, Missing):
-        assert (isinstance(thread_id, int) and (thread_id > 0)),\
-        "[propbundle_WindowsThread] thread_id must be of type PositiveInteger."
-    if not isinstance(running_status, Missing):
-        assert (isinstance(running_status, case.CoreObject) and (running_status.type=='ControlledVocabulary')),\
-        "[propbundle_WindowsThread] running_status must be of type Hash."
-    if not isinstance(context, Missing):
-        assert isinstance(context, str),\
-        "[propbundle_WindowsThread] context must be of type String."
-    if not isinstance(priority, Missing):
-        assert isinstance(priority, int),\
-        "[propbundle_WindowsThread] priority must be of type Integer."
-    #TODO:HexBinary
-    if not isinstance(creation_time, Missing):
-        assert isinstance(creation_time, datetime.datetime),\
-        "[propbundle_WindowsThread] creation_time must be of type Datetime."
-    #TODO:HexBinary
-    #TODO:HexBinary
-    if not isinstance(security_attributes, Missing):
-        assert isinstance(security_attributes, str),\
-        "[propbundle_WindowsThread] security_attributes must be of type String."
-    if not isinstance(stack_size, Missing):
-        assert (isinstance(stack_size, int) and (thread_id > 0)),\
-        "[propbundle_WindowsThread] stack_size must be of type PositiveInteger."
-
-    return uco_object.create_PropertyBundle('WindowsThread', ThreadID=thread_id, RunningStatus=running_status,
-                                            Context=context, Priority=priority, CreationFlags=creation_flags,
-                                            CreationTime=creation_time, StartAddress=start_address,
-                                            ParameterAddress=parameter_address, SecurityAttributes=security_attributes,
-                                            StackSize=stack_size)
-
-
-def propbundle_WindowsVolume(uco_object, drive_letter=Missing()):
+    if _VALIDATE:
+        if thread_id is not _MISSING:
+            assert _is_positive_integer(thread_id),\
+            "[propbundle_WindowsThread] thread_id must be of type PositiveInteger."
+        if running_status is not _MISSING:
+            _check_instance_of(running_status, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[propbundle_WindowsThread] running_status must be of type Hash.")
+        if context is not _MISSING:
+            assert (type(context) is str or isinstance(context, str)),\
+            "[propbundle_WindowsThread] context must be of type String."
+        if priority is not _MISSING:
+            assert _is_integer(priority),\
+            "[propbundle_WindowsThread] priority must be of type Integer."
+        #TODO:HexBinary
+        if creation_time is not _MISSING:
+            assert (type(creation_time) is _datetime or isinstance(creation_time, _datetime)),\
+            "[propbundle_WindowsThread] creation_time must be of type Datetime."
+        #TODO:HexBinary
+        #TODO:HexBinary
+        if security_attributes is not _MISSING:
+            assert (type(security_attributes) is str or isinstance(security_attributes, str)),\
+            "[propbundle_WindowsThread] security_attributes must be of type String."
+        if stack_size is not _MISSING:
+            assert _is_positive_integer(stack_size),\
+            "[propbundle_WindowsThread] stack_size must be of type PositiveInteger."
+
+    properties = _present(ThreadID=thread_id, RunningStatus=running_status, Context=context, Priority=priority,
+                          CreationFlags=creation_flags, CreationTime=creation_time, StartAddress=start_address,
+                          ParameterAddress=parameter_address, SecurityAttributes=security_attributes,
+                          StackSize=stack_size)
+    return uco_object.create_PropertyBundle('WindowsThread', **properties)
+
+
+def propbundle_WindowsVolume(uco_object, drive_letter=_MISSING):
     '''
     :param DriveLetter: Exactly one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    assert not isinstance(drive_letter, Missing),\
-    "[propbundle_WindowsVolume] drive_letter is required."
-    if not isinstance(drive_letter, Missing):
-        assert isinstance(drive_letter, str),\
+    _require(drive_letter, "[propbundle_WindowsVolume] drive_letter is required.")
+
+    if _VALIDATE:
+        assert (type(drive_letter) is str or isinstance(drive_letter, str)),\
         "[propbundle_WindowsVolume] drive_letter must be of type String."
 
-    return uco_object.create_PropertyBundle('WindowsVolume', DriveLetter=drive_letter)
+    properties = _present(DriveLetter=drive_letter)
+    return uco_object.create_PropertyBundle('WindowsVolume', **properties)
 
 
-def propbundle_WirelessNetworkConnection(uco_object, base_station=Missing(), ssid=Missing()):
+def propbundle_WirelessNetworkConnection(uco_object, base_station=_MISSING, ssid=_MISSING):
     '''
     :param BaseStation: At most one value of type String.
     :param SSID: At most one value of type String.
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(base_station, Missing):
-        assert isinstance(base_station, str),\
-        "[propbundle_WirelessNetworkConnection] base_station must be of type String."
-    if not isinstance(ssid, Missing):
-        assert isinstance(ssid, str),\
-        "[propbundle_WirelessNetworkConnection] ssid must be of type String."
+    if _VALIDATE:
+        if base_station is not _MISSING:
+            assert (type(base_station) is str or isinstance(base_station, str)),\
+            "[propbundle_WirelessNetworkConnection] base_station must be of type String."
+        if ssid is not _MISSING:
+            assert (type(ssid) is str or isinstance(ssid, str)),\
+            "[propbundle_WirelessNetworkConnection] ssid must be of type String."
 
-    return uco_object.create_PropertyBundle('WirelessNetworkConnection', BaseStation=base_station, SSID=ssid)
+    properties = _present(BaseStation=base_station, SSID=ssid)
+    return uco_object.create_PropertyBundle('WirelessNetworkConnection', **properties)
 
 
-def propbundle_X509Certificate(uco_object, is_self_signed=Missing(), version=Missing(), serial_number=Missing(),
-                               signature_algorithm=Missing(), signature=Missing(), issuer=Missing(),
-                               issuer_hash=Missing(), validity_not_before=Missing(), validity_not_after=Missing(),
-                               subject=Missing(), subject_hash=Missing(), subject_public_key_algorithm=Missing(),
-                               subject_public_key_modulus=Missing(), subject_public_key_exponent=Missing(),
-                               x509V3Extensions=Missing(), thumbprint_hash=Missing()):
+def propbundle_X509Certificate(uco_object, is_self_signed=_MISSING, version=_MISSING, serial_number=_MISSING,
+                               signature_algorithm=_MISSING, signature=_MISSING, issuer=_MISSING,
+                               issuer_hash=_MISSING, validity_not_before=_MISSING, validity_not_after=_MISSING,
+                               subject=_MISSING, subject_hash=_MISSING, subject_public_key_algorithm=_MISSING,
+                               subject_public_key_modulus=_MISSING, subject_public_key_exponent=_MISSING,
+                               x509V3Extensions=_MISSING, thumbprint_hash=_MISSING):
     '''
     :param IsSelfSigned: At most one value of type Bool.
     :param Version: At most one value of type String.
@@ -3811,83 +3828,84 @@ def propbundle_X509Certificate(uco_object, is_self_signed=Missing(), version=Mis
     :return: A PropertyBundle object.
     '''
 
-    if not isinstance(is_self_signed, Missing):
-        assert isinstance(is_self_signed, bool),\
-        "[propbundle_X509Certificate] is_self_signed must be of type Bool."
-    if not isinstance(version, Missing):
-        assert isinstance(version, str),\
-        "[propbundle_X509Certificate] version must be of type String."
-    if not isinstance(serial_number, Missing):
-        assert isinstance(serial_number, str),\
-        "[propbundle_X509Certificate] serial_number must be of type String."
-    if not isinstance(signature_algorithm, Missing):
-        assert isinstance(signature_algorithm, str),\
-        "[propbundle_X509Certificate] signature_algorithm must be of type String."
-    if not isinstance(signature, Missing):
-        assert isinstance(signature, str),\
-        "[propbundle_X509Certificate] signature must be of type String."
-    if not isinstance(issuer, Missing):
-        assert isinstance(issuer, str),\
-        "[propbundle_X509Certificate] issuer must be of type String."
-    if not isinstance(issuer_hash, Missing):
-        assert (isinstance(issuer_hash, str) and (issuer_hash.type=='Hash')),\
-        "[propbundle_X509Certificate] issuer_hash must be of type Hash."
-    if not isinstance(validity_not_before, Missing):
-        assert isinstance(validity_not_before, datetime.datetime),\
-        "[propbundle_X509Certificate] validity_not_before must be of type Datetime."
-    if not isinstance(validity_not_after, Missing):
-        assert isinstance(validity_not_after, datetime.datetime),\
-        "[propbundle_X509Certificate] validity_not_after must be of type Datetime."
-    if not isinstance(subject, Missing):
-        assert isinstance(subject, str),\
-        "[propbundle_X509Certificate] subject must be of type String."
-    if not isinstance(subject_hash, Missing):
-        assert (isinstance(subject_hash, case.DuckObject) and (subject_hash.type=='Hash')),\
-        "[propbundle_X509Certificate] subject_hash must be of type Hash."
-    if not isinstance(subject_public_key_algorithm, Missing):
-        assert isinstance(subject_public_key_algorithm, str),\
-        "[propbundle_X509Certificate] subject_public_key_algorithm must be of type String."
-    if not isinstance(subject_public_key_modulus, Missing):
-        assert isinstance(subject_public_key_modulus, str),\
-        "[propbundle_X509Certificate] subject_public_key_modulus must be of type String."
-    if not isinstance(subject_public_key_exponent, Missing):
-        assert isinstance(subject_public_key_exponent, int),\
-        "[propbundle_X509Certificate] subject_public_key_exponent must be of type Integer."
-    if not isinstance(x509V3Extensions, Missing):
-        assert (isinstance(x509V3Extensions, case.DuckObject) and (subject_hash.type=='X509V3Extensions')),\
-        "[propbundle_X509Certificate] extensions must be of type X509V3Extensions."
-    if not isinstance(thumbprint_hash, Missing):
-        assert (isinstance(thumbprint_hash, case.DuckObject) and (subject_hash.type=='Hash')),\
-        "[propbundle_X509Certificate] thumbprint_hash must be of type Hash."
-
-    return uco_object.create_PropertyBundle('X509Certificate', IsSelfSigned=is_self_signed, Version=version,
-                                            SerialNumber=serial_number, SignatureAlgorithm=signature_algorithm,
-                                            Signature=signature, Issuer=issuer, IssuerHash=issuer_hash,
-                                            ValidityNotBefore=validity_not_before, ValidityNotAfter=validity_not_after,
-                                            Subject=subject, SubjectHash=subject_hash,
-                                            SubjectPublicKeyAlgorithm=subject_public_key_algorithm,
-                                            SubjectPublicKeyModulus=subject_public_key_modulus,
-                                            SubjectPublicKeyExponent=subject_public_key_exponent,
-                                            Extensions=x509V3Extensions, ThumbprintHash=thumbprint_hash)
+    if _VALIDATE:
+        if is_self_signed is not _MISSING:
+            assert type(is_self_signed) is bool,\
+            "[propbundle_X509Certificate] is_self_signed must be of type Bool."
+        if version is not _MISSING:
+            assert (type(version) is str or isinstance(version, str)),\
+            "[propbundle_X509Certificate] version must be of type String."
+        if serial_number is not _MISSING:
+            assert (type(serial_number) is str or isinstance(serial_number, str)),\
+            "[propbundle_X509Certificate] serial_number must be of type String."
+        if signature_algorithm is not _MISSING:
+            assert (type(signature_algorithm) is str or isinstance(signature_algorithm, str)),\
+            "[propbundle_X509Certificate] signature_algorithm must be of type String."
+        if signature is not _MISSING:
+            assert (type(signature) is str or isinstance(signature, str)),\
+            "[propbundle_X509Certificate] signature must be of type String."
+        if issuer is not _MISSING:
+            assert (type(issuer) is str or isinstance(issuer, str)),\
+            "[propbundle_X509Certificate] issuer must be of type String."
+        if issuer_hash is not _MISSING:
+            _check_instance_of(issuer_hash, _DuckObject, _TAG_HASH,
+                               "[propbundle_X509Certificate] issuer_hash must be of type Hash.")
+        if validity_not_before is not _MISSING:
+            assert (type(validity_not_before) is _datetime or isinstance(validity_not_before, _datetime)),\
+            "[propbundle_X509Certificate] validity_not_before must be of type Datetime."
+        if validity_not_after is not _MISSING:
+            assert (type(validity_not_after) is _datetime or isinstance(validity_not_after, _datetime)),\
+            "[propbundle_X509Certificate] validity_not_after must be of type Datetime."
+        if subject is not _MISSING:
+            assert (type(subject) is str or isinstance(subject, str)),\
+            "[propbundle_X509Certificate] subject must be of type String."
+        if subject_hash is not _MISSING:
+            _check_instance_of(subject_hash, _DuckObject, _TAG_HASH,
+                               "[propbundle_X509Certificate] subject_hash must be of type Hash.")
+        if subject_public_key_algorithm is not _MISSING:
+            assert (type(subject_public_key_algorithm) is str or isinstance(subject_public_key_algorithm, str)),\
+            "[propbundle_X509Certificate] subject_public_key_algorithm must be of type String."
+        if subject_public_key_modulus is not _MISSING:
+            assert (type(subject_public_key_modulus) is str or isinstance(subject_public_key_modulus, str)),\
+            "[propbundle_X509Certificate] subject_public_key_modulus must be of type String."
+        if subject_public_key_exponent is not _MISSING:
+            assert _is_integer(subject_public_key_exponent),\
+            "[propbundle_X509Certificate] subject_public_key_exponent must be of type Integer."
+        if x509V3Extensions is not _MISSING:
+            _check_instance_of(x509V3Extensions, _DuckObject, _TAG_X509_V3_EXTENSIONS,
+                               "[propbundle_X509Certificate] extensions must be of type X509V3Extensions.")
+        if thumbprint_hash is not _MISSING:
+            _check_instance_of(thumbprint_hash, _DuckObject, _TAG_HASH,
+                               "[propbundle_X509Certificate] thumbprint_hash must be of type Hash.")
+
+    properties = _present(IsSelfSigned=is_self_signed, Version=version, SerialNumber=serial_number,
+                          SignatureAlgorithm=signature_algorithm, Signature=signature, Issuer=issuer,
+                          IssuerHash=issuer_hash, ValidityNotBefore=validity_not_before,
+                          ValidityNotAfter=validity_not_after, Subject=subject, SubjectHash=subject_hash,
+                          SubjectPublicKeyAlgorithm=subject_public_key_algorithm,
+                          SubjectPublicKeyModulus=subject_public_key_modulus,
+                          SubjectPublicKeyExponent=subject_public_key_exponent, Extensions=x509V3Extensions,
+                          ThumbprintHash=thumbprint_hash)
+    return uco_object.create_PropertyBundle('X509Certificate', **properties)
 
 
 #====================================================
 #-- PROPERTYBUNDLE CHILDREN IN ALPHABETICAL ORDER
 
-def propbundle_sub_Address(uco_document, uco_object_propbundle, address_ref=Missing()):
+def propbundle_sub_Address(uco_document, uco_object_propbundle, address_ref=_MISSING):
     '''
     :param AddressRef: Exactly one occurrence of type Location.
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Address] uco_object_propbundle must be of type Identity."
+    _require(address_ref, "[propbundle_sub_Address] address_ref is required.")
+
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Address] uco_object_propbundle must be of type Identity.")
 
-    assert not isinstance(address_ref, Missing),\
-    "[propbundle_sub_Address] address_ref is required."
-    if not isinstance(address_ref, Missing):
-        assert (isinstance(address_ref, case.CoreObject) and (address_ref.type=='Location')),\
-        "[propbundle_sub_Address] address_ref must be of type Location."
+        _check_instance_of(address_ref, _CoreObject, _TAG_LOCATION,
+                           "[propbundle_sub_Address] address_ref must be of type Location.")
 
     return uco_document.create_SubObject('Address')
 
@@ -3897,27 +3915,28 @@ def propbundle_sub_Affiliation(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Affiliation] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Affiliation] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
     return uco_document.create_SubObject('Affiliation')
 
 
-def propbundle_sub_BirthInformation(uco_document, uco_object_propbundle, birth_date=Missing()):
+def propbundle_sub_BirthInformation(uco_document, uco_object_propbundle, birth_date=_MISSING):
     '''
     :param BirthDate: Exactly one value of type Datetime.
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_BirthInformation] uco_object_propbundle must be of type Identity."
+    _require(birth_date, "[propbundle_sub_BirthInformation] birth_date is required.")
 
-    assert not isinstance(birth_date, Missing),\
-    "[propbundle_sub_BirthInformation] birth_date is required."
-    if not isinstance(birth_date, Missing):
-        assert isinstance(birth_date, datetime.datetime),\
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_BirthInformation] uco_object_propbundle must be of type Identity.")
+
+        assert (type(birth_date) is _datetime or isinstance(birth_date, _datetime)),\
         "[propbundle_sub_BirthInformation] birth_date must be of type Datetime."
 
     return uco_document.create_SubObject('BirthInformation')
@@ -3928,8 +3947,9 @@ def propbundle_sub_CountriesOfResidence(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_CountriesOfResidence] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_CountriesOfResidence] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -3941,8 +3961,9 @@ def propbundle_sub_Events(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Events] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Events] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -3954,8 +3975,9 @@ def propbundle_sub_Identifier(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Identifier] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Identifier] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -3967,8 +3989,9 @@ def propbundle_sub_Languages(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Languages] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Languages] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -3980,8 +4003,9 @@ def propbundle_sub_Nationality(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Nationality] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Nationality] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -3993,8 +4017,9 @@ def propbundle_sub_Occupation(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Occupation] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Occupation] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -4006,8 +4031,9 @@ def propbundle_sub_OrganizationDetails(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_OrganizationDetails] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_OrganizationDetails] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -4019,8 +4045,9 @@ def propbundle_sub_PersonalDetails(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_PersonalDetails] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_PersonalDetails] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -4032,8 +4059,9 @@ def propbundle_sub_Qualification(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Qualification] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Qualification] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -4045,16 +4073,17 @@ def propbundle_sub_Relationship(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Relationship] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Relationship] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
     return uco_document.create_SubObject('Relationship')
 
 
-def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=Missing(), given_name=Missing(),
-                              honorific_prefix=Missing(), honorific_suffix=Missing()):
+def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=_MISSING, given_name=_MISSING,
+                              honorific_prefix=_MISSING, honorific_suffix=_MISSING):
     '''
     :param FamilyName: Any number of values of any type.
     :param GivenName: Any number of values of any type.
@@ -4063,13 +4092,15 @@ def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=M
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_SimpleName] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_SimpleName] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
-    return uco_document.create_SubObject('ForensicAction', FamilyName=family_name, GivenName=given_name,
-                                         HonorificPrefix=honorific_prefix, HonorificSuffix=honorific_suffix)
+    properties = _present(FamilyName=family_name, GivenName=given_name, HonorificPrefix=honorific_prefix,
+                          HonorificSuffix=honorific_suffix)
+    return uco_document.create_SubObject('ForensicAction', **properties)
 
 
 def propbundle_sub_Visa(uco_document, uco_object_propbundle):
@@ -4077,8 +4108,9 @@ def propbundle_sub_Visa(uco_document, uco_object_propbundle):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(uco_object_propbundle, case.PropertyBundle) and (uco_object_propbundle.type=='Identity')),\
-    "[propbundle_sub_Visa] uco_object_propbundle must be of type Identity."
+    if _VALIDATE:
+        _check_instance_of(uco_object_propbundle, _PropertyBundle, _TAG_IDENTITY,
+                           "[propbundle_sub_Visa] uco_object_propbundle must be of type Identity.")
 
     #TODO:NothingElseToCheck
 
@@ -4088,7 +4120,7 @@ def propbundle_sub_Visa(uco_document, uco_object_propbundle):
 #====================================================
 #-- DUCK IN ALPHABETICAL ORDER
 
-def duck_AlternateDataStream(uco_document, name=Missing(), hashes=Missing(), size=Missing()):
+def duck_AlternateDataStream(uco_document, name=_MISSING, hashes=_MISSING, size=_MISSING):
     '''
     :param Name: Exactly one value of type String.
     :param Hashes: At most one occurrence of type ArrayOfHash.
@@ -4096,100 +4128,96 @@ def duck_AlternateDataStream(uco_document, name=Missing(), hashes=Missing(), siz
     :return: A DuckObject object.
     '''
 
-    assert not isinstance(name, Missing),\
-    "[duck_AltnerateDataStream] name is required."
-    if not isinstance(name, Missing):
-        assert isinstance(name, str),\
+    _require(name, "[duck_AltnerateDataStream] name is required.")
+
+    if _VALIDATE:
+        assert (type(name) is str or isinstance(name, str)),\
         "[duck_AlternateDataStream] name must be of type String."
 
-    if not isinstance(hashes, Missing):
-        assert (isinstance(hashes, case.DuckObject) and (hashes.type=='AlternateDataStream')),\
-        "[duck_AlternateDataStream] hashes must be of type AlternateDataStream."
-    if not isinstance(size, Missing):
-        assert isinstance(size, int),\
-        "[duck_AlternateDataStream] size must be of type Integer."
+        if hashes is not _MISSING:
+            _check_instance_of(hashes, _DuckObject, _TAG_ALTERNATE_DATA_STREAM,
+                               "[duck_AlternateDataStream] hashes must be of type AlternateDataStream.")
+        if size is not _MISSING:
+            assert _is_integer(size),\
+            "[duck_AlternateDataStream] size must be of type Integer."
 
-    return uco_document.create_DuckObject('AlternateDataStream', Name=name, Hashes=hashes, size=size)
+    properties = _present(Name=name, Hashes=hashes, size=size)
+    return uco_document.create_DuckObject('AlternateDataStream', **properties)
 
 
-def duck_ArrayOfHash(uco_document, hashes=Missing()):
+def duck_ArrayOfHash(uco_document, hashes=_MISSING):
     '''
     :param Hashes: At least one occurrence of type Hash.
     :return: A DuckObject object.
     '''
 
-    assert not isinstance(hashes, Missing),\
-    "[duck_ArrayOfHash] hashes is required."
-    if not isinstance(hashes, Missing):
-        assert isinstance(hashes, list),\
-        "[duck_ArrayOfHash] hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in hashes),\
-        "[duck_ArrayOfHash] hashes must be of type List of Hash."
+    _require(hashes, "[duck_ArrayOfHash] hashes is required.")
 
-    return uco_document.create_DuckObject('ArrayOfHash', Hashes=hashes)
+    if _VALIDATE:
+        _check_list_of(hashes, _DuckObject, _TAG_HASH,
+                       "[duck_ArrayOfHash] hashes must be of type List of Hash.")
 
+    properties = _present(Hashes=hashes)
+    return uco_document.create_DuckObject('ArrayOfHash', **properties)
 
-def duck_ArrayOfObject(uco_document, objects=Missing()):
+
+def duck_ArrayOfObject(uco_document, objects=_MISSING):
     '''
     :param Objects: At least one occurrence of type CoreObject.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(objects, Missing),\
-    "[duck_ArrayOfObject] objects is required."
-    if not isinstance(objects, Missing):
-        assert isinstance(objects, list),\
-        "[duck_ArrayOfObject] objects must be of type List of CoreObject."
-        assert all(isinstance(i, case.CoreObject) for i in objects),\
-        "[duck_ArrayOfObject] objects must be of type List of CoreObject."
 
-    return uco_document.create_DuckObject('ArrayOfObject', Objects=objects)
+    _require(objects, "[duck_ArrayOfObject] objects is required.")
+
+    if _VALIDATE:
+        _check_list_of(objects, _CoreObject, None,
+                       "[duck_ArrayOfObject] objects must be of type List of CoreObject.")
 
+    properties = _present(Objects=objects)
+    return uco_document.create_DuckObject('ArrayOfObject', **properties)
 
-def duck_ArrayOfString(uco_document, strings=Missing()):
+
+def duck_ArrayOfString(uco_document, strings=_MISSING):
     '''
     :param strings: At least one value of type String.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(strings, Missing),\
-    "[duck_ArrayOfString] strings is required."
-    if not isinstance(strings, Missing):
-        assert isinstance(strings, list),\
-        "[duck_ArrayOfString] strings must be of type List of String."
-        assert all(isinstance(i, str) for i in strings),\
-        "[duck_ArrayOfString] strings must be of type List of String."
 
-    return uco_document.create_DuckObject('ArrayOfString', Strings=strings)
+    _require(strings, "[duck_ArrayOfString] strings is required.")
+
+    if _VALIDATE:
+        _check_list_of(strings, str, None,
+                       "[duck_ArrayOfString] strings must be of type List of String.")
 
+    properties = _present(Strings=strings)
+    return uco_document.create_DuckObject('ArrayOfString', **properties)
 
-def duck_BuildConfigurationType(uco_document, configuration_setting_description=Missing(),
-                                configuration_settings=Missing()):
+
+def duck_BuildConfigurationType(uco_document, configuration_setting_description=_MISSING,
+                                configuration_settings=_MISSING):
     '''
     :param ConfigurationSettingDescription: At most one value of type String.
     :param ConfigurationSettings: Any number of occurrences of type ConfigurationSettingType.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(configuration_setting_description, Missing):
-        assert isinstance(configuration_setting_description, str),\
-        "[duck_BuildConfigurationType] configuration_setting_description must be of type String."
-    if not isinstance(configuration_settings, Missing):
-        assert isinstance(configuration_settings, list),\
-        "[duck_BuildConfigurationType] configuration_settings must be of type List of ConfigurationSettingType."
-        assert all( (isinstance(i, case.DuckObject) and
-                     i.type=='ConfigurationSettingType') for i in configuration_settings),\
-        "[duck_BuildConfigurationType] configuration_settings must be of type List of ConfigurationSettingType."
-
-    return uco_document.create_DuckObject('BuildConfigurationType',
-                                          ConfigurationSettingDescription=configuration_setting_description,
-                                          ConfigurationSettings=configuration_settings)
-
-
-def duck_BuildInformationType(uco_document, build_id=Missing(), build_project=Missing(), build_utility=Missing(),
-                              build_version=Missing(), build_label=Missing(), compilers=Missing(),
-                              compilation_date=Missing(), build_configuration=Missing(), build_script=Missing(),
-                              libraries=Missing(), build_output_log=Missing()):
+
+    if _VALIDATE:
+        if configuration_setting_description is not _MISSING:
+            assert (type(configuration_setting_description) is str or isinstance(configuration_setting_description, str)),\
+            "[duck_BuildConfigurationType] configuration_setting_description must be of type String."
+        if configuration_settings is not _MISSING:
+            _check_list_of(configuration_settings, _DuckObject, _TAG_CONFIGURATION_SETTING_TYPE,
+                           "[duck_BuildConfigurationType] configuration_settings must be of type List of ConfigurationSettingType.")
+
+    properties = _present(ConfigurationSettingDescription=configuration_setting_description,
+                          ConfigurationSettings=configuration_settings)
+    return uco_document.create_DuckObject('BuildConfigurationType', **properties)
+
+
+def duck_BuildInformationType(uco_document, build_id=_MISSING, build_project=_MISSING, build_utility=_MISSING,
+                              build_version=_MISSING, build_label=_MISSING, compilers=_MISSING,
+                              compilation_date=_MISSING, build_configuration=_MISSING, build_script=_MISSING,
+                              libraries=_MISSING, build_output_log=_MISSING):
     '''
     :param BuildID: At most one value of type String.
     :param BuildProject: At most one value of type String.
@@ -4204,56 +4232,50 @@ def duck_BuildInformationType(uco_document, build_id=Missing(), build_project=Mi
     :param BuildOutputLog: At most one value of type String.
     :return: A DuckObject object.
     '''
- 
-    if not isinstance(build_id, Missing):
-        assert isinstance(build_id, str),\
-        "[duck_BuildInformationType] build_id must be of type String."
-    if not isinstance(build_project, Missing):
-        assert isinstance(build_project, str),\
-        "[duck_BuildInformationType] build_project must be of type String."
-    if not isinstance(build_utility, Missing):
-        assert (isinstance(build_utility, case.DuckObject) and (build_utility.type=='BuildUtilityType')),\
-        "[duck_BuildInformationType] build_utility must be of type BuildUtilityType."
-    if not isinstance(build_version, Missing):
-        assert isinstance(build_version, str),\
-        "[duck_BuildInformationType] build_version must be of type String."
-    if not isinstance(build_label, Missing):
-        assert isinstance(build_label, str),\
-        "[duck_BuildInformationType] build_label must be of type String."
-    if not isinstance(compilers, Missing):
-        assert isinstance(compilers, list),\
-        "[duck_BuildInformationType] compilers must be of type List of CompilerType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='CompilerType') for i in compilers),\
-        "[duck_BuildInformationType] compilers must be of type List of CompilerType."
-    if not isinstance(compilation_date, Missing):
-        assert isinstance(compilation_date, datetime.datetime),\
-        "[duck_BuildInformationType] compilation_date must be of type Datetime."
-    if not isinstance(build_configuration, Missing):
-        assert isinstance(build_configuration, list),\
-        "[duck_BuildInformationType] build_configuration must be of type List of BuildConfigurationType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='BuildConfigurationType') for i in build_configuration),\
-        "[duck_BuildInformationType] build_configuration must be of type List of BuildConfigurationType."
-    if not isinstance(build_script, Missing):
-        assert isinstance(build_script, str),\
-        "[duck_BuildInformationType] build_script must be of type String."
-    if not isinstance(libraries, Missing):
-        assert isinstance(libraries, list),\
-        "[duck_BuildInformationType] libraries must be of type List of LibraryType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='LibraryType') for i in libraries),\
-        "[duck_BuildInformationType] libraries must be of type List of LibraryType."
-    if not isinstance(build_output_log, Missing):
-        assert isinstance(build_output_log, str),\
-        "[duck_BuildInformationType] build_output_log must be of type String."
-
-    return uco_document.create_DuckObject('BuildInformationType', BuildID=build_id, BuildProject=build_project,
-                                          BuildUtilities=build_utility, BuildVersion=build_version,
-                                          BuildLabel=build_label, Compilers=compilers,
-                                          CompilationDate=compilation_date, BuildConfiguration=build_configuration,
-                                          BuildScript=build_script, Libraries=libraries,
-                                          BuildOutputLog=build_output_log)
-
-
-def duck_BuildUtilityType(uco_document, build_utility_name=Missing(), swid=Missing(), cpeid=Missing()):
+
+    if _VALIDATE:
+        if build_id is not _MISSING:
+            assert (type(build_id) is str or isinstance(build_id, str)),\
+            "[duck_BuildInformationType] build_id must be of type String."
+        if build_project is not _MISSING:
+            assert (type(build_project) is str or isinstance(build_project, str)),\
+            "[duck_BuildInformationType] build_project must be of type String."
+        if build_utility is not _MISSING:
+            _check_instance_of(build_utility, _DuckObject, _TAG_BUILD_UTILITY_TYPE,
+                               "[duck_BuildInformationType] build_utility must be of type BuildUtilityType.")
+        if build_version is not _MISSING:
+            assert (type(build_version) is str or isinstance(build_version, str)),\
+            "[duck_BuildInformationType] build_version must be of type String."
+        if build_label is not _MISSING:
+            assert (type(build_label) is str or isinstance(build_label, str)),\
+            "[duck_BuildInformationType] build_label must be of type String."
+        if compilers is not _MISSING:
+            _check_list_of(compilers, _DuckObject, _TAG_COMPILER_TYPE,
+                           "[duck_BuildInformationType] compilers must be of type List of CompilerType.")
+        if compilation_date is not _MISSING:
+            assert (type(compilation_date) is _datetime or isinstance(compilation_date, _datetime)),\
+            "[duck_BuildInformationType] compilation_date must be of type Datetime."
+        if build_configuration is not _MISSING:
+            _check_list_of(build_configuration, _DuckObject, _TAG_BUILD_CONFIGURATION_TYPE,
+                           "[duck_BuildInformationType] build_configuration must be of type List of BuildConfigurationType.")
+        if build_script is not _MISSING:
+            assert (type(build_script) is str or isinstance(build_script, str)),\
+            "[duck_BuildInformationType] build_script must be of type String."
+        if libraries is not _MISSING:
+            _check_list_of(libraries, _DuckObject, _TAG_LIBRARY_TYPE,
+                           "[duck_BuildInformationType] libraries must be of type List of LibraryType.")
+        if build_output_log is not _MISSING:
+            assert (type(build_output_log) is str or isinstance(build_output_log, str)),\
+            "[duck_BuildInformationType] build_output_log must be of type String."
+
+    properties = _present(BuildID=build_id, BuildProject=build_project, BuildUtilities=build_utility,
+                          BuildVersion=build_version, BuildLabel=build_label, Compilers=compilers,
+                          CompilationDate=compilation_date, BuildConfiguration=build_configuration,
+                          BuildScript=build_script, Libraries=libraries, BuildOutputLog=build_output_log)
+    return uco_document.create_DuckObject('BuildInformationType', **properties)
+
+
+def duck_BuildUtilityType(uco_document, build_utility_name=_MISSING, swid=_MISSING, cpeid=_MISSING):
     '''
     :param BuildUtilityName: Exactly one value of type String.
     :param SWID: At most one value of type String.
@@ -4261,24 +4283,24 @@ def duck_BuildUtilityType(uco_document, build_utility_name=Missing(), swid=Missi
     :return: A DuckObject object.
     '''
 
-    assert not isinstance(build_utility_name, Missing),\
-    "[duck_BuildUtility] build_utility_name is required."
-    if not isinstance(build_utility_name, Missing):
-        assert isinstance(build_utility_name, str),\
+    _require(build_utility_name, "[duck_BuildUtility] build_utility_name is required.")
+
+    if _VALIDATE:
+        assert (type(build_utility_name) is str or isinstance(build_utility_name, str)),\
         "[duck_BuildUtility] build_utility_name must be of type String."
 
-    if not isinstance(swid, Missing):
-        assert isinstance(swid, str),\
-        "[duck_BuildUtility] swid must be of type String."
-    if not isinstance(cpeid, Missing):
-        assert isinstance(cpeid, str),\
-        "[duck_BuildUtility] cpeid must be of type String."
-    
-    return uco_document.create_DuckObject('BuildUtilityType', BuildUtilityName=build_utility_name, SWID=swid,
-                                          CPEID=cpeid)
+        if swid is not _MISSING:
+            assert (type(swid) is str or isinstance(swid, str)),\
+            "[duck_BuildUtility] swid must be of type String."
+        if cpeid is not _MISSING:
+            assert (type(cpeid) is str or isinstance(cpeid, str)),\
+            "[duck_BuildUtility] cpeid must be of type String."
+
+    properties = _present(BuildUtilityName=build_utility_name, SWID=swid, CPEID=cpeid)
+    return uco_document.create_DuckObject('BuildUtilityType', **properties)
 
 
-def duck_CompilerType(uco_document, compiler_informal_description=Missing(), swid=Missing(), cpeid=Missing()):
+def duck_CompilerType(uco_document, compiler_informal_description=_MISSING, swid=_MISSING, cpeid=_MISSING):
     '''
     :param CompilerInformalDescription: At most one value of any type.
     :param SWID: At most one value of type String.
@@ -4286,20 +4308,21 @@ def duck_CompilerType(uco_document, compiler_informal_description=Missing(), swi
     :return: A DuckObject object.
     '''
 
-    #NOCHECK:compiler_informal_description
-    if not isinstance(swid, Missing):
-        assert isinstance(swid, str),\
-        "[duck_CompilerType] swid must be of type String."
-    if not isinstance(cpeid, Missing):
-        assert isinstance(cpeid, str),\
-        "[duck_CompilerType] cpeid must be of type String."
-    
-    return uco_document.create_DuckObject('CompilerType', CompilerInformalDescription=compiler_informal_description,
-                                          SWID=swid, CPEID=cpeid)
+    if _VALIDATE:
+        #NOCHECK:compiler_informal_description
+        if swid is not _MISSING:
+            assert (type(swid) is str or isinstance(swid, str)),\
+            "[duck_CompilerType] swid must be of type String."
+        if cpeid is not _MISSING:
+            assert (type(cpeid) is str or isinstance(cpeid, str)),\
+            "[duck_CompilerType] cpeid must be of type String."
+
+    properties = _present(CompilerInformalDescription=compiler_informal_description, SWID=swid, CPEID=cpeid)
+    return uco_document.create_DuckObject('CompilerType', **properties)
 
 
-def duck_ConfigurationSettingType(uco_document, item_name=Missing(), item_value=Missing(), item_type=Missing(),
-                                  item_description=Missing()):
+def duck_ConfigurationSettingType(uco_document, item_name=_MISSING, item_value=_MISSING, item_type=_MISSING,
+                                  item_description=_MISSING):
     '''
     :param ItemName: Exactly one value of type String.
     :param ItemValue: Exactly one value of type String.
@@ -4307,68 +4330,65 @@ def duck_ConfigurationSettingType(uco_document, item_name=Missing(), item_value=
     :param ItemDescriptipn: At most one value of type String.
     :return: A DuckObject object.
     '''
-   
-    assert not isinstance(item_name, Missing),\
-    "[duck_ConfigurationSettingType] item_name is required."
-    if not isinstance(item_name, Missing):
-        assert isinstance(item_name, str),\
+
+    _require(item_name, "[duck_ConfigurationSettingType] item_name is required.")
+    _require(item_value, "[duck_ConfigurationSettingType] item_value is required.")
+
+    if _VALIDATE:
+        assert (type(item_name) is str or isinstance(item_name, str)),\
         "[duck_ConfigurationSettingType] item_name must be of type String."
-    assert not isinstance(item_value, Missing),\
-    "[duck_ConfigurationSettingType] item_value is required."
-    if not isinstance(item_value, Missing):
-        assert isinstance(item_value, str),\
+        assert (type(item_value) is str or isinstance(item_value, str)),\
         "[duck_ConfigurationSettingType] item_value must be of type String."
 
-    if not isinstance(item_type, Missing):
-        assert isinstance(item_type, str),\
-        "[duck_ConfigurationSettingType] item_type must be of type String."
-    if not isinstance(item_description, Missing):
-        assert isinstance(item_description, str),\
-        "[duck_ConfigurationSettingType] item_description must be of type String."
+        if item_type is not _MISSING:
+            assert (type(item_type) is str or isinstance(item_type, str)),\
+            "[duck_ConfigurationSettingType] item_type must be of type String."
+        if item_description is not _MISSING:
+            assert (type(item_description) is str or isinstance(item_description, str)),\
+            "[duck_ConfigurationSettingType] item_description must be of type String."
 
-    return uco_document.create_DuckObject('ConfigurationSettingType', ItemName=item_name, ItemValue=item_value,
-                                          ItemType=item_type, ItemDescription=item_description)
+    properties = _present(ItemName=item_name, ItemValue=item_value, ItemType=item_type,
+                          ItemDescription=item_description)
+    return uco_document.create_DuckObject('ConfigurationSettingType', **properties)
 
 
-def duck_ControlledDictionary(uco_document, entry=Missing()):
+def duck_ControlledDictionary(uco_document, entry=_MISSING):
     '''
     :param Entry: At least one occurrence of type ControlledDictionaryEntry.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(entry, Missing),\
-    "[duck_ControlledDictionary] entry is required."
-    if not isinstance(entry, Missing):
-        assert isinstance(entry, list),\
-        "[duck_ControlledDictionary] entry must be of type List of ControlledDictionaryEntry."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='ControlledDictionaryEntry') for i in entry),\
-        "[duck_ControlledDictionary] entry must be of type List of ControlledDictionaryEntry."
 
-    return uco_document.create_DuckObject('ControlledDictionary', Entry=entry)
+    _require(entry, "[duck_ControlledDictionary] entry is required.")
+
+    if _VALIDATE:
+        _check_list_of(entry, _DuckObject, _TAG_CONTROLLED_DICTIONARY_ENTRY,
+                       "[duck_ControlledDictionary] entry must be of type List of ControlledDictionaryEntry.")
+
+    properties = _present(Entry=entry)
+    return uco_document.create_DuckObject('ControlledDictionary', **properties)
 
 
-def duck_ControlledDictionaryEntry(uco_document, key=Missing(), value=Missing()):
+def duck_ControlledDictionaryEntry(uco_document, key=_MISSING, value=_MISSING):
     '''
     :param Key: Exactly one occurrence of type ControlledVocabulary.
     :param Value: Exactly one value of type String.
     :return: A DuckObject object.
     '''
 
-    assert not isinstance(key, Missing),\
-    "[duck_ControlledDictionaryEntry] key is required."
-    if not isinstance(key, Missing):
-        assert (isinstance(key, case.CoreObject) and (key.type=='ControlledVocabulary')),\
-        "[duck_ControlledDictionaryEntry] key must be of type ControlledVocabulary."
-    assert not isinstance(value, Missing),\
-    "[duck_ControlledDictionaryEntry] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+    _require(key, "[duck_ControlledDictionaryEntry] key is required.")
+    _require(value, "[duck_ControlledDictionaryEntry] value is required.")
+
+    if _VALIDATE:
+        _check_instance_of(key, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[duck_ControlledDictionaryEntry] key must be of type ControlledVocabulary.")
+        assert (type(value) is str or isinstance(value, str)),\
         "[duck_ControlledDictionaryEntry] value must be of type String."
 
-    return uco_document.create_DuckObject('ControlledDictionaryEntry', Key=key, Value=value)
+    properties = _present(Key=key, Value=value)
+    return uco_document.create_DuckObject('ControlledDictionaryEntry', **properties)
 
 
-def duck_DataRange(uco_document, range_offset_type=Missing(), range_offset=Missing(), range_size=Missing()):
+def duck_DataRange(uco_document, range_offset_type=_MISSING, range_offset=_MISSING, range_size=_MISSING):
     '''
     :param RangeOffsetType: At most one value of type String.
     :param RangeOffset: At most one value of type Integer.
@@ -4376,74 +4396,76 @@ def duck_DataRange(uco_document, range_offset_type=Missing(), range_offset=Missi
     :return: A DuckObject object.
     '''
 
-    if not isinstance(range_offset_type, Missing):
-        assert isinstance(range_offset_type, str),\
-        "[duck_DataRange] range_offset_type must be of type String."
-    if not isinstance(range_offset, Missing):
-        assert isinstance(range_offset, int),\
-        "[duck_DataRange] range_offset must be of type Integer."
-    if not isinstance(range_size, Missing):
-        assert isinstance(range_size, long),\
-        "[duck_DataRange] range_size must be of type Long."
-    
-    return uco_document.create_DuckObject('DataRange', RangeOffsetType=range_offset_type, RangeOffset=range_offset,
-                                          RangeSize=range_size)
+    if _VALIDATE:
+        if range_offset_type is not _MISSING:
+            assert (type(range_offset_type) is str or isinstance(range_offset_type, str)),\
+            "[duck_DataRange] range_offset_type must be of type String."
+        if range_offset is not _MISSING:
+            assert _is_integer(range_offset),\
+            "[duck_DataRange] range_offset must be of type Integer."
+        if range_size is not _MISSING:
+            assert _is_integer(range_size),\
+            "[duck_DataRange] range_size must be of type Long."
 
+    properties = _present(RangeOffsetType=range_offset_type, RangeOffset=range_offset, RangeSize=range_size)
+    return uco_document.create_DuckObject('DataRange', **properties)
 
-def duck_DependencyType(uco_document, dependency_description=Missing(), dependency_type=Missing()):
+
+def duck_DependencyType(uco_document, dependency_description=_MISSING, dependency_type=_MISSING):
     '''
     :param DependencyDescription: Exactly one value of any type.
     :param DependencyType: At most one value of type String.
     :return: A DuckObject object.
     '''
 
-    #NOCHECK:dependency_description
-    if not isinstance(dependency_type, Missing):
-        assert isinstance(dependency_type, str),\
-        "[duck_DependencyType] dependency_type must be of type String."
-    
-    return uco_document.create_DuckObject('DependencyType', DependencyDescription=dependency_description,
-                                          DependencyType=dependency_type)
+    if _VALIDATE:
+        #NOCHECK:dependency_description
+        if dependency_type is not _MISSING:
+            assert (type(dependency_type) is str or isinstance(dependency_type, str)),\
+            "[duck_DependencyType] dependency_type must be of type String."
 
+    properties = _present(DependencyDescription=dependency_description, DependencyType=dependency_type)
+    return uco_document.create_DuckObject('DependencyType', **properties)
 
-def duck_Dictionary(uco_document, entry=Missing()):
+
+def duck_Dictionary(uco_document, entry=_MISSING):
     '''
     :param Entry: At least one occurrence of type DictionaryEntry.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(entry, Missing),\
-    "[duck_Dictionary] entry is required."
-    if not isinstance(entry, Missing):
-        assert (isinstance(entry, case.DuckObject) and (entry.type=='DictionaryEntry')),\
-        "[duck_Dictionary] entry must be of type DictionaryEntry."
 
-    return uco_document.create_DuckObject('Dictionary', Entry=entry)
+    _require(entry, "[duck_Dictionary] entry is required.")
+
+    if _VALIDATE:
+        _check_instance_of(entry, _DuckObject, _TAG_DICTIONARY_ENTRY,
+                           "[duck_Dictionary] entry must be of type DictionaryEntry.")
 
+    properties = _present(Entry=entry)
+    return uco_document.create_DuckObject('Dictionary', **properties)
 
-def duck_DictionaryEntry(uco_document, key=Missing(), value=Missing()):
+
+def duck_DictionaryEntry(uco_document, key=_MISSING, value=_MISSING):
     '''
     :param Key: Exactly one value of type String.
     :param Value: Exactly one value of type String.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(key, Missing),\
-    "[duck_DictionaryEntry] key is required."
-    if not isinstance(key, Missing):
-        assert isinstance(key, str),\
+
+    _require(key, "[duck_DictionaryEntry] key is required.")
+    _require(value, "[duck_DictionaryEntry] value is required.")
+
+    if _VALIDATE:
+        assert (type(key) is str or isinstance(key, str)),\
         "[duck_DictionaryEntry] key must be of type String."
-    assert not isinstance(value, Missing),\
-    "[duck_DictionaryEntry] value is required."
-    if not isinstance(value, Missing):
-        assert isinstance(value, str),\
+        assert (type(value) is str or isinstance(value, str)),\
         "[duck_DictionaryEntry] value must be of type String."
 
-    return uco_document.create_DuckObject('DictionaryEntry', Key=key, Value=value)
+    properties = _present(Key=key, Value=value)
+    return uco_document.create_DuckObject('DictionaryEntry', **properties)
 
 
-def duck_GlobalFlagType(uco_document, abbreviation=Missing(), destination=Missing(), hexadecimal_value=Missing(),
-                        symbolic_name=Missing()):
+def duck_GlobalFlagType(uco_document, abbreviation=_MISSING, destination=_MISSING, hexadecimal_value=_MISSING,
+                        symbolic_name=_MISSING):
     '''
     :param Abbrevation: At most one value of type String.
     :param Destination: At most one value of type String.
@@ -4451,97 +4473,99 @@ def duck_GlobalFlagType(uco_document, abbreviation=Missing(), destination=Missin
     :param SymbolicName: At most one value of type String.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(abbreviation, Missing):
-        assert isinstance(abbreviation, str),\
-        "[duck_GlobalFlagType] abbreviation must be of type String."
-    if not isinstance(destination, Missing):
-        assert isinstance(destination, str),\
-        "[duck_GlobalFlagType] destination must be of type String."
-    #TODO:HexBinary
-    if not isinstance(symbolic_name, Missing):
-        assert isinstance(symbolic_name, str),\
-        "[duck_GlobalFlagType] symbolic_name must be of type String."
 
-    return uco_document.create_DuckObject('GlobalFlagType', Abbreviation=abbreviation, Destination=destination,
-                                          HexadecimalValue=hexadecimal_value, SymbolicName=symbolic_name)
+    if _VALIDATE:
+        if abbreviation is not _MISSING:
+            assert (type(abbreviation) is str or isinstance(abbreviation, str)),\
+            "[duck_GlobalFlagType] abbreviation must be of type String."
+        if destination is not _MISSING:
+            assert (type(destination) is str or isinstance(destination, str)),\
+            "[duck_GlobalFlagType] destination must be of type String."
+        #TODO:HexBinary
+        if symbolic_name is not _MISSING:
+            assert (type(symbolic_name) is str or isinstance(symbolic_name, str)),\
+            "[duck_GlobalFlagType] symbolic_name must be of type String."
 
+    properties = _present(Abbreviation=abbreviation, Destination=destination, HexadecimalValue=hexadecimal_value,
+                          SymbolicName=symbolic_name)
+    return uco_document.create_DuckObject('GlobalFlagType', **properties)
 
-def duck_GranularMarking(uco_document, content_selectors=Missing(), marking_references=Missing()):
+
+def duck_GranularMarking(uco_document, content_selectors=_MISSING, marking_references=_MISSING):
     '''
     :param ContentSelectors: Any number of values of type String.
     :param MarkingReferences: Any number of occurrences of type MarkingDefinition.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(content_selectors, Missing):
-        assert isinstance(content_selectors, list),\
-        "[duck_GranularMarking] content_selectors must be of type List of String."
-        assert all(isinstance(i, str) for i in content_selectors),\
-        "[duck_GranularMarking] content_selectors must be of type List of String."
-    if not isinstance(marking_references, Missing):
-        assert isinstance(marking_references, list),\
-        "[duck_GranularMarking] marking_references must be of type List of MarkingDefinition."
-        assert all( (isinstance(i, case.CoreObject) and i.type=='MarkingDefinition') for i in marking_references),\
-        "[duck_GranularMarking] marking_references must be of type List of MarkingDefinition."
 
-    return uco_document.create_DuckObject('GranularMarking', ContentSelectors=content_selectors,
-                                          MarkingReferences=marking_references)
+    if _VALIDATE:
+        if content_selectors is not _MISSING:
+            _check_list_of(content_selectors, str, None,
+                           "[duck_GranularMarking] content_selectors must be of type List of String.")
+        if marking_references is not _MISSING:
+            _check_list_of(marking_references, _CoreObject, _TAG_MARKING_DEFINITION,
+                           "[duck_GranularMarking] marking_references must be of type List of MarkingDefinition.")
 
+    properties = _present(ContentSelectors=content_selectors, MarkingReferences=marking_references)
+    return uco_document.create_DuckObject('GranularMarking', **properties)
 
-def duck_Hash(uco_document, hash_method=Missing(), hash_value=Missing()):
+
+def duck_Hash(uco_document, hash_method=_MISSING, hash_value=_MISSING):
     '''
     :param HashMethod: Exactly one occurrence of type ControlledVocabulary.
     :param HashValue: Exactly one value of type HexBinary.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(hash_method, Missing),\
-    "[duck_Hash] hash_method is required."
-    if not isinstance(hash_method, Missing):
-        assert (isinstance(hash_method, case.CoreObject) and (hash_method.type=='ControlledVocabulary')),\
-        "[duck_Hash] hash_method must be of type ControlledVocabulary."
+
+    _require(hash_method, "[duck_Hash] hash_method is required.")
+
+    if _VALIDATE:
+        _check_instance_of(hash_method, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                           "[duck_Hash] hash_method must be of type ControlledVocabulary.")
+
     #TODO:HexBinary
 
-    return uco_document.create_DuckObject('Hash', HashMethod=hash_method, HashValue=hash_value)
+    properties = _present(HashMethod=hash_method, HashValue=hash_value)
+    return uco_document.create_DuckObject('Hash', **properties)
 
 
-def duck_IComHandlerActionType(uco_document, com_data=Missing(), com_class_id=Missing()):
+def duck_IComHandlerActionType(uco_document, com_data=_MISSING, com_class_id=_MISSING):
     '''
     :param ComData: At most one value of type String.
     :param ComClassID: At most one value of type String.
     :return: A DuckObject object.
     '''
 
-    if not isinstance(com_data, Missing):
-        assert isinstance(com_data, str),\
-        "[duck_IComHandlerActionType] com_data must be of type String."
-    if not isinstance(com_class_id, Missing):
-        assert isinstance(com_class_id, str),\
-        "[duck_IComHandlerActionType] com_class_id must be of type String."
-    
-    return uco_document.create_DuckObject('IComHandlerActionType', ComData=com_data, ComClassID=com_class_id)
+    if _VALIDATE:
+        if com_data is not _MISSING:
+            assert (type(com_data) is str or isinstance(com_data, str)),\
+            "[duck_IComHandlerActionType] com_data must be of type String."
+        if com_class_id is not _MISSING:
+            assert (type(com_class_id) is str or isinstance(com_class_id, str)),\
+            "[duck_IComHandlerActionType] com_class_id must be of type String."
+
+    properties = _present(ComData=com_data, ComClassID=com_class_id)
+    return uco_document.create_DuckObject('IComHandlerActionType', **properties)
 
 
-def duck_LibraryType(uco_document, library_name=Missing(), library_version=Missing()):
+def duck_LibraryType(uco_document, library_name=_MISSING, library_version=_MISSING):
     '''
     :param LibraryName: Exactly one value of type String.
     :param LibraryVersion: Exactly one value of type String.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(library_name, Missing),\
-    "[duck_LibraryType] library_name is required."
-    if not isinstance(library_name, Missing):
-        assert isinstance(library_name, str),\
+
+    _require(library_name, "[duck_LibraryType] library_name is required.")
+    _require(library_version, "[duck_LibraryType] library_version is required.")
+
+    if _VALIDATE:
+        assert (type(library_name) is str or isinstance(library_name, str)),\
         "[duck_LibraryType] library_name must be of type String."
-    assert not isinstance(library_version, Missing),\
-    "[duck_LibraryType] library_version is required."
-    if not isinstance(library_version, Missing):
-        assert isinstance(library_version, str),\
+        assert (type(library_version) is str or isinstance(library_version, str)),\
         "[duck_LibraryType] library_version must be of type String."
 
-    return uco_document.create_DuckObject('LibraryType', LibraryName=library_name, LibraryVersion=library_version)
+    properties = _present(LibraryName=library_name, LibraryVersion=library_version)
+    return uco_document.create_DuckObject('LibraryType', **properties)
 
 
 def duck_MarkingModel(uco_document):
@@ -4554,8 +4578,8 @@ def duck_MarkingModel(uco_document):
     return uco_document.create_DuckObject('MarkingModel')
 
 
-def duck_MIMEPartType(uco_document, body=Missing(), content_type=Missing(), body_raw_ref=Missing(),
-                      content_disposition=Missing()):
+def duck_MIMEPartType(uco_document, body=_MISSING, content_type=_MISSING, body_raw_ref=_MISSING,
+                      content_disposition=_MISSING):
     '''
     :param Body: At most one value of type String.
     :param ContentType: At most one value of type String.
@@ -4563,26 +4587,28 @@ def duck_MIMEPartType(uco_document, body=Missing(), content_type=Missing(), body
     :param ContentDisposition: At most one value of type String.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(body, Missing):
-        assert isinstance(body, str),\
-        "[duck_MIMEPartType] body must be of type String."
-    if not isinstance(content_type, Missing):
-        assert isinstance(content_type, str),\
-        "[duck_MIMEPartType] content_type must be of type String."
-    if not isinstance(body_raw_ref, Missing):
-        assert (isinstance(body_raw_ref, case.CoreObject) and (body_raw_ref.type=='Trace')),\
-        "[duck_MIMEPartType] body_raw_ref must be of type Trace."
-    if not isinstance(content_disposition, Missing):
-        assert isinstance(content_disposition, str),\
-        "[duck_MIMEPartType] content_disposition must be of type String."
-
-    return uco_document.create_DuckObject('MIMEPartType', Body=body, ContentType=content_type, BodyRawRef=body_raw_ref,
-                                          ContentDisposition=content_disposition)
-
-
-def duck_TaskActionType(uco_document, action_id=Missing(), iemail_action_ref=Missing(), icom_handler_action=Missing(),
-                        iexec_action=Missing(), ishow_message_action=Missing()):
+
+    if _VALIDATE:
+        if body is not _MISSING:
+            assert (type(body) is str or isinstance(body, str)),\
+            "[duck_MIMEPartType] body must be of type String."
+        if content_type is not _MISSING:
+            assert (type(content_type) is str or isinstance(content_type, str)),\
+            "[duck_MIMEPartType] content_type must be of type String."
+        if body_raw_ref is not _MISSING:
+            _check_instance_of(body_raw_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_MIMEPartType] body_raw_ref must be of type Trace.")
+        if content_disposition is not _MISSING:
+            assert (type(content_disposition) is str or isinstance(content_disposition, str)),\
+            "[duck_MIMEPartType] content_disposition must be of type String."
+
+    properties = _present(Body=body, ContentType=content_type, BodyRawRef=body_raw_ref,
+                          ContentDisposition=content_disposition)
+    return uco_document.create_DuckObject('MIMEPartType', **properties)
+
+
+def duck_TaskActionType(uco_document, action_id=_MISSING, iemail_action_ref=_MISSING, icom_handler_action=_MISSING,
+                        iexec_action=_MISSING, ishow_message_action=_MISSING):
     '''
     :param ActionID: At most one value of type String.
     :param iEmailActionRef: At most one occurrence of type Trace.
@@ -4591,31 +4617,33 @@ def duck_TaskActionType(uco_document, action_id=Missing(), iemail_action_ref=Mis
     :param iShowMessageAction: At most one occurrence of type IShowMessageActionType.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(action_id, Missing):
-        assert isinstance(action_id, str),\
-        "[duck_TaskActionType] action_id must be of type String."
-    if not isinstance(iemail_action_ref, Missing):
-        assert (isinstance(iemail_action_ref, case.CoreObject) and (iemail_action_ref.type=='Trace')),\
-        "[duck_TaskActionType] iemail_action_ref must be of type Trace."
-    if not isinstance(icom_handler_action, Missing):
-        assert (isinstance(icom_handler_action, case.DuckObject) and (icom_handler_action.type=='IComHandlerActionType')),\
-        "[duck_TaskActionType] icom_handler_action must be of type IComHandlerActionType."
-    if not isinstance(iexec_action, Missing):
-        assert (isinstance(iexec_action, case.DuckObject) and (iexec_action.type=='IExecActionType')),\
-        "[duck_TaskActionType] iexec_action must be of type IExecActionType."
-    if not isinstance(ishow_message_action, Missing):
-        assert (isinstance(ishow_message_action, case.DuckObject) and (ishow_message_action.type=='IShowMessageActionType')),\
-        "[duck_TaskActionType] ishow_message_action must be of type IShowMessageActionType."
-
-    return uco_document.create_DuckObject('TaskActionType', ActionID=action_id, iEmailActionRef=iemail_action_ref,
-                                          iComHandlerAction=icom_handler_action, iExecAction=iexec_action,
-                                          iShowMessageAction=ishow_message_action)
-
-
-def duck_TriggerType(uco_document, is_enabled=Missing(), trigger_begin_time=Missing(), trigger_delay=Missing(),
-                     trigger_end_time=Missing(), trigger_max_run_time=Missing(),
-                     trigger_session_change_type=Missing()):
+
+    if _VALIDATE:
+        if action_id is not _MISSING:
+            assert (type(action_id) is str or isinstance(action_id, str)),\
+            "[duck_TaskActionType] action_id must be of type String."
+        if iemail_action_ref is not _MISSING:
+            _check_instance_of(iemail_action_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_TaskActionType] iemail_action_ref must be of type Trace.")
+        if icom_handler_action is not _MISSING:
+            _check_instance_of(icom_handler_action, _DuckObject, _TAG_I_COM_HANDLER_ACTION_TYPE,
+                               "[duck_TaskActionType] icom_handler_action must be of type IComHandlerActionType.")
+        if iexec_action is not _MISSING:
+            _check_instance_of(iexec_action, _DuckObject, _TAG_I_EXEC_ACTION_TYPE,
+                               "[duck_TaskActionType] iexec_action must be of type IExecActionType.")
+        if ishow_message_action is not _MISSING:
+            _check_instance_of(ishow_message_action, _DuckObject, _TAG_I_SHOW_MESSAGE_ACTION_TYPE,
+                               "[duck_TaskActionType] ishow_message_action must be of type IShowMessageActionType.")
+
+    properties = _present(ActionID=action_id, iEmailActionRef=iemail_action_ref,
+                          iComHandlerAction=icom_handler_action, iExecAction=iexec_action,
+                          iShowMessageAction=ishow_message_action)
+    return uco_document.create_DuckObject('TaskActionType', **properties)
+
+
+def duck_TriggerType(uco_document, is_enabled=_MISSING, trigger_begin_time=_MISSING, trigger_delay=_MISSING,
+                     trigger_end_time=_MISSING, trigger_max_run_time=_MISSING,
+                     trigger_session_change_type=_MISSING):
     '''
     :param IsEnabled: At most one value of type Bool.
     :param TriggerBeginTime: At most one value of type Datetime.
@@ -4626,34 +4654,35 @@ def duck_TriggerType(uco_document, is_enabled=Missing(), trigger_begin_time=Miss
     :return: A DuckObject object.
     '''
 
-    if not isinstance(is_enabled, Missing):
-        assert isinstance(is_enabled, bool),\
-        "[duck_TriggerType] is_enabled must be of type Bool."
-    if not isinstance(trigger_begin_time, Missing):
-        assert isinstance(trigger_begin_time, datetime.datetime),\
-        "[duck_TriggerType] trigger_begin_time must be of type Datetime."
-    if not isinstance(trigger_delay, Missing):
-        assert isinstance(trigger_delay, str),\
-        "[duck_TriggerType] trigger_delay must be of type String."
-    if not isinstance(trigger_end_time, Missing):
-        assert isinstance(trigger_end_time, datetime.datetime),\
-        "[duck_TriggerType] trigger_end_time must be of type Datetime."
-    if not isinstance(trigger_max_run_time, Missing):
-        assert isinstance(trigger_max_run_time, str),\
-        "[duck_TriggerType] trigger_max_run_time must be of type String."
-    if not isinstance(trigger_session_change_type, Missing):
-        assert isinstance(trigger_session_change_type, str),\
-        "[duck_TriggerType] trigger_session_change_type must be of type String."
-    
-    return uco_document.create_DuckObject('TriggerType', IsEnabled=is_enabled, TriggerBeginTime=trigger_begin_time,
-                                          TriggerDelay=trigger_delay, TriggerEndTime=trigger_end_time,
-                                          TriggerMaxRunTime=trigger_max_run_time,
-                                          TriggerSessionChangedTime=trigger_session_change_type)
-
-
-def duck_WhoIsContactType(uco_document, contact_id=Missing(), contact_name=Missing(), email_address_ref=Missing(),
-                          phone_number_ref=Missing(), fax_number_ref=Missing(), address_ref=Missing(),
-                          contact_organization=Missing()):
+    if _VALIDATE:
+        if is_enabled is not _MISSING:
+            assert type(is_enabled) is bool,\
+            "[duck_TriggerType] is_enabled must be of type Bool."
+        if trigger_begin_time is not _MISSING:
+            assert (type(trigger_begin_time) is _datetime or isinstance(trigger_begin_time, _datetime)),\
+            "[duck_TriggerType] trigger_begin_time must be of type Datetime."
+        if trigger_delay is not _MISSING:
+            assert (type(trigger_delay) is str or isinstance(trigger_delay, str)),\
+            "[duck_TriggerType] trigger_delay must be of type String."
+        if trigger_end_time is not _MISSING:
+            assert (type(trigger_end_time) is _datetime or isinstance(trigger_end_time, _datetime)),\
+            "[duck_TriggerType] trigger_end_time must be of type Datetime."
+        if trigger_max_run_time is not _MISSING:
+            assert (type(trigger_max_run_time) is str or isinstance(trigger_max_run_time, str)),\
+            "[duck_TriggerType] trigger_max_run_time must be of type String."
+        if trigger_session_change_type is not _MISSING:
+            assert (type(trigger_session_change_type) is str or isinstance(trigger_session_change_type, str)),\
+            "[duck_TriggerType] trigger_session_change_type must be of type String."
+
+    properties = _present(IsEnabled=is_enabled, TriggerBeginTime=trigger_begin_time, TriggerDelay=trigger_delay,
+                          TriggerEndTime=trigger_end_time, TriggerMaxRunTime=trigger_max_run_time,
+                          TriggerSessionChangedTime=trigger_session_change_type)
+    return uco_document.create_DuckObject('TriggerType', **properties)
+
+
+def duck_WhoIsContactType(uco_document, contact_id=_MISSING, contact_name=_MISSING, email_address_ref=_MISSING,
+                          phone_number_ref=_MISSING, fax_number_ref=_MISSING, address_ref=_MISSING,
+                          contact_organization=_MISSING):
     '''
     :param ContactID: At most one value of type String.
     :param ContactName: At most one value of type String.
@@ -4664,38 +4693,40 @@ def duck_WhoIsContactType(uco_document, contact_id=Missing(), contact_name=Missi
     :param ContactOrganization: At most one occurrence of type Identity (core).
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(contact_id, Missing):
-        assert isinstance(contact_id, str),\
-        "[duck_WhoIsContactType] contact_id must be of type String."
-    if not isinstance(contact_name, Missing):
-        assert isinstance(contact_name, str),\
-        "[duck_WhoIsContactType] contact_name must be of type String."
-    if not isinstance(email_address_ref, Missing):
-        assert (isinstance(email_address_ref, case.CoreObject) and (email_address_ref.type=='Trace')),\
-        "[duck_WhoIsContactType] email_address_ref must be of type Trace."
-    if not isinstance(phone_number_ref, Missing):
-        assert (isinstance(phone_number_ref, case.CoreObject) and (phone_number_ref.type=='Trace')),\
-        "[duck_WhoIsContactType] phone_number_ref must be of type Trace."
-    if not isinstance(fax_number_ref, Missing):
-        assert (isinstance(fax_number_ref, case.CoreObject) and (fax_number_ref.type=='Trace')),\
-        "[duck_WhoIsContactType] fax_number_ref must be of type Trace."
-    if not isinstance(address_ref, Missing):
-        assert (isinstance(address_ref, case.CoreObject) and (address_ref.type=='Location')),\
-        "[duck_WhoIsContactType] address_ref must be of type Location."
-    if not isinstance(contact_organization, Missing):
-        assert (isinstance(contact_organization, case.CoreObject) and (contact_organization.type=='Identity')),\
-        "[duck_WhoIsContactType] contact_organization must be of type Identity."
-
-    return uco_document.create_DuckObject('WhoIsContactType', ContactID=contact_id, ContactName=contact_name,
-                                          EmailAddressRef=email_address_ref, PhoneNumberRef=phone_number_ref,
-                                          FaxNumberRef=fax_number_ref, ContactOrganization=contact_organization)
-
-
-def duck_WhoIsRegistrarInfoType(uco_document, registrar_id=Missing(), registrar_guid=Missing(),
-                                who_is_server_ref=Missing(), referral_url_ref=Missing(),
-                                registrar_name=Missing(), email_address_ref=Missing(), phone_number_ref=Missing(),
-                                address_ref=Missing(), contact_info_refs=Missing()):
+
+    if _VALIDATE:
+        if contact_id is not _MISSING:
+            assert (type(contact_id) is str or isinstance(contact_id, str)),\
+            "[duck_WhoIsContactType] contact_id must be of type String."
+        if contact_name is not _MISSING:
+            assert (type(contact_name) is str or isinstance(contact_name, str)),\
+            "[duck_WhoIsContactType] contact_name must be of type String."
+        if email_address_ref is not _MISSING:
+            _check_instance_of(email_address_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsContactType] email_address_ref must be of type Trace.")
+        if phone_number_ref is not _MISSING:
+            _check_instance_of(phone_number_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsContactType] phone_number_ref must be of type Trace.")
+        if fax_number_ref is not _MISSING:
+            _check_instance_of(fax_number_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsContactType] fax_number_ref must be of type Trace.")
+        if address_ref is not _MISSING:
+            _check_instance_of(address_ref, _CoreObject, _TAG_LOCATION,
+                               "[duck_WhoIsContactType] address_ref must be of type Location.")
+        if contact_organization is not _MISSING:
+            _check_instance_of(contact_organization, _CoreObject, _TAG_IDENTITY,
+                               "[duck_WhoIsContactType] contact_organization must be of type Identity.")
+
+    properties = _present(ContactID=contact_id, ContactName=contact_name, EmailAddressRef=email_address_ref,
+                          PhoneNumberRef=phone_number_ref, FaxNumberRef=fax_number_ref,
+                          ContactOrganization=contact_organization)
+    return uco_document.create_DuckObject('WhoIsContactType', **properties)
+
+
+def duck_WhoIsRegistrarInfoType(uco_document, registrar_id=_MISSING, registrar_guid=_MISSING,
+                                who_is_server_ref=_MISSING, referral_url_ref=_MISSING,
+                                registrar_name=_MISSING, email_address_ref=_MISSING, phone_number_ref=_MISSING,
+                                address_ref=_MISSING, contact_info_refs=_MISSING):
     '''
     :param RegistrarID: At most one value of type String.
     :param RegistrarGUID: At most one value of type String.
@@ -4708,48 +4739,47 @@ def duck_WhoIsRegistrarInfoType(uco_document, registrar_id=Missing(), registrar_
     :param ContactInfoRefs: Any number of occurrences of type WhoIsContactType.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(registrar_id, Missing):
-        assert isinstance(registrar_id, str),\
-        "[duck_WhoIsRegistrarInfoType] registrar_id must be of type String."
-    if not isinstance(registrar_guid, Missing):
-        assert isinstance(registrar_guid, str),\
-        "[duck_WhoIsRegistrarInfoType] registrar_guid must be of type String."
-    if not isinstance(who_is_server_ref, Missing):
-        assert (isinstance(who_is_server_ref, case.CoreObject) and (who_is_server_ref.type=='Trace')),\
-        "[duck_WhoIsRegistrarInfoType] who_is_server_ref must be of type Trace."
-    if not isinstance(referral_url_ref, Missing):
-        assert (isinstance(referral_url_ref, case.CoreObject) and (referral_url_ref.type=='Trace')),\
-        "[duck_WhoIsRegistrarInfoType] referral_url_ref must be of type Trace."
-    if not isinstance(registrar_name, Missing):
-        assert isinstance(registrar_name, str),\
-        "[duck_WhoIsRegistrarInfoType] registrar_name must be of type String."
-    if not isinstance(email_address_ref, Missing):
-        assert (isinstance(email_address_ref, case.CoreObject) and (email_address_ref.type=='Trace')),\
-        "[duck_WhoIsRegistrarInfoType] email_address_ref must be of type Trace."
-    if not isinstance(phone_number_ref, Missing):
-        assert (isinstance(phone_number_ref, case.CoreObject) and (phone_number_ref.type=='Trace')),\
-        "[duck_WhoIsRegistrarInfoType] phone_number_ref must be of type Trace."
-    if not isinstance(address_ref, Missing):
-        assert (isinstance(address_ref, case.CoreObject) and (address_ref.type=='Location')),\
-        "[duck_WhoIsRegistrarInfoType] address_ref must be of type Location."
-    if not isinstance(contact_info_refs, Missing):
-        assert isinstance(contact_info_refs, list),\
-        "[duck_WhoIsRegistrarInfoType] contact_info_refs must be of type List of WhoIsContactType."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='WhoIsContactType') for i in contact_info_refs),\
-        "[duck_WhoIsRegistrarInfoType] contact_info_refs must be of type List of WhoIsContactType."
-
-    return uco_document.create_DuckObject('WhoIsRegistrarInfoType', RegistrarID=registrar_id,
-                                          RegistrarGUID=registrar_guid, WhoIsServerRef=who_is_server_ref,
-                                          ReferralURLRef=referral_url_ref, RegistrarName=registrar_name,
-                                          EmailAddress=email_address_ref, PhoneNumberRef=phone_number_ref,
-                                          AddressRef=address_ref, ContactInfoRefs=contact_info_refs)
-
-
-def duck_WindowsPEFileHeader(uco_document, machine=Missing(), number_of_sections=Missing(), time_date_stamp=Missing(),
-                             pointer_to_symbol_table=Missing(), number_of_symbols=Missing(),
-                             size_of_optional_header=Missing(), characteristics=Missing(),
-                             hashes=Missing()):
+
+    if _VALIDATE:
+        if registrar_id is not _MISSING:
+            assert (type(registrar_id) is str or isinstance(registrar_id, str)),\
+            "[duck_WhoIsRegistrarInfoType] registrar_id must be of type String."
+        if registrar_guid is not _MISSING:
+            assert (type(registrar_guid) is str or isinstance(registrar_guid, str)),\
+            "[duck_WhoIsRegistrarInfoType] registrar_guid must be of type String."
+        if who_is_server_ref is not _MISSING:
+            _check_instance_of(who_is_server_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsRegistrarInfoType] who_is_server_ref must be of type Trace.")
+        if referral_url_ref is not _MISSING:
+            _check_instance_of(referral_url_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsRegistrarInfoType] referral_url_ref must be of type Trace.")
+        if registrar_name is not _MISSING:
+            assert (type(registrar_name) is str or isinstance(registrar_name, str)),\
+            "[duck_WhoIsRegistrarInfoType] registrar_name must be of type String."
+        if email_address_ref is not _MISSING:
+            _check_instance_of(email_address_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsRegistrarInfoType] email_address_ref must be of type Trace.")
+        if phone_number_ref is not _MISSING:
+            _check_instance_of(phone_number_ref, _CoreObject, _TAG_TRACE,
+                               "[duck_WhoIsRegistrarInfoType] phone_number_ref must be of type Trace.")
+        if address_ref is not _MISSING:
+            _check_instance_of(address_ref, _CoreObject, _TAG_LOCATION,
+                               "[duck_WhoIsRegistrarInfoType] address_ref must be of type Location.")
+        if contact_info_refs is not _MISSING:
+            _check_list_of(contact_info_refs, _DuckObject, _TAG_WHO_IS_CONTACT_TYPE,
+                           "[duck_WhoIsRegistrarInfoType] contact_info_refs must be of type List of WhoIsContactType.")
+
+    properties = _present(RegistrarID=registrar_id, RegistrarGUID=registrar_guid, WhoIsServerRef=who_is_server_ref,
+                          ReferralURLRef=referral_url_ref, RegistrarName=registrar_name,
+                          EmailAddress=email_address_ref, PhoneNumberRef=phone_number_ref, AddressRef=address_ref,
+                          ContactInfoRefs=contact_info_refs)
+    return uco_document.create_DuckObject('WhoIsRegistrarInfoType', **properties)
+
+
+def duck_WindowsPEFileHeader(uco_document, machine=_MISSING, number_of_sections=_MISSING, time_date_stamp=_MISSING,
+                             pointer_to_symbol_table=_MISSING, number_of_symbols=_MISSING,
+                             size_of_optional_header=_MISSING, characteristics=_MISSING,
+                             hashes=_MISSING):
     '''
     :param Machine: Exactly one value of type HexBinary.
     :param NumberOfSections: At most one value of type HexBinary.
@@ -4761,41 +4791,40 @@ def duck_WindowsPEFileHeader(uco_document, machine=Missing(), number_of_sections
     :param Hashes: Any number of occurences of type Hash.
     :return: A DuckObject object.
     '''
-    
-    #TODO:HexBinary #REQUIRED
 
-    #TODO:HexBinary
-    #NOCHECK:time_date_stamp
-    #TODO:HexBinary
-    #TODO:HexBinary
-    #TODO:HexBinary
-    #TODO:HexBinary
-    if not isinstance(hashes, Missing):
-        assert isinstance(hashes, list),\
-        "[duck_WindowsPEFileHeader] hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in hashes),\
-        "[duck_WindowsPEFileHeader] hashes must be of type List of Hash."
-
-    return uco_document.create_DuckObject('WindowsPEFileHeader', Machine=machine, NumberOfSections=number_of_sections,
-                                          TimeDateStamp=time_date_stamp, PointerToSymbolTable=pointer_to_symbol_table,
-                                          NumberOfSymbols=number_of_symbols,
-                                          SizeOfOptionalHeader=size_of_optional_header,
-                                          Characteristics=characteristics, Hashes=hashes)
-
-
-def duck_WindowsPEOptionalHeader(uco_document, magic=Missing(), major_linker_version=Missing(),
-                                 minor_linker_version=Missing(), size_of_code=Missing(),
-                                 size_of_initialized_data=Missing(), size_of_uninitialized_data=Missing(),
-                                 address_of_entry_point=Missing(), base_of_code=Missing(), image_base=Missing(),
-                                 section_alignment=Missing(), file_alignment=Missing(), major_os_version=Missing(),
-                                 minor_os_version=Missing(), major_image_version=Missing(),
-                                 minor_image_version=Missing(), major_subsystem_version=Missing(),
-                                 minor_subsystem_version=Missing(), win32_version_value=Missing(),
-                                 size_of_image=Missing(), size_of_headers=Missing(), checksum=Missing(),
-                                 subsystem=Missing(), dll_characteristics=Missing(), size_of_stack_reserve=Missing(),
-                                 size_of_stack_commit=Missing(), size_of_heap_reserve=Missing(),
-                                 size_of_heap_commit=Missing(), loader_flags=Missing(),
-                                 number_of_rva_and_sizes=Missing(), hashes=Missing()):
+    if _VALIDATE:
+        #TODO:HexBinary #REQUIRED
+
+        #TODO:HexBinary
+        #NOCHECK:time_date_stamp
+        #TODO:HexBinary
+        #TODO:HexBinary
+        #TODO:HexBinary
+        #TODO:HexBinary
+        if hashes is not _MISSING:
+            _check_list_of(hashes, _DuckObject, _TAG_HASH,
+                           "[duck_WindowsPEFileHeader] hashes must be of type List of Hash.")
+
+    properties = _present(Machine=machine, NumberOfSections=number_of_sections, TimeDateStamp=time_date_stamp,
+                          PointerToSymbolTable=pointer_to_symbol_table, NumberOfSymbols=number_of_symbols,
+                          SizeOfOptionalHeader=size_of_optional_header, Characteristics=characteristics,
+                          Hashes=hashes)
+    return uco_document.create_DuckObject('WindowsPEFileHeader', **properties)
+
+
+def duck_WindowsPEOptionalHeader(uco_document, magic=_MISSING, major_linker_version=_MISSING,
+                                 minor_linker_version=_MISSING, size_of_code=_MISSING,
+                                 size_of_initialized_data=_MISSING, size_of_uninitialized_data=_MISSING,
+                                 address_of_entry_point=_MISSING, base_of_code=_MISSING, image_base=_MISSING,
+                                 section_alignment=_MISSING, file_alignment=_MISSING, major_os_version=_MISSING,
+                                 minor_os_version=_MISSING, major_image_version=_MISSING,
+                                 minor_image_version=_MISSING, major_subsystem_version=_MISSING,
+                                 minor_subsystem_version=_MISSING, win32_version_value=_MISSING,
+                                 size_of_image=_MISSING, size_of_headers=_MISSING, checksum=_MISSING,
+                                 subsystem=_MISSING, dll_characteristics=_MISSING, size_of_stack_reserve=_MISSING,
+                                 size_of_stack_commit=_MISSING, size_of_heap_reserve=_MISSING,
+                                 size_of_heap_commit=_MISSING, loader_flags=_MISSING,
+                                 number_of_rva_and_sizes=_MISSING, hashes=_MISSING):
     '''
     :param Magic: At most one value of type HexBinary.
     :param MajorLinkerVersion: At most one value of type HexBinary.
@@ -4829,39 +4858,34 @@ def duck_WindowsPEOptionalHeader(uco_document, magic=Missing(), major_linker_ver
     :param Hashes: Any number of occurrences of type Hash.
     :return: A DuckObject object.
     '''
-    
-    # ALL THE HEXBINARY
-    #TODO:HexBinary
 
-    if not isinstance(hashes, Missing):
-        assert isinstance(hashes, list),\
-        "[duck_WindowsPEOptionalHeader] hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in hashes),\
-        "[duck_WindowsPEOptionalHeader] hashes must be of type List of Hash."
-
-    return uco_document.create_DuckObject('WindowsPEOptionalHeader', Magic=magic,
-                                          MajorLinkerVersion=major_linker_version,
-                                          MinorLinkerVersion=minor_linker_version, SizeOfCode=size_of_code,
-                                          SizeOfInitializedData=size_of_initialized_data,
-                                          SizeOfUninitializedData=size_of_uninitialized_data,
-                                          AddressOfEntryPoint=address_of_entry_point,
-                                          BaseOfCode=base_of_code, ImageBase=image_base,
-                                          SectionAlignment=section_alignment, FileAlignment=file_alignment,
-                                          MajorOSVersion=major_os_version, MinorOSVersion=minor_os_version,
-                                          MajorImageVersion=major_image_version, MinorImageVersion=minor_image_version,
-                                          MajorSubsystemVersion=major_subsystem_version,
-                                          MinorSubsystemVersion=minor_subsystem_version,
-                                          Win32VersionValue=win32_version_value, SizeOfImage=size_of_image,
-                                          SizeOfHeaders=size_of_headers, Checksum=checksum, Subsystem=subsystem,
-                                          DLLCharacteristics=dll_characteristics,
-                                          SizeOfStackReserve=size_of_stack_reserve,
-                                          SizeOfStackCommit=size_of_stack_commit,
-                                          SizeOfHeapReserve=size_of_heap_reserve,
-                                          SizeOfHeapCommit=size_of_heap_commit, LoaderFlags=loader_flags,
-                                          NumberOfRVAAndSizes=number_of_rva_and_sizes, Hashes=hashes)
-
-
-def duck_WindowsPESection(uco_document, name=Missing(), size=Missing(), entropy=Missing(), hashes=Missing()):
+    if _VALIDATE:
+        # ALL THE HEXBINARY
+        #TODO:HexBinary
+
+        if hashes is not _MISSING:
+            _check_list_of(hashes, _DuckObject, _TAG_HASH,
+                           "[duck_WindowsPEOptionalHeader] hashes must be of type List of Hash.")
+
+    properties = _present(Magic=magic, MajorLinkerVersion=major_linker_version,
+                          MinorLinkerVersion=minor_linker_version, SizeOfCode=size_of_code,
+                          SizeOfInitializedData=size_of_initialized_data,
+                          SizeOfUninitializedData=size_of_uninitialized_data,
+                          AddressOfEntryPoint=address_of_entry_point, BaseOfCode=base_of_code, ImageBase=image_base,
+                          SectionAlignment=section_alignment, FileAlignment=file_alignment,
+                          MajorOSVersion=major_os_version, MinorOSVersion=minor_os_version,
+                          MajorImageVersion=major_image_version, MinorImageVersion=minor_image_version,
+                          MajorSubsystemVersion=major_subsystem_version,
+                          MinorSubsystemVersion=minor_subsystem_version, Win32VersionValue=win32_version_value,
+                          SizeOfImage=size_of_image, SizeOfHeaders=size_of_headers, Checksum=checksum,
+                          Subsystem=subsystem, DLLCharacteristics=dll_characteristics,
+                          SizeOfStackReserve=size_of_stack_reserve, SizeOfStackCommit=size_of_stack_commit,
+                          SizeOfHeapReserve=size_of_heap_reserve, SizeOfHeapCommit=size_of_heap_commit,
+                          LoaderFlags=loader_flags, NumberOfRVAAndSizes=number_of_rva_and_sizes, Hashes=hashes)
+    return uco_document.create_DuckObject('WindowsPEOptionalHeader', **properties)
+
+
+def duck_WindowsPESection(uco_document, name=_MISSING, size=_MISSING, entropy=_MISSING, hashes=_MISSING):
     '''
     :param Name: Exactly one value of type String.
     :param Size: At most one value of type Integer.
@@ -4869,60 +4893,60 @@ def duck_WindowsPESection(uco_document, name=Missing(), size=Missing(), entropy=
     :param Hashes: Any number of occurrences of type Hash.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(name, Missing),\
-    "[duck_WindowsPESection] name is required."
-    if not isinstance(name, Missing):
-        assert isinstance(name, str),\
+
+    _require(name, "[duck_WindowsPESection] name is required.")
+
+    if _VALIDATE:
+        assert (type(name) is str or isinstance(name, str)),\
         "[duck_WindowsPESection] name must be of type String."
 
-    if not isinstance(size, Missing):
-        assert isinstance(size, int),\
-        "[duck_WindowsPESection] size must be of type Integer."
-    if not isinstance(entropy, Missing):
-        assert isinstance(entropy, float),\
-        "[duck_WindowsPESection] entropy must be of type Float."
-    if not isinstance(hashes, Missing):
-        assert isinstance(hashes, list),\
-        "[duck_WindowsPESection] hashes must be of type List of Hash."
-        assert all( (isinstance(i, case.DuckObject) and i.type=='Hash') for i in hashes),\
-        "[duck_WindowsPESection] hashes must be of type List of Hash."
+        if size is not _MISSING:
+            assert _is_integer(size),\
+            "[duck_WindowsPESection] size must be of type Integer."
+        if entropy is not _MISSING:
+            assert (type(entropy) is float or isinstance(entropy, float)),\
+            "[duck_WindowsPESection] entropy must be of type Float."
+        if hashes is not _MISSING:
+            _check_list_of(hashes, _DuckObject, _TAG_HASH,
+                           "[duck_WindowsPESection] hashes must be of type List of Hash.")
 
-    return uco_document.create_DuckObject('WindowsPESection', Name=name, Size=size, Entropy=entropy, Hashes=hashes)
+    properties = _present(Name=name, Size=size, Entropy=entropy, Hashes=hashes)
+    return uco_document.create_DuckObject('WindowsPESection', **properties)
 
 
-def duck_WindowsRegistryValue(uco_document, name=Missing(), data=Missing(), data_type=Missing()):
+def duck_WindowsRegistryValue(uco_document, name=_MISSING, data=_MISSING, data_type=_MISSING):
     '''
     :param Name: Exactly one value of type String.
     :param Data: At most one value of type String.
     :param DataType: At most one occurrence of type ControlledVocabulary.
     :return: A DuckObject object.
     '''
-    
-    assert not isinstance(name, Missing),\
-    "[duck_WindowsRegistryValue] name is required."
-    if not isinstance(name, Missing):
-        assert isinstance(name, str),\
+
+    _require(name, "[duck_WindowsRegistryValue] name is required.")
+
+    if _VALIDATE:
+        assert (type(name) is str or isinstance(name, str)),\
         "[duck_WindowsRegistryValue] name must be of type String."
 
-    if not isinstance(data, Missing):
-        assert isinstance(data, str),\
-        "[duck_WindowsRegistryValue] data must be of type String."
-    if not isinstance(data_type, Missing):
-        assert (isinstance(data_type, case.CoreObject) and (data_type.type=='ControlledVocabulary')),\
-        "[duck_WindowsRegistryValue] data_type must be of type ControlledVocabulary."
+        if data is not _MISSING:
+            assert (type(data) is str or isinstance(data, str)),\
+            "[duck_WindowsRegistryValue] data must be of type String."
+        if data_type is not _MISSING:
+            _check_instance_of(data_type, _CoreObject, _TAG_CONTROLLED_VOCABULARY,
+                               "[duck_WindowsRegistryValue] data_type must be of type ControlledVocabulary.")
 
-    return uco_document.create_DuckObject('WindowsRegistryValue', Name=name, Data=data, DataType=data_type)
+    properties = _present(Name=name, Data=data, DataType=data_type)
+    return uco_document.create_DuckObject('WindowsRegistryValue', **properties)
 
 
-def duck_X509V3Extensions(uco_document, basic_constraints=Missing(), name_constraints=Missing(),
-                          policy_constraints=Missing(), key_usage=Missing(), extended_key_usage=Missing(),
-                          subject_key_identifier=Missing(), authority_key_identifier=Missing(),
-                          subject_alternative_name=Missing(), issuer_alternative_name=Missing(),
-                          subject_directory_attributes=Missing(), crl_distribution_points=Missing(),
-                          inhibit_any_policy=Missing(), private_key_usage_period_not_before=Missing(),
-                          private_key_usage_period_not_after=Missing(), certificate_policies=Missing(),
-                          policy_mappings=Missing()):
+def duck_X509V3Extensions(uco_document, basic_constraints=_MISSING, name_constraints=_MISSING,
+                          policy_constraints=_MISSING, key_usage=_MISSING, extended_key_usage=_MISSING,
+                          subject_key_identifier=_MISSING, authority_key_identifier=_MISSING,
+                          subject_alternative_name=_MISSING, issuer_alternative_name=_MISSING,
+                          subject_directory_attributes=_MISSING, crl_distribution_points=_MISSING,
+                          inhibit_any_policy=_MISSING, private_key_usage_period_not_before=_MISSING,
+                          private_key_usage_period_not_after=_MISSING, certificate_policies=_MISSING,
+                          policy_mappings=_MISSING):
     '''
     :param BasicConstraints: At most one value of type String.
     :param NameConstraints: At most one value of type String.
@@ -4942,70 +4966,69 @@ def duck_X509V3Extensions(uco_document, basic_constraints=Missing(), name_constr
     :param PolicyMappings: At most one value of type String.
     :return: A DuckObject object.
     '''
-    
-    if not isinstance(basic_constraints, Missing):
-        assert isinstance(basic_constraints, str),\
-        "[duck_X509V3Extensions] basic_constraints must be of type String."
-    if not isinstance(name_constraints, Missing):
-        assert isinstance(name_constraints, str),\
-        "[duck_X509V3Extensions] name_constraints must be of type String."
-    if not isinstance(policy_constraints, Missing):
-        assert isinstance(policy_constraints, str),\
-        "[duck_X509V3Extensions] policy_constraints must be of type String."
-    if not isinstance(key_usage, Missing):
-        assert isinstance(key_usage, str),\
-        "[duck_X509V3Extensions] key_usage must be of type String."
-    if not isinstance(extended_key_usage, Missing):
-        assert isinstance(extended_key_usage, str),\
-        "[duck_X509V3Extensions] extended_key_usage must be of type String."
-    if not isinstance(subject_key_identifier, Missing):
-        assert isinstance(subject_key_identifier, str),\
-        "[duck_X509V3Extensions] subject_key_identifier must be of type String."
-    if not isinstance(authority_key_identifier, Missing):
-        assert isinstance(authority_key_identifier, str),\
-        "[duck_X509V3Extensions] authority_key_identifier must be of type String."
-    if not isinstance(subject_alternative_name, Missing):
-        assert isinstance(subject_alternative_name, str),\
-        "[duck_X509V3Extensions] subject_alternative_name must be of type String."
-    if not isinstance(issuer_alternative_name, Missing):
-        assert isinstance(issuer_alternative_name, str),\
-        "[duck_X509V3Extensions] issuer_alternative_name must be of type String."
-    if not isinstance(subject_directory_attributes, Missing):
-        assert isinstance(subject_directory_attributes, str),\
-        "[duck_X509V3Extensions] subject_directory_attributes must be of type String."
-    if not isinstance(crl_distribution_points, Missing):
-        assert isinstance(crl_distribution_points, str),\
-        "[duck_X509V3Extensions] crl_distribution_points must be of type String."
-    if not isinstance(inhibit_any_policy, Missing):
-        assert isinstance(inhibit_any_policy, str),\
-        "[duck_X509V3Extensions] inhibit_any_policy must be of type String."
-    if not isinstance(private_key_usage_period_not_before, Missing):
-        assert isinstance(private_key_usage_period_not_before, datetime.datetime),\
-        "[duck_X509V3Extensions] private_key_usage_period_not_before must be of type Datetime."
-    if not isinstance(private_key_usage_period_not_after, Missing):
-        assert isinstance(private_key_usage_period_not_after, datetime.datetime),\
-        "[duck_X509V3Extensions] private_key_usage_period_not_after must be of type Datetime."
-    if not isinstance(certificate_policies, Missing):
-        assert isinstance(certificate_policies, str),\
-        "[duck_X509V3Extensions] certificate_policies must be of type String."
-    if not isinstance(policy_mappings, Missing):
-        assert isinstance(policy_mappings, str),\
-        "[duck_X509V3Extensions] policy_mappings must be of type String."
-
-    return uco_document.create_DuckObject('X509V3Extensions', BasicConstraints=basic_constraints,
-                                          NameConstraints=name_constraints, PolicyConstraints=policy_constraints,
-                                          KeyUsage=key_usage, ExtendedKeyUsage=extended_key_usage,
-                                          SubjectKeyIdentifier=subject_key_identifier,
-                                          AuthorityKeyIdentifier=authority_key_identifier,
-                                          SubjectAlternativeName=subject_alternative_name,
-                                          IssuerAlternativeName=issuer_alternative_name,
-                                          SubjectDirectoryAttributes=subject_alternative_name,
-                                          CRLDistributionPoints=crl_distribution_points,
-                                          InhibitAnyPolicy=inhibit_any_policy,
-                                          PrivateKeyUsagePeriodNotBefore=private_key_usage_period_not_before,
-                                          PrivateKeyUsagePeriodNotAfter=private_key_usage_period_not_after,
-                                          CertificatePolicies=certificate_policies,
-                                          PolicyMappings=policy_mappings)
+
+    if _VALIDATE:
+        if basic_constraints is not _MISSING:
+            assert (type(basic_constraints) is str or isinstance(basic_constraints, str)),\
+            "[duck_X509V3Extensions] basic_constraints must be of type String."
+        if name_constraints is not _MISSING:
+            assert (type(name_constraints) is str or isinstance(name_constraints, str)),\
+            "[duck_X509V3Extensions] name_constraints must be of type String."
+        if policy_constraints is not _MISSING:
+            assert (type(policy_constraints) is str or isinstance(policy_constraints, str)),\
+            "[duck_X509V3Extensions] policy_constraints must be of type String."
+        if key_usage is not _MISSING:
+            assert (type(key_usage) is str or isinstance(key_usage, str)),\
+            "[duck_X509V3Extensions] key_usage must be of type String."
+        if extended_key_usage is not _MISSING:
+            assert (type(extended_key_usage) is str or isinstance(extended_key_usage, str)),\
+            "[duck_X509V3Extensions] extended_key_usage must be of type String."
+        if subject_key_identifier is not _MISSING:
+            assert (type(subject_key_identifier) is str or isinstance(subject_key_identifier, str)),\
+            "[duck_X509V3Extensions] subject_key_identifier must be of type String."
+        if authority_key_identifier is not _MISSING:
+            assert (type(authority_key_identifier) is str or isinstance(authority_key_identifier, str)),\
+            "[duck_X509V3Extensions] authority_key_identifier must be of type String."
+        if subject_alternative_name is not _MISSING:
+            assert (type(subject_alternative_name) is str or isinstance(subject_alternative_name, str)),\
+            "[duck_X509V3Extensions] subject_alternative_name must be of type String."
+        if issuer_alternative_name is not _MISSING:
+            assert (type(issuer_alternative_name) is str or isinstance(issuer_alternative_name, str)),\
+            "[duck_X509V3Extensions] issuer_alternative_name must be of type String."
+        if subject_directory_attributes is not _MISSING:
+            assert (type(subject_directory_attributes) is str or isinstance(subject_directory_attributes, str)),\
+            "[duck_X509V3Extensions] subject_directory_attributes must be of type String."
+        if crl_distribution_points is not _MISSING:
+            assert (type(crl_distribution_points) is str or isinstance(crl_distribution_points, str)),\
+            "[duck_X509V3Extensions] crl_distribution_points must be of type String."
+        if inhibit_any_policy is not _MISSING:
+            assert (type(inhibit_any_policy) is str or isinstance(inhibit_any_policy, str)),\
+            "[duck_X509V3Extensions] inhibit_any_policy must be of type String."
+        if private_key_usage_period_not_before is not _MISSING:
+            assert (type(private_key_usage_period_not_before) is _datetime or isinstance(private_key_usage_period_not_before, _datetime)),\
+            "[duck_X509V3Extensions] private_key_usage_period_not_before must be of type Datetime."
+        if private_key_usage_period_not_after is not _MISSING:
+            assert (type(private_key_usage_period_not_after) is _datetime or isinstance(private_key_usage_period_not_after, _datetime)),\
+            "[duck_X509V3Extensions] private_key_usage_period_not_after must be of type Datetime."
+        if certificate_policies is not _MISSING:
+            assert (type(certificate_policies) is str or isinstance(certificate_policies, str)),\
+            "[duck_X509V3Extensions] certificate_policies must be of type String."
+        if policy_mappings is not _MISSING:
+            assert (type(policy_mappings) is str or isinstance(policy_mappings, str)),\
+            "[duck_X509V3Extensions] policy_mappings must be of type String."
+
+    properties = _present(BasicConstraints=basic_constraints, NameConstraints=name_constraints,
+                          PolicyConstraints=policy_constraints, KeyUsage=key_usage,
+                          ExtendedKeyUsage=extended_key_usage, SubjectKeyIdentifier=subject_key_identifier,
+                          AuthorityKeyIdentifier=authority_key_identifier,
+                          SubjectAlternativeName=subject_alternative_name,
+                          IssuerAlternativeName=issuer_alternative_name,
+                          SubjectDirectoryAttributes=subject_alternative_name,
+                          CRLDistributionPoints=crl_distribution_points, InhibitAnyPolicy=inhibit_any_policy,
+                          PrivateKeyUsagePeriodNotBefore=private_key_usage_period_not_before,
+                          PrivateKeyUsagePeriodNotAfter=private_key_usage_period_not_after,
+                          CertificatePolicies=certificate_policies, PolicyMappings=policy_mappings)
+    return uco_document.create_DuckObject('X509V3Extensions', **properties)
 
 
 #====================================================
@@ -5016,9 +5039,10 @@ def duck_sub_ArrayOfAction(uco_document, duck_object):
     :return: A SubObject object.
     '''
 
-    assert (isinstance(duck_object, case.DuckObject) and (duck_object.type=='ArrayOfObject')),\
-    "[duck_sub_ArrayOfAction] duck_object must be of type ArrayOfObject."
-    
+    if _VALIDATE:
+        _check_instance_of(duck_object, _DuckObject, _TAG_ARRAY_OF_OBJECT,
+                           "[duck_sub_ArrayOfAction] duck_object must be of type ArrayOfObject.")
+
     #TODO:NothingElseToCheck
 
     return uco_document.create_SubObject('ArrayOfAction')
@@ -5029,3 +5053,82 @@ def duck_sub_ArrayOfAction(uco_document, duck_object):
 
     # URI, HexBinary, CyberAction, StructureText
 
+
+def _require(value, message):
+    # type: (object, str) -> None
+    '''
+    Checks that a required parameter was supplied. This is raised explicitly rather than asserted so
+    that required parameters are still enforced when Python runs with -O.
+    :param value: The parameter value being checked.
+    :param message: The assert output to raise on failure.
+    '''
+
+    if value is _MISSING:
+        raise AssertionError(message)
+
+
+def _check_instance_of(value, cls, type_tag, message):
+    # type: (object, type, object, str) -> None
+    '''
+    Checks that value is an instance of cls and, when type_tag is given, of that CASE type.
+    :param value: The parameter value being checked.
+    :param cls: The class value must be an instance of.
+    :param type_tag: The CASE type value must have, or None to skip the type comparison.
+    :param message: The assert output to raise on failure.
+    '''
+
+    if not isinstance(value, cls) or (type_tag is not None and value.type is not type_tag and value.type != type_tag):
+        raise AssertionError(message)
+
+
+def _is_integer(value):
+    # type: (object) -> bool
+    '''
+    Tells whether value is an int (or a long on Python 2), or a subclass of one.
+    Bools are not integers here.
+    '''
+
+    return type(value) in _INTEGER_TYPES or (isinstance(value, _INTEGER_TYPES) and type(value) is not bool)
+
+
+def _is_positive_integer(value):
+    # type: (object) -> bool
+    '''
+    Tells whether value is an integer, as _is_integer defines it, greater than zero.
+    '''
+
+    return _is_integer(value) and value > 0
+
+
+def _check_list_of(values, cls, type_tag, message):
+    # type: (object, type, object, str) -> None
+    '''
+    Checks that values is a list whose items are all instances of cls and, when type_tag is given,
+    all of that CASE type.
+    :param values: The parameter value being checked.
+    :param cls: The class every item must be an instance of.
+    :param type_tag: The CASE type every item must have, or None to skip the type comparison.
+    :param message: The assert output to raise on failure.
+    '''
+
+    if not (type(values) is list or isinstance(values, list)):
+        raise AssertionError(message)
+
+    if type_tag is None:
+        valid = all(map(cls.__instancecheck__, values))
+    else:
+        valid = all((isinstance(i, cls) and (i.type is type_tag or i.type == type_tag)) for i in values)
+    if not valid:
+        raise AssertionError(message)
+
+
+def _check_list_of_integers(values, message):
+    # type: (object, str) -> None
+    '''
+    Checks that values is a list whose items are all integers, as _is_integer defines them.
+    :param values: The parameter value being checked.
+    :param message: The assert output to raise on failure.
+    '''
+
+    if not (type(values) is list or isinstance(values, list)) or not all(map(_is_integer, values)):
+        raise AssertionError(message)
@@ -10,6 +10,7 @@
 #!/usr/bin/env python
 
 import datetime
+import sys
 import uuid
 
 import rdflib
@@ -17,6 +18,18 @@ from rdflib import RDF
 
 CASE = rdflib.Namespace('http://case.example.org/core#')
 
+try:
+    _intern = sys.intern
+except AttributeError:
+    _intern = intern  # Python 2
+
+
+def _intern_type(rdf_type):
+    """Interns plain string types so the NLG can compare an object's type by identity."""
+    if type(rdf_type) is str:
+        return _intern(rdf_type)
+    return rdf_type
+
 
 #====================================================
 #-- CREATE A CASE DOCUMENT FOR A SINGLE REPORT
@@ -236,7 +249,7 @@ class CoreObject(Node):
             (More properties can be set after initialization by using the add() function.)
         """
 
-        self.type = rdf_type
+        self.type = _intern_type(rdf_type)
 
         super(CoreObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
         self.add('CoreObjectCreationTime', datetime.datetime.utcnow())
@@ -276,7 +289,7 @@ class PropertyBundle(Node):
             (More properties can be set after initialization by using the add() function.)
         """
 
-        self.type = rdf_type
+        self.type = _intern_type(rdf_type)
 
         # Property bundles should be blank nodes because we should be referencing them
         # through CoreObjects.
@@ -302,7 +315,7 @@ class ContextObject(Node):
             (More properties can be set after initialization by using the add() function.)
         """
 
-        self.type = rdf_type
+        self.type = _intern_type(rdf_type)
 
         super(ContextObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
         self.add('ContextObjectCreationTime', datetime.datetime.utcnow())
@@ -324,7 +337,7 @@ class DuckObject(Node):
             (More properties can be set after initialization by using the add() function.)
         """
 
-        self.type = rdf_type
+        self.type = _intern_type(rdf_type)
 
         super(DuckObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
         self.add('DuckObjectCreationTime', datetime.datetime.utcnow())
@@ -346,7 +359,7 @@ class SubObject(Node):
             (More properties can be set after initialization by using the add() function.)
         """
 
-        self.type = rdf_type
+        self.type = _intern_type(rdf_type)
 
         super(SubObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
         self.add('SubObjectCreationTime', datetime.datetime.utcnow())